@@ -0,0 +1,39 @@
+"""
+Gunicorn settings and hooks (loaded from the working directory).
+
+Workers and threads come from WEB_CONCURRENCY and WEB_THREADS, the same
+variables the app sizes its database pool from (src/utils/db_pool.py).
+"""
+
+import glob
+import os
+
+workers = int(os.environ.get('WEB_CONCURRENCY', '4'))
+threads = int(os.environ.get('WEB_THREADS', '1'))
+
+
+def on_starting(server):
+    """Start each run with no samples left over from earlier workers."""
+    path = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if path:
+        os.makedirs(path, exist_ok=True)
+        for stale in glob.glob(os.path.join(path, '*.db')):
+            os.remove(stale)
+
+
+def child_exit(server, worker):
+    """Drop the live gauges of a worker that exited."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def post_worker_init(worker):
+    """Open DB_POOL_WARMUP pooled connections before the worker takes traffic."""
+    app = worker.wsgi
+    connections = app.config.get('DB_POOL_WARMUP', 0) if hasattr(app, 'config') else 0
+    if connections:
+        from src.models.base import db
+        from src.utils.db_pool import warm_pool
+        with app.app_context():
+            warm_pool(db.engine, connections)
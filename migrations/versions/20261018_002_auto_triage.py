@@ -0,0 +1,30 @@
+"""Add background triage settings and suggestion fields
+
+Revision ID: 002_auto_triage
+Revises: 001_initial
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002_auto_triage'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('projects', sa.Column('auto_triage', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.add_column('projects', sa.Column('auto_triage_min_confidence', sa.String(length=10), nullable=True))
+    op.add_column('issues', sa.Column('suggested_priority', sa.String(length=20), nullable=True))
+    op.add_column('issues', sa.Column('suggestion_confidence', sa.String(length=10), nullable=True))
+
+
+def downgrade():
+    op.drop_column('issues', 'suggestion_confidence')
+    op.drop_column('issues', 'suggested_priority')
+    op.drop_column('projects', 'auto_triage_min_confidence')
+    op.drop_column('projects', 'auto_triage')
@@ -0,0 +1,24 @@
+"""Add per-user membership epoch for project role claims
+
+Revision ID: 004_membership_epoch
+Revises: 003_token_revocation
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004_membership_epoch'
+down_revision = '003_token_revocation'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('users', sa.Column('membership_epoch', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    op.drop_column('users', 'membership_epoch')
@@ -1,18 +1,33 @@
 """Application factory and configuration."""
 
 import os
+import time
+import click
 from flask import Flask
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
 from dotenv import load_dotenv
 
 from src.config import get_config
 from src.models.base import db
 from src.routes import register_blueprints
 from src.middleware import register_error_handlers
-from src.utils.logger import setup_logger, logger
+from src.middleware.rate_limiting import init_rate_limiting
+from src.middleware.admission import admission_control
+from src.utils.logger import REQUEST_ID_HEADER, current_request_id, parse_sample_rates, setup_logger, logger
+from src.utils.login_guard import login_guard
+from src.utils.password_hashing import password_hasher
+from src.utils.token_cache import token_cache
+from src.utils.sql_instrumentation import current_stats, sql_instrumentation
+from src.utils.metrics import request_metrics
+from src.utils.profiling import request_profiler
+from src.utils.server_timing import phase_timings, server_timing
+from src.utils.tracing import tracing
+from src.utils.readiness import readiness_monitor
+from src.utils.db_pool import engine_options
+from src.utils.deadlines import request_deadlines
+from src.services.revocation_service import revocation_store
+from src.repositories.user_repository import user_status_cache
 
 # Load environment variables
 load_dotenv()
@@ -41,9 +56,13 @@ def create_app(config_name: str = None) -> Flask:
     # Setup logging
     log_level = app.config.get('LOG_LEVEL', 'INFO')
     log_format = app.config.get('LOG_FORMAT', 'json')
-    setup_logger('issue_tracker', log_level, log_format)
+    setup_logger(
+        'issue_tracker', log_level, log_format,
+        sample_rates=parse_sample_rates(app.config.get('LOG_SAMPLE_RATES', '')),
+        queue_size=app.config.get('LOG_QUEUE_SIZE', 10000),
+    )
     
-    logger.info(f"Starting application in {config_name} mode")
+    logger.info("Starting application", extra={'config_name': config_name})
     
     # Initialize extensions
     initialize_extensions(app)
@@ -51,12 +70,22 @@ def create_app(config_name: str = None) -> Flask:
     # Register blueprints
     register_blueprints(app)
     
+    # Rate limiting, keyed by user (else IP) and weighted by each route's rate_cost;
+    # the sqlite:// storage scheme is registered by src.utils.rate_limit_storage
+    init_rate_limiting(app)
+    
     # Register error handlers
     register_error_handlers(app)
     
     # Add request/response hooks
     register_hooks(app)
     
+    # Time budgets; registered last so every other response hook sees their 504
+    request_deadlines.init_app(app)
+    
+    # Register CLI commands
+    create_cli_commands(app)
+    
     logger.info("Application initialized successfully")
     
     return app
@@ -69,11 +98,36 @@ def initialize_extensions(app: Flask) -> None:
     Args:
         app: Flask application instance
     """
-    # Database
+    # Database, with pool settings derived from the worker model
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config)
     db.init_app(app)
     
     # JWT
     jwt = JWTManager(app)
+    token_cache.init_app(app)
+    revocation_store.init_app(app)
+    user_status_cache.init_app(app)
+    sql_instrumentation.init_app(app)
+    request_metrics.init_app(app)
+    request_profiler.init_app(app)
+    server_timing.init_app(app)
+    tracing.init_app(app)
+    readiness_monitor.init_app(app)
+    admission_control.init_app(app)
+    
+    @jwt.token_in_blocklist_loader
+    def token_in_blocklist_callback(jwt_header, jwt_payload):
+        return revocation_store.is_revoked(jwt_payload)
+    
+    @jwt.additional_claims_loader
+    def issued_at_claims(identity):
+        # Sub-second iat (a valid NumericDate), so a token issued right after
+        # revoke_all is not mistaken for one from the same second before it
+        return {'iat': time.time()}
+    
+    # Password hashing pool and login throttling
+    password_hasher.init_app(app)
+    login_guard.init_app(app)
     
     # CORS
     cors_origins = app.config['CORS_ORIGINS']
@@ -89,19 +143,6 @@ def initialize_extensions(app: Flask) -> None:
             supports_credentials=app.config.get('CORS_SUPPORTS_CREDENTIALS', True)
         )
     
-    # Rate limiting
-    if app.config.get('RATELIMIT_ENABLED', True):
-        limiter = Limiter(
-            app=app,
-            key_func=get_remote_address,
-            default_limits=[app.config.get('RATELIMIT_DEFAULT', '100 per minute')],
-            storage_uri=app.config.get('RATELIMIT_STORAGE_URL', 'memory://'),
-            headers_enabled=app.config.get('RATELIMIT_HEADERS_ENABLED', True)
-        )
-        
-        # Store limiter in app for access in routes if needed
-        app.limiter = limiter
-    
     # JWT error handlers
     @jwt.expired_token_loader
     def expired_token_callback(jwt_header, jwt_payload):
@@ -153,7 +194,8 @@ def register_hooks(app: Flask) -> None:
     def before_request():
         """Log incoming requests."""
         from flask import request
-        logger.debug(f"{request.method} {request.path}")
+        request.environ['issue_tracker.started'] = time.perf_counter()
+        logger.debug("%s %s", request.method, request.path)
     
     @app.after_request
     def after_request(response):
@@ -161,6 +203,31 @@ def register_hooks(app: Flask) -> None:
         response.headers['X-Content-Type-Options'] = 'nosniff'
         response.headers['X-Frame-Options'] = 'DENY'
         response.headers['X-XSS-Protection'] = '1; mode=block'
+        response.headers[REQUEST_ID_HEADER] = current_request_id()
+        return response
+    
+    # Separate logger so the hot access log can be sampled (LOG_SAMPLE_RATES)
+    access_logger = logger.getChild('access')
+    
+    @app.after_request
+    def access_log(response):
+        """Write a structured access log line with the request's DB usage and phase timings."""
+        from flask import request
+        if not app.config.get('ACCESS_LOG_ENABLED', True):
+            return response
+        started = request.environ.get('issue_tracker.started')
+        fields = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 2) if started else None,
+        }
+        stats = current_stats()
+        if stats is not None:
+            fields.update(stats.to_dict())
+        for phase, seconds in phase_timings().items():
+            fields[f'{phase}_ms'] = round(seconds * 1000, 2)
+        access_logger.info("request", extra=fields)
         return response
     
     logger.info("Request/response hooks registered")
@@ -216,10 +283,155 @@ def create_cli_commands(app: Flask) -> None:
                 print(f"Error: {error}")
             else:
                 print(f"Admin user '{username}' created successfully")
+    
+    @app.cli.command('provision-users')
+    @click.argument('csv_file', type=click.Path(exists=True, dir_okay=False))
+    def provision_users(csv_file):
+        """Register users from a CSV with username,email,password[,role] columns."""
+        import csv
+        from marshmallow import ValidationError
+        from src.schemas import UserRegistrationSchema
+        from src.services import AuthService
+        
+        schema = UserRegistrationSchema()
+        entries = []
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                row = {key: value for key, value in row.items() if value}
+                try:
+                    entries.append(schema.load(row))
+                except ValidationError as e:
+                    print(f"line {line}: invalid: {e.messages}")
+        
+        results, error = AuthService().provision_users(entries) if entries else ([], None)
+        if error:
+            print(f"Error: {error}")
+            raise SystemExit(1)
+        
+        for result in results:
+            if result['error']:
+                print(f"{result['username']}: {result['error']}")
+        created = sum(1 for result in results if result['error'] is None)
+        print(f"Provisioned {created} of {len(results)} valid users")
+    
+    @app.cli.command('eval-compaction')
+    @click.option('--dataset', default=None, help='Golden dataset path')
+    @click.option('--config', default=None, help='Eval config with regression thresholds')
+    def eval_compaction(dataset, config):
+        """Check that prompt compaction does not regress golden-set accuracy."""
+        from src.evals import compare_compaction, load_golden_cases, load_regression_thresholds
+        
+        cases = load_golden_cases(dataset)
+        thresholds = load_regression_thresholds(config)
+        report = compare_compaction(cases, thresholds)
+        
+        for name in ('baseline', 'compacted'):
+            result = report[name]
+            accuracy = ' '.join(f"{field}={value:.2f}" for field, value in result['accuracy'].items())
+            print(f"{name}: {accuracy} errors={result['errors']} tokens_saved={result['tokens_saved']}")
+        
+        failed = not report['passed'] or report['baseline']['errors'] or report['compacted']['errors']
+        print("FAIL" if failed else "PASS")
+        if failed:
+            raise SystemExit(1)
+    
+    @app.cli.command('purge-revoked-tokens')
+    def purge_revoked_tokens():
+        """Delete revocation records of tokens that have already expired."""
+        from src.repositories import RevokedTokenRepository
+        deleted = RevokedTokenRepository().purge_expired()
+        print(f"Purged {deleted} expired revoked tokens")
+    
+    @app.cli.command('bench-suggest')
+    @click.option('--backend', type=click.Choice(['stub', 'live']), default='stub', show_default=True)
+    @click.option('--concurrency', default=4, show_default=True, help='Parallel requests')
+    @click.option('--repeat', default=5, show_default=True, help='Times each golden case is sent')
+    @click.option('--latency-ms', default=50.0, show_default=True, help='Stub base latency')
+    @click.option('--jitter-ms', default=20.0, show_default=True, help='Stub latency jitter')
+    @click.option('--failure-rate', default=0.0, show_default=True, help='Stub fraction of 500 responses')
+    @click.option('--slow-rate', default=0.0, show_default=True, help='Stub fraction of slow responses')
+    @click.option('--slow-ms', default=2000.0, show_default=True, help='Extra latency of slow responses')
+    @click.option('--error-rate', default=0.0, show_default=True, help='Stub fraction of wrong priorities')
+    @click.option('--seed', default=0, show_default=True, help='Stub random seed')
+    @click.option('--dataset', default=None, help='Golden dataset path')
+    @click.option('--config', default=None, help='Eval config with regression thresholds')
+    @click.option('--baseline', default=None, help='JSON report of a reference run')
+    @click.option('--output', default=None, help='Write the JSON report to this file')
+    def bench_suggest(backend, concurrency, repeat, latency_ms, jitter_ms, failure_rate,
+                      slow_rate, slow_ms, error_rate, seed, dataset, config, baseline, output):
+        """Benchmark classifier latency and accuracy over the golden dataset."""
+        import json
+        from src.evals import load_golden_cases, load_regression_thresholds, run_benchmark
+        
+        reference = None
+        if baseline:
+            with open(baseline, encoding='utf-8') as f:
+                reference = json.load(f)['accuracy']
+        
+        report = run_benchmark(
+            load_golden_cases(dataset),
+            load_regression_thresholds(config),
+            backend=backend,
+            concurrency=concurrency,
+            repeat=repeat,
+            baseline=reference,
+            stub_options={
+                'latency_ms': latency_ms,
+                'jitter_ms': jitter_ms,
+                'failure_rate': failure_rate,
+                'slow_rate': slow_rate,
+                'slow_ms': slow_ms,
+                'error_rate': error_rate,
+                'seed': seed,
+            }
+        )
+        
+        latency = report['latency_ms']
+        print(f"backend={report['backend']} requests={report['requests']} errors={report['errors']} "
+              f"concurrency={report['concurrency']} throughput={report['throughput_rps']} req/s")
+        print(f"latency_ms p50={latency['p50']} p95={latency['p95']} p99={latency['p99']} max={latency['max']}")
+        for field, value in report['accuracy'].items():
+            print(f"accuracy {field}={value:.2f} regression={report['regression'].get(field, 0.0):.2f}")
+        print("PASS" if report['passed'] else "FAIL")
+        
+        if output:
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        if not report['passed']:
+            raise SystemExit(1)
+    
+    @app.cli.command('classify-backfill')
+    @click.option('--chunk-size', default=200, show_default=True, help='Issues read and written per chunk')
+    @click.option('--batch-size', default=5, show_default=True, help='Issues per LLM prompt')
+    @click.option('--concurrency', default=4, show_default=True, help='Maximum parallel LLM calls')
+    @click.option('--checkpoint', default='.classify_backfill.json', show_default=True, help='Checkpoint file')
+    @click.option('--limit', default=None, type=int, help='Stop after this many issues')
+    @click.option('--reset', is_flag=True, help='Ignore and overwrite an existing checkpoint')
+    def classify_backfill(chunk_size, batch_size, concurrency, checkpoint, limit, reset):
+        """Classify existing issues that have no suggested priority."""
+        from src.services.backfill_service import BackfillService
+        
+        if reset and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        
+        stats = BackfillService().run(
+            chunk_size=chunk_size,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            checkpoint_path=checkpoint,
+            limit=limit
+        )
+        print(
+            f"Processed {stats['processed']} issues ({stats['classified']} classified, "
+            f"{stats['failed']} failed) in {stats['prompts']} prompts, "
+            f"{stats['elapsed']:.1f}s, {stats['issues_per_second']:.2f} issues/s, "
+            f"last id {stats['last_id']}, {stats['pending_retry']} to retry on the next run"
+        )
+        if stats['stopped_early']:
+            print("Stopped early because the LLM provider is failing; rerun to resume")
 
 
 # For development
 if __name__ == '__main__':
     app = create_app()
-    create_cli_commands(app)
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -10,6 +10,7 @@ Environment variables are loaded from .env file.
 """
 
 import os
+import tempfile
 from datetime import timedelta
 from typing import Optional, Type
 
@@ -27,9 +28,19 @@ class Config:
     SQLALCHEMY_ENGINE_OPTIONS: dict = {
         "pool_pre_ping": True,
         "pool_recycle": 300,
-        "pool_size": 10,
-        "max_overflow": 20,
     }
+    
+    # Pool sizing (see src/utils/db_pool.py): derived per worker from the worker
+    # model unless DB_POOL_SIZE / DB_MAX_OVERFLOW are set
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "4"))
+    WEB_THREADS: int = int(os.getenv("WEB_THREADS", "1"))
+    DB_MAX_CONNECTIONS: Optional[int] = int(os.getenv("DB_MAX_CONNECTIONS", "0")) or None
+    DB_POOL_SIZE: Optional[int] = int(os.environ["DB_POOL_SIZE"]) if os.getenv("DB_POOL_SIZE") else None
+    DB_MAX_OVERFLOW: Optional[int] = int(os.environ["DB_MAX_OVERFLOW"]) if os.getenv("DB_MAX_OVERFLOW") else None
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    DB_POOL_WARMUP: int = int(os.getenv("DB_POOL_WARMUP", "1"))
+    # Behind a transaction-mode PgBouncer: no local pool, no prepared statements
+    DB_PGBOUNCER: bool = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
 
     # JWT
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "jwt-secret-key-change-in-production")
@@ -42,9 +53,37 @@ class Config:
     JWT_TOKEN_LOCATION: list = ["headers"]
     JWT_HEADER_NAME: str = "Authorization"
     JWT_HEADER_TYPE: str = "Bearer"
+    JWT_VERIFY_CACHE_ENABLED: bool = os.getenv("JWT_VERIFY_CACHE_ENABLED", "true").lower() == "true"
+    JWT_VERIFY_CACHE_SIZE: int = int(os.getenv("JWT_VERIFY_CACHE_SIZE", "1024"))
+    # Embed project -> role map in access tokens (digest above JWT_PROJECT_CLAIMS_MAX projects)
+    JWT_PROJECT_CLAIMS: bool = os.getenv("JWT_PROJECT_CLAIMS", "false").lower() == "true"
+    JWT_PROJECT_CLAIMS_MAX: int = int(os.getenv("JWT_PROJECT_CLAIMS_MAX", "50"))
+    
+    # Token revocation (seconds between blocklist syncs per worker)
+    REVOCATION_SYNC_INTERVAL: float = float(os.getenv("REVOCATION_SYNC_INTERVAL", "30"))
+    REVOCATION_BLOOM_CAPACITY: int = int(os.getenv("REVOCATION_BLOOM_CAPACITY", "100000"))
+    REVOCATION_BLOOM_ERROR_RATE: float = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", "0.001"))
+    
+    # Per-worker cache of user active flag/role/watermark (seconds; 0 disables)
+    USER_STATUS_CACHE_TTL: float = float(os.getenv("USER_STATUS_CACHE_TTL", "30"))
+    USER_STATUS_CACHE_SIZE: int = int(os.getenv("USER_STATUS_CACHE_SIZE", "10000"))
 
     # Security
     BCRYPT_LOG_ROUNDS: int = int(os.getenv("BCRYPT_LOG_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))  # 0 = inline
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))
+    PASSWORD_HASH_TIMEOUT: float = float(os.getenv("PASSWORD_HASH_TIMEOUT", "5"))
+    PASSWORD_HASH_BULK_WORKERS: int = int(os.getenv("PASSWORD_HASH_BULK_WORKERS", "0"))  # 0 = CPU count
+    BULK_PROVISION_MAX_USERS: int = int(os.getenv("BULK_PROVISION_MAX_USERS", "500"))
+    
+    # Login throttling (failed attempts per sliding window)
+    LOGIN_GUARD_ENABLED: bool = os.getenv("LOGIN_GUARD_ENABLED", "true").lower() == "true"
+    LOGIN_MAX_FAILURES_PER_USER: int = int(os.getenv("LOGIN_MAX_FAILURES_PER_USER", "5"))
+    LOGIN_MAX_FAILURES_PER_IP: int = int(os.getenv("LOGIN_MAX_FAILURES_PER_IP", "50"))
+    LOGIN_FAILURE_WINDOW: float = float(os.getenv("LOGIN_FAILURE_WINDOW", "300"))
+    LOGIN_BACKOFF_BASE: float = float(os.getenv("LOGIN_BACKOFF_BASE", "1"))
+    LOGIN_BACKOFF_MAX: float = float(os.getenv("LOGIN_BACKOFF_MAX", "900"))
+    LOGIN_GUARD_MAX_ENTRIES: int = int(os.getenv("LOGIN_GUARD_MAX_ENTRIES", "10000"))
     
     # CORS
     CORS_ORIGINS: str = os.getenv("CORS_ORIGINS", "*")
@@ -54,13 +93,90 @@ class Config:
 
     # Rate Limiting
     RATELIMIT_ENABLED: bool = os.getenv("RATELIMIT_ENABLED", "true").lower() == "true"
-    RATELIMIT_STORAGE_URL: str = "memory://"
+    # sqlite:// is a host-local file shared by all workers (src/utils/rate_limit_storage.py)
+    RATELIMIT_STORAGE_URL: str = os.getenv(
+        "RATELIMIT_STORAGE_URL",
+        f"sqlite:///{os.path.join(tempfile.gettempdir(), 'issue-tracker-ratelimit.db')}"
+    )
     RATELIMIT_DEFAULT: str = os.getenv("RATELIMIT_DEFAULT", "100 per minute")
     RATELIMIT_HEADERS_ENABLED: bool = True
+    # Shared per-user budgets for expensive endpoint classes (see rate_cost on routes)
+    RATELIMIT_CLASSES: dict = {
+        'llm': os.getenv("RATELIMIT_LLM", "20 per minute"),
+        'search': os.getenv("RATELIMIT_SEARCH", "60 per minute"),
+        'export': os.getenv("RATELIMIT_EXPORT", "10 per minute"),
+        'bulk': os.getenv("RATELIMIT_BULK", "5 per minute"),
+    }
 
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")
+    ACCESS_LOG_ENABLED: bool = os.getenv("ACCESS_LOG_ENABLED", "true").lower() == "true"
+    # Fraction of sub-WARNING records kept per logger, e.g. "issue_tracker.access=0.1"
+    LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "")
+    # Records buffered for the background writer before new ones are dropped
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    
+    # Prometheus /metrics (set PROMETHEUS_MULTIPROC_DIR under gunicorn; optional bearer token)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_TOKEN: Optional[str] = os.getenv("METRICS_TOKEN") or None
+    
+    # OpenTelemetry tracing (exporter: console, file, otlp or none; OTLP reads OTEL_EXPORTER_OTLP_*)
+    TRACING_ENABLED: bool = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+    TRACING_EXPORTER: str = os.getenv("TRACING_EXPORTER", "console")
+    TRACING_FILE: str = os.getenv("TRACING_FILE", "traces.jsonl")
+    TRACING_SAMPLE_RATIO: float = float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))
+    
+    # Server-Timing phases (auth, serialize, json, llm) in responses and the access log
+    SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+    
+    # On-demand request profiling for admins (disabled unless PROFILING_SECRET is set)
+    PROFILING_SECRET: Optional[str] = os.getenv("PROFILING_SECRET") or None
+    PROFILING_DIR: Optional[str] = os.getenv("PROFILING_DIR") or None
+    PROFILING_INTERVAL_MS: float = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+    PROFILING_MAX_SECONDS: float = float(os.getenv("PROFILING_MAX_SECONDS", "60"))
+    PROFILING_MAX_FILES: int = int(os.getenv("PROFILING_MAX_FILES", "200"))
+    
+    # SQL instrumentation (X-DB-Queries / Server-Timing headers, N+1 warnings)
+    SQL_INSTRUMENTATION_ENABLED: bool = os.getenv("SQL_INSTRUMENTATION_ENABLED", "true").lower() == "true"
+    SQL_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+    
+    # Slow-query log (0 disables); a sample of slow SELECTs is EXPLAINed in the background
+    SQL_SLOW_QUERY_MS: float = float(os.getenv("SQL_SLOW_QUERY_MS", "250"))
+    SQL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = float(os.getenv("SQL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE", "0.1"))
+    SQL_SLOW_QUERY_EXPLAIN_INTERVAL: int = int(os.getenv("SQL_SLOW_QUERY_EXPLAIN_INTERVAL", "300"))
+    SQL_SLOW_QUERY_EXPLAIN_TIMEOUT_MS: int = int(os.getenv("SQL_SLOW_QUERY_EXPLAIN_TIMEOUT_MS", "5000"))
+    SQL_SLOW_QUERY_REDACT: list = os.getenv(
+        "SQL_SLOW_QUERY_REDACT", "password,token,secret,email,jti,hash"
+    ).split(",")
+
+    # Readiness probe: cached report TTL, how long a saturated pool is tolerated
+    # and how long it must stay below capacity before saturation ends
+    READINESS_TTL: float = float(os.getenv("READINESS_TTL", "5"))
+    READINESS_SATURATION_SECONDS: float = float(os.getenv("READINESS_SATURATION_SECONDS", "30"))
+    READINESS_RELEASE_SECONDS: float = float(os.getenv("READINESS_RELEASE_SECONDS", "1"))
+
+    # Admission control (see src/middleware/admission.py); it only sheds with
+    # WEB_THREADS > 1, so unless set it is enabled exactly then. The in-flight
+    # limit defaults to WEB_THREADS capped by the pool size
+    ADMISSION_ENABLED: Optional[bool] = (
+        os.getenv("ADMISSION_ENABLED").lower() == "true" if os.getenv("ADMISSION_ENABLED") else None
+    )
+    ADMISSION_MAX_IN_FLIGHT: Optional[int] = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "0")) or None
+    ADMISSION_RESERVED_FRACTION: float = float(os.getenv("ADMISSION_RESERVED_FRACTION", "0.25"))
+    ADMISSION_POOL_WAIT_MS: float = float(os.getenv("ADMISSION_POOL_WAIT_MS", "100"))
+    ADMISSION_RETRY_AFTER: int = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+
+    # Time budgets in seconds per expensive-endpoint class (the limit_class
+    # of rate_cost), enforced on SQL statements and the LLM call
+    TIME_BUDGETS_ENABLED: bool = os.getenv("TIME_BUDGETS_ENABLED", "true").lower() == "true"
+    TIME_BUDGETS: dict = {
+        'default': float(os.getenv("TIME_BUDGET_DEFAULT", "10")),
+        'search': float(os.getenv("TIME_BUDGET_SEARCH", "5")),
+        'llm': float(os.getenv("TIME_BUDGET_LLM", "15")),
+        'export': float(os.getenv("TIME_BUDGET_EXPORT", "30")),
+        'bulk': float(os.getenv("TIME_BUDGET_BULK", "60")),
+    }
 
     # Pagination
     DEFAULT_PAGE_SIZE: int = int(os.getenv("DEFAULT_PAGE_SIZE", "20"))
@@ -116,6 +232,19 @@ class TestingConfig(Config):
     
     # Faster password hashing for tests
     BCRYPT_LOG_ROUNDS: int = 4
+    PASSWORD_HASH_WORKERS: int = 0
+    
+    # Tests recreate the database per test, so always read revocation state
+    REVOCATION_SYNC_INTERVAL: float = 0
+    
+    # Check readiness on every probe; tests recreate the database per test
+    READINESS_TTL: float = 0
+    
+    # Exercise admission control on the single-threaded test app
+    ADMISSION_ENABLED: Optional[bool] = True
+    
+    # The in-memory database shares one connection; never EXPLAIN from another thread
+    SQL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.0
     
     # Short token expiry for tests
     JWT_ACCESS_TOKEN_EXPIRES: timedelta = timedelta(minutes=5)
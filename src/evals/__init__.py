@@ -0,0 +1,23 @@
+"""Offline evaluation helpers for the issue classifier."""
+
+from .golden import (
+    load_golden_cases,
+    load_regression_thresholds,
+    score_predictions,
+    evaluate_service,
+    compare_compaction,
+)
+from .stub_server import StubLLMServer
+from .benchmark import run_benchmark, run_cases, percentile
+
+__all__ = [
+    'load_golden_cases',
+    'load_regression_thresholds',
+    'score_predictions',
+    'evaluate_service',
+    'compare_compaction',
+    'StubLLMServer',
+    'run_benchmark',
+    'run_cases',
+    'percentile',
+]
@@ -0,0 +1,190 @@
+"""Concurrent latency and accuracy benchmark for SuggestService."""
+
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.evals.golden import score_predictions
+from src.evals.stub_server import StubLLMServer, label_map
+from src.utils.resilience import CircuitBreaker
+
+BACKENDS = ('stub', 'live')
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Samples
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Percentile value, 0.0 for no samples
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@contextmanager
+def _patched_env(**values: str) -> Iterator[None]:
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+@contextmanager
+def stub_backend(stub: StubLLMServer) -> Iterator[StubLLMServer]:
+    """Run a stub server and point SuggestService at it for the duration."""
+    with stub, _patched_env(OPENAI_API_KEY='stub-key', OPENAI_BASE_URL=stub.base_url):
+        yield stub
+
+
+def run_cases(
+    cases: List[Dict[str, Any]],
+    concurrency: int = 4,
+    repeat: int = 1
+) -> Dict[str, Any]:
+    """
+    Run SuggestService over cases concurrently against the configured backend.
+
+    A fresh circuit breaker is used so earlier runs cannot short-circuit this
+    one, and the provider client is built before timing starts.
+
+    Args:
+        cases: Golden cases
+        concurrency: Parallel requests
+        repeat: Times each case is sent
+
+    Returns:
+        Report with latency percentiles (ms), throughput, accuracy and error rate
+    """
+    from src.services.suggest_service import SuggestService, llm_client
+
+    service = SuggestService(breaker=CircuitBreaker())
+    # Import the SDK and build the shared client before timing starts
+    llm_client(
+        os.getenv("OPENAI_BASE_URL") or None,
+        os.getenv("OPENAI_API_KEY"),
+        float(os.getenv("SUGGEST_TIMEOUT", "10")),
+    )
+    workload = [case for _ in range(max(1, repeat)) for case in cases]
+
+    def timed(case: Dict[str, Any]):
+        started = time.perf_counter()
+        suggestion, error = service.suggest(
+            title=case['input']['title'],
+            description=case['input'].get('description'),
+        )
+        return (time.perf_counter() - started) * 1000, suggestion or {}, error
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        results = list(executor.map(timed, workload))
+    wall = time.perf_counter() - started
+
+    latencies = [latency for latency, _, _ in results]
+    predictions = [suggestion for _, suggestion, _ in results]
+    errors = sum(1 for _, _, error in results if error)
+
+    accuracy = score_predictions(workload, predictions)
+    accuracy['json_validity'] = (len(results) - errors) / len(results) if results else 0.0
+
+    return {
+        'requests': len(results),
+        'concurrency': concurrency,
+        'errors': errors,
+        'wall_seconds': round(wall, 3),
+        'throughput_rps': round(len(results) / wall, 2) if wall > 0 else 0.0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50), 2),
+            'p95': round(percentile(latencies, 95), 2),
+            'p99': round(percentile(latencies, 99), 2),
+            'max': round(max(latencies), 2) if latencies else 0.0,
+        },
+        'accuracy': accuracy,
+    }
+
+
+def check_thresholds(
+    accuracy: Dict[str, float],
+    thresholds: Dict[str, float],
+    baseline: Optional[Dict[str, float]] = None
+) -> Dict[str, Any]:
+    """
+    Compare accuracy with the allowed regression per field.
+
+    Without a baseline the reference is perfect accuracy, so each threshold
+    acts as a maximum error rate.
+
+    Args:
+        accuracy: Per-field accuracy of this run
+        thresholds: Allowed drop per field
+        baseline: Per-field accuracy of a reference run (optional)
+
+    Returns:
+        Dict with per-field 'regression' and boolean 'passed'
+    """
+    regression = {
+        field: round((baseline or {}).get(field, 1.0) - value, 4)
+        for field, value in accuracy.items()
+        if field in thresholds
+    }
+    return {
+        'regression': regression,
+        'passed': all(regression[field] <= thresholds[field] + 1e-9 for field in regression),
+    }
+
+
+def run_benchmark(
+    cases: List[Dict[str, Any]],
+    thresholds: Dict[str, float],
+    backend: str = 'stub',
+    concurrency: int = 4,
+    repeat: int = 1,
+    baseline: Optional[Dict[str, float]] = None,
+    stub_options: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Benchmark the classifier over golden cases.
+
+    Args:
+        cases: Golden cases
+        thresholds: Allowed accuracy drop per field
+        backend: 'stub' for a local StubLLMServer, 'live' for the configured provider
+        concurrency: Parallel requests
+        repeat: Times each case is sent
+        baseline: Reference accuracy per field (optional)
+        stub_options: Keyword arguments for StubLLMServer; the stub answers
+            with the cases' expected labels unless 'labels' is given
+
+    Returns:
+        Benchmark report including threshold verdict
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {', '.join(BACKENDS)}")
+
+    if backend == 'stub':
+        options = {'labels': label_map(cases), **(stub_options or {})}
+        with stub_backend(StubLLMServer(**options)) as stub:
+            report = run_cases(cases, concurrency=concurrency, repeat=repeat)
+            report['stub'] = {'calls': stub.calls, 'injected_failures': stub.failures}
+    else:
+        report = run_cases(cases, concurrency=concurrency, repeat=repeat)
+
+    report['backend'] = backend
+    report.update(check_thresholds(report['accuracy'], thresholds, baseline))
+    return report
@@ -0,0 +1,139 @@
+"""Golden dataset loading and accuracy scoring for the issue classifier."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_DATASET_PATH = ROOT_DIR / 'datasets' / 'issue_classifier_golden.yaml'
+DEFAULT_CONFIG_PATH = ROOT_DIR / 'configs' / 'issue_classifier.yaml'
+
+# Fields compared against the expected labels
+EVAL_FIELDS = ('priority', 'status')
+
+
+def load_golden_cases(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Load the cases of a golden dataset.
+
+    Args:
+        path: Dataset path (default: datasets/issue_classifier_golden.yaml)
+
+    Returns:
+        List of cases with 'id', 'input' and 'expected' keys
+    """
+    with open(path or DEFAULT_DATASET_PATH, encoding='utf-8') as f:
+        return yaml.safe_load(f)['cases']
+
+
+def load_regression_thresholds(path: Optional[str] = None) -> Dict[str, float]:
+    """
+    Load allowed accuracy drops from the eval config.
+
+    Args:
+        path: Config path (default: configs/issue_classifier.yaml)
+
+    Returns:
+        Mapping of field name (and 'json_validity') to maximum allowed drop
+    """
+    with open(path or DEFAULT_CONFIG_PATH, encoding='utf-8') as f:
+        thresholds = yaml.safe_load(f).get('regression', {}).get('thresholds', {})
+    result = {
+        field: float(thresholds.get(f'field_match_{field}', 0.0))
+        for field in EVAL_FIELDS
+    }
+    result['json_validity'] = float(thresholds.get('json_validity', 0.0))
+    return result
+
+
+def score_predictions(
+    cases: List[Dict[str, Any]],
+    predictions: List[Dict[str, Any]]
+) -> Dict[str, float]:
+    """
+    Compute per-field accuracy of predictions against expected labels.
+
+    Args:
+        cases: Golden cases
+        predictions: Suggestion dicts in the same order (empty on error)
+
+    Returns:
+        Mapping of field name to accuracy in [0, 1]
+    """
+    if not cases:
+        return {field: 0.0 for field in EVAL_FIELDS}
+    return {
+        field: sum(
+            1 for case, prediction in zip(cases, predictions)
+            if prediction.get(field) == case['expected'].get(field)
+        ) / len(cases)
+        for field in EVAL_FIELDS
+    }
+
+
+def evaluate_service(service, cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run a SuggestService over golden cases sequentially.
+
+    Args:
+        service: SuggestService instance
+        cases: Golden cases
+
+    Returns:
+        Dict with per-field 'accuracy', 'errors' count and 'tokens_saved'
+    """
+    predictions = []
+    errors = 0
+    tokens_saved = 0
+    for case in cases:
+        service.last_compaction = None
+        suggestion, error = service.suggest(
+            title=case['input']['title'],
+            description=case['input'].get('description'),
+        )
+        if error:
+            errors += 1
+        if service.last_compaction is not None:
+            tokens_saved += service.last_compaction.tokens_saved
+        predictions.append(suggestion or {})
+
+    return {
+        'accuracy': score_predictions(cases, predictions),
+        'errors': errors,
+        'tokens_saved': tokens_saved,
+    }
+
+
+def compare_compaction(
+    cases: List[Dict[str, Any]],
+    thresholds: Dict[str, float]
+) -> Dict[str, Any]:
+    """
+    Check that prompt compaction does not regress golden-set accuracy.
+
+    Args:
+        cases: Golden cases
+        thresholds: Allowed accuracy drop per field
+
+    Returns:
+        Dict with 'baseline' and 'compacted' results, per-field 'regression'
+        and a boolean 'passed'
+    """
+    from src.services.suggest_service import SuggestService
+
+    baseline = evaluate_service(SuggestService(compaction=False), cases)
+    compacted = evaluate_service(SuggestService(compaction=True), cases)
+
+    regression = {
+        field: baseline['accuracy'][field] - compacted['accuracy'][field]
+        for field in EVAL_FIELDS
+    }
+    passed = all(regression[field] <= thresholds.get(field, 0.0) for field in EVAL_FIELDS)
+
+    return {
+        'baseline': baseline,
+        'compacted': compacted,
+        'regression': regression,
+        'passed': passed,
+    }
@@ -0,0 +1,213 @@
+"""Deterministic OpenAI-compatible stub server for offline evals and benchmarks."""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+_ITEM_RE = re.compile(
+    r'(?:Issue id: (?P<id>\d+)\n)?Issue title: (?P<title>[^\n]*)\nIssue description: (?P<description>.*?)(?=\n\nIssue id: |\n\nRespond ONLY|\Z)',
+    re.DOTALL,
+)
+
+PRIORITIES = ('critical', 'high', 'medium', 'low')
+DEFAULT_LABEL = {'priority': 'medium', 'status': 'open'}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Chat completions handler answering from the stub's label map."""
+
+    # Keep-alive, so benchmarks measure the client rather than TCP setup. Headers
+    # and body go out in separate writes, so Nagle would add a delayed-ACK stall.
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        stub: 'StubLLMServer' = self.server.stub
+        payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        prompt = payload.get('messages', [{}])[-1].get('content', '')
+        rng = stub.request_rng(prompt)
+
+        delay = stub.latency_ms + rng.uniform(0, stub.jitter_ms)
+        if rng.random() < stub.slow_rate:
+            delay += stub.slow_ms
+        time.sleep(delay / 1000)
+
+        if rng.random() < stub.failure_rate:
+            stub.record(failed=True)
+            self._send(500, {'error': {'message': 'injected failure', 'type': 'server_error'}})
+            return
+
+        stub.record(failed=False)
+        self._send(200, {
+            'id': 'stub-completion',
+            'object': 'chat.completion',
+            'created': 0,
+            'model': payload.get('model', 'stub'),
+            'choices': [{
+                'index': 0,
+                'finish_reason': 'stop',
+                'message': {'role': 'assistant', 'content': classify_prompt(
+                    prompt, labels=stub.labels, rng=rng, error_rate=stub.error_rate
+                )},
+            }],
+            'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+        })
+
+    def _send(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def label_map(cases: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    """
+    Expected labels of golden cases keyed by issue title, for StubLLMServer.
+
+    Args:
+        cases: Golden cases
+
+    Returns:
+        Mapping of title to {'priority', 'status'}
+    """
+    return {
+        case['input']['title']: {field: case['expected'][field] for field in DEFAULT_LABEL if field in case['expected']}
+        for case in cases
+    }
+
+
+def classify_prompt(
+    prompt: str,
+    labels: Optional[Dict[str, Dict[str, str]]] = None,
+    rng: Optional[random.Random] = None,
+    error_rate: float = 0.0
+) -> str:
+    """
+    Answer a classification prompt from a label map.
+
+    Titles missing from ``labels`` get medium/open. With ``error_rate`` and
+    ``rng``, that fraction of answers gets a wrong priority, so accuracy (and
+    the regression gate) responds to it. Single-issue prompts get a JSON
+    object, batch prompts a JSON array.
+
+    Args:
+        prompt: User prompt built by SuggestService
+        labels: Title to expected {'priority', 'status'} (optional)
+        rng: Source of the error draws (default: seeded from the prompt)
+        error_rate: Fraction of answers with a wrong priority
+
+    Returns:
+        JSON string in the shape the prompt asks for
+    """
+    labels = labels or {}
+    rng = rng or random.Random(prompt)
+
+    answers = []
+    for match in _ITEM_RE.finditer(prompt):
+        suggestion = {**DEFAULT_LABEL, **labels.get(match.group('title').strip(), {})}
+        if error_rate and rng.random() < error_rate:
+            suggestion['priority'] = rng.choice([p for p in PRIORITIES if p != suggestion['priority']])
+        suggestion.update(confidence='medium', reason='stub answer')
+        if match.group('id'):
+            suggestion = {'id': int(match.group('id')), **suggestion}
+        answers.append(suggestion)
+
+    if 'JSON array' in prompt:
+        return json.dumps(answers)
+    return json.dumps(answers[0] if answers else {})
+
+
+class StubLLMServer:
+    """
+    Local stub LLM server with configurable answers, latency and failure injection.
+
+    Answers come from ``labels`` (see label_map), with ``error_rate`` of them
+    given a wrong priority.
+
+    Randomness is seeded from the prompt and the number of times it has been
+    seen, so a run is reproducible regardless of request interleaving.
+
+    Usage:
+        with StubLLMServer(latency_ms=50, failure_rate=0.1) as stub:
+            os.environ['OPENAI_BASE_URL'] = stub.base_url
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_ms: float = 0.0,
+        labels: Optional[Dict[str, Dict[str, str]]] = None,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        host: str = '127.0.0.1',
+        port: int = 0
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self.labels = labels or {}
+        self.error_rate = error_rate
+        self.seed = seed
+        self.calls = 0
+        self.failures = 0
+        self._seen = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI-compatible base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def request_rng(self, prompt: str) -> random.Random:
+        """Deterministic RNG for the next request carrying ``prompt``."""
+        digest = hashlib.sha256(prompt.encode()).hexdigest()
+        with self._lock:
+            occurrence = self._seen.get(digest, 0)
+            self._seen[digest] = occurrence + 1
+        return random.Random(f"{self.seed}:{digest}:{occurrence}")
+
+    def record(self, failed: bool) -> None:
+        """Count a served request."""
+        with self._lock:
+            self.calls += 1
+            if failed:
+                self.failures += 1
+
+    def start(self) -> 'StubLLMServer':
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> 'StubLLMServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -9,6 +9,8 @@ from .auth_middleware import (
     get_current_user_role,
 )
 from .error_handler import register_error_handlers
+from .rate_limiting import init_rate_limiting, rate_cost, rate_limit_key
+from .admission import admission_priority
 
 __all__ = [
     'require_auth',
@@ -18,4 +20,8 @@ __all__ = [
     'get_current_user_identity',
     'get_current_user_role',
     'register_error_handlers',
+    'init_rate_limiting',
+    'rate_cost',
+    'rate_limit_key',
+    'admission_priority',
 ]
@@ -0,0 +1,191 @@
+"""
+Admission control: shed low-priority requests fast when the worker is overloaded.
+
+Without it, requests beyond what the connection pool can serve queue inside
+SQLAlchemy for ``pool_timeout`` and then fail slowly, dragging latency up for
+every route. Each request is given a priority (critical, write or low), and
+each priority may only fill part of ``ADMISSION_MAX_IN_FLIGHT``; the remainder
+stays reserved for higher priorities. Low-priority requests are also shed
+while pool checkouts wait longer than ``ADMISSION_POOL_WAIT_MS`` on average.
+Shed requests get an immediate 503 with ``Retry-After``.
+
+A worker runs at most ``WEB_THREADS`` requests at once, so the in-flight limit
+only sheds with threaded (gthread) workers. It defaults to the smaller of
+``WEB_THREADS`` and the connection pool size. Unless ``ADMISSION_ENABLED`` is
+set, admission control is enabled only when ``WEB_THREADS`` > 1; enabling it
+explicitly on sync workers leaves only the pool-wait check and logs a warning.
+"""
+
+import math
+import threading
+from typing import Callable, Optional, Tuple
+from flask import Flask, current_app, request
+from prometheus_client import Counter
+from src.utils.db_pool import pool_pressure
+from src.utils.logger import logger
+from src.utils.responses import error_response
+
+CRITICAL = 'critical'
+WRITE = 'write'
+LOW = 'low'
+
+_ADMITTED_ENVIRON = 'issue_tracker.admitted'
+_CRITICAL_BLUEPRINTS = frozenset({'health', 'metrics', 'auth'})
+_SAFE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+ADMISSION_REJECTED = Counter(
+    'admission_rejected_total',
+    'Requests shed by admission control',
+    ['priority', 'reason'],
+)
+
+
+def admission_priority(priority: str) -> Callable:
+    """
+    Override a route's admission priority ('critical', 'write' or 'low').
+
+    Place it between the route decorator and the view.
+
+    Args:
+        priority: Priority class
+
+    Returns:
+        Decorator function
+    """
+    def decorator(fn: Callable) -> Callable:
+        fn.admission_priority = priority
+        return fn
+    return decorator
+
+
+def request_priority() -> str:
+    """
+    Priority of the current request.
+
+    Health, metrics and auth routes are critical, other non-GET requests are
+    writes, and the remaining reads are low priority, unless the view
+    declares otherwise with admission_priority.
+    """
+    view = current_app.view_functions.get(request.endpoint or '')
+    declared = getattr(view, 'admission_priority', None)
+    if declared:
+        return declared
+    if request.blueprint in _CRITICAL_BLUEPRINTS:
+        return CRITICAL
+    if request.method not in _SAFE_METHODS:
+        return WRITE
+    return LOW
+
+
+class AdmissionController:
+    """
+    Tracks in-flight requests and pool pressure and rejects work beyond capacity.
+
+    Low-priority requests may use ``1 - reserved`` of ``max_in_flight`` and
+    are also shed while checkouts wait longer than ``pool_wait_threshold`` on
+    average. Writes may use ``1 - reserved / 2`` of capacity. Critical
+    requests (health, metrics, auth) are always admitted.
+    """
+
+    def __init__(self):
+        self.max_in_flight = 1
+        self.reserved = 0.25
+        self.pool_wait_threshold = 0.1
+        self.retry_after = 1
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Read settings and register the admission hooks.
+
+        Initialise after the telemetry extensions, so shed requests are still
+        measured, and before rate limiting, which then never sees them.
+        """
+        threads = max(1, int(app.config.get('WEB_THREADS', 1)))
+        enabled = app.config.get('ADMISSION_ENABLED')
+        if not (threads > 1 if enabled is None else enabled):
+            return
+        self.max_in_flight = app.config.get('ADMISSION_MAX_IN_FLIGHT') or self._default_limit(app, threads)
+        self.reserved = float(app.config.get('ADMISSION_RESERVED_FRACTION', 0.25))
+        self.pool_wait_threshold = app.config.get('ADMISSION_POOL_WAIT_MS', 100) / 1000
+        self.retry_after = int(app.config.get('ADMISSION_RETRY_AFTER', 1))
+
+        # In-flight requests never exceed the thread count, so a limit at or
+        # above it is never reached
+        if math.ceil(self.max_in_flight * (1 - self.reserved)) >= threads:
+            logger.warning(
+                "Admission in-flight limit is never reached; it requires WEB_THREADS > 1 "
+                "(gthread workers), raise WEB_THREADS or lower ADMISSION_MAX_IN_FLIGHT",
+                extra={'web_threads': threads, 'max_in_flight': self.max_in_flight,
+                       'reserved_fraction': self.reserved}
+            )
+
+        app.before_request(self._admit)
+        app.teardown_request(self._release)
+
+    @staticmethod
+    def _default_limit(app: Flask, threads: int) -> int:
+        """WEB_THREADS, capped by the pool size so admitted requests need not queue for a connection."""
+        from src.models.base import db
+        with app.app_context():
+            size = getattr(db.engine.pool, 'size', None)
+        if callable(size) and size() > 0:
+            return min(threads, size())
+        return threads
+
+    def try_admit(self, priority: str) -> Tuple[bool, Optional[str]]:
+        """
+        Reserve a slot for a request of the given priority.
+
+        Args:
+            priority: 'critical', 'write' or 'low'
+
+        Returns:
+            Tuple of (admitted, rejection reason)
+        """
+        with self._lock:
+            if priority != CRITICAL:
+                share = 1 - self.reserved / 2 if priority == WRITE else 1 - self.reserved
+                if self.in_flight >= math.ceil(self.max_in_flight * share):
+                    return False, 'in_flight'
+                if priority == LOW and self._pool_saturated():
+                    return False, 'pool_wait'
+            self.in_flight += 1
+            return True, None
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def _pool_saturated(self) -> bool:
+        return pool_pressure.congested(self.pool_wait_threshold, self.retry_after)
+
+    def _admit(self):
+        if request.endpoint is None:
+            return None
+        priority = request_priority()
+        admitted, reason = self.try_admit(priority)
+        if admitted:
+            request.environ[_ADMITTED_ENVIRON] = True
+            return None
+
+        ADMISSION_REJECTED.labels(priority, reason).inc()
+        logger.warning(
+            "Request shed by admission control",
+            extra={'priority': priority, 'reason': reason, 'endpoint': request.endpoint, 'in_flight': self.in_flight}
+        )
+        body, status = error_response(
+            message="Server is busy, retry shortly",
+            status_code=503,
+            error_code="OVERLOADED"
+        )
+        return body, status, {'Retry-After': str(self.retry_after)}
+
+    def _release(self, exc: Optional[BaseException] = None) -> None:
+        if request.environ.pop(_ADMITTED_ENVIRON, False):
+            self.release()
+
+
+# Shared admission controller, configured by create_app
+admission_control = AdmissionController()
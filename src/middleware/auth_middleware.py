@@ -1,11 +1,99 @@
 """Authentication and authorization middleware."""
 
+import time
 from functools import wraps
 from typing import Callable, List, Optional
-from flask import request
+from flask import current_app, g, request
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
 from src.utils.responses import unauthorized_response, forbidden_response
 from src.utils.logger import logger
+from src.utils.token_cache import token_cache
+from src.utils.server_timing import record_phase
+
+_VERIFIED_ENVIRON = 'issue_tracker.verified_token'
+
+
+def _bearer_token() -> Optional[str]:
+    """Raw access token from the Authorization header, if present."""
+    header = request.headers.get(current_app.config.get('JWT_HEADER_NAME', 'Authorization'), '')
+    parts = header.split()
+    if len(parts) == 2 and parts[0] == current_app.config.get('JWT_HEADER_TYPE', 'Bearer'):
+        return parts[1]
+    return None
+
+
+def _replay_cached_verification(token: Optional[str]) -> bool:
+    """
+    Restore a cached verification of ``token`` into flask_jwt_extended's request state.
+
+    This is the only code relying on flask_jwt_extended internals (the
+    blocklist check and the ``g._jwt_extended_*`` attributes read by
+    ``get_jwt()``). They are not public API, so requirements.txt pins the
+    4.6 series, and tests/unit/test_token_cache.py checks get_jwt() and
+    get_jwt_identity() after a cache hit.
+
+    Returns:
+        True if the token was restored from the cache, False on a miss or
+        when a user lookup loader makes the cache unusable
+
+    Raises:
+        Exception: flask_jwt_extended RevokedTokenError if the token was revoked
+    """
+    from flask_jwt_extended.internal_utils import has_user_lookup, verify_token_not_blocklisted
+
+    cached = token_cache.get(token) if token and not has_user_lookup() else None
+    if cached is None:
+        return False
+
+    jwt_header, jwt_data = cached
+    try:
+        verify_token_not_blocklisted(jwt_header, jwt_data)
+    except Exception:
+        token_cache.discard(token)
+        raise
+    g._jwt_extended_jwt_user = {'loaded_user': None}
+    g._jwt_extended_jwt_header = jwt_header
+    g._jwt_extended_jwt = jwt_data
+    g._jwt_extended_jwt_location = 'headers'
+    return True
+
+
+def verify_access_token() -> None:
+    """
+    Verify the request's access token, reusing earlier verifications.
+    
+    Signature and claim checks are skipped for tokens found in the verified
+    token cache, but the blocklist callback still runs on every request so
+    revoked tokens are rejected immediately.
+    
+    The outcome is kept in the request environ, so later calls in the same
+    request (the rate limit key, then the view) neither verify again nor
+    count again in the cache stats and the auth Server-Timing phase.
+    
+    Raises:
+        Exception: Any flask_jwt_extended verification error
+    """
+    token = _bearer_token()
+    outcome = request.environ.get(_VERIFIED_ENVIRON)
+    if outcome is not None and outcome[0] == token:
+        if outcome[1] is not None:
+            raise outcome[1]
+        return
+    
+    started = time.perf_counter()
+    try:
+        hit = _replay_cached_verification(token)
+        if not hit:
+            verified = verify_jwt_in_request()
+            if token and verified is not None:
+                token_cache.put(token, *verified)
+    except Exception as e:
+        request.environ[_VERIFIED_ENVIRON] = (token, e)
+        raise
+    request.environ[_VERIFIED_ENVIRON] = (token, None)
+    elapsed = time.perf_counter() - started
+    token_cache.record(hit=hit, seconds=elapsed)
+    record_phase('auth', elapsed)
 
 
 def jwt_required_custom(fn: Callable) -> Callable:
@@ -21,7 +109,7 @@ def jwt_required_custom(fn: Callable) -> Callable:
     @wraps(fn)
     def wrapper(*args, **kwargs):
         try:
-            verify_jwt_in_request()
+            verify_access_token()
             return fn(*args, **kwargs)
         except Exception as e:
             logger.warning(f"JWT verification failed: {str(e)}")
@@ -0,0 +1,157 @@
+"""Identity-keyed, cost-weighted rate limiting."""
+
+from typing import Callable, Optional
+from flask import Flask, current_app, request
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+from src.middleware.auth_middleware import _bearer_token, get_current_user_id, verify_access_token
+from src.utils.logger import logger
+
+_KEY_ENVIRON = 'issue_tracker.rate_limit_key'
+
+
+def rate_limit_key() -> str:
+    """
+    Rate limit bucket for the current request.
+
+    Requests with a valid access token are keyed by user, so users behind
+    the same NAT get their own budgets; everything else is keyed by address.
+
+    Returns:
+        'user:<id>' or 'ip:<address>'
+    """
+    key = request.environ.get(_KEY_ENVIRON)
+    if key is not None:
+        return key
+
+    key = f"ip:{get_remote_address()}"
+    if _bearer_token():
+        try:
+            verify_access_token()
+            user_id = get_current_user_id()
+            if user_id is not None:
+                key = f"user:{user_id}"
+        except Exception:
+            pass
+
+    request.environ[_KEY_ENVIRON] = key
+    return key
+
+
+def rate_cost(cost: int = 1, limit_class: Optional[str] = None,
+              when: Optional[Callable[[], bool]] = None) -> Callable:
+    """
+    Declare a route's rate limit weight and expensive-endpoint class.
+
+    Place it between the route decorator and the view. The cost is deducted
+    from the default budget and, when ``limit_class`` is set, from that
+    class's shared budget in RATELIMIT_CLASSES.
+
+    Args:
+        cost: Units deducted per request
+        limit_class: Shared budget name (e.g. 'llm', 'search')
+        when: Predicate limiting cost and class to some requests; others cost 1
+
+    Returns:
+        Decorator function
+    """
+    def decorator(fn: Callable) -> Callable:
+        fn.rate_limit_cost = cost
+        fn.rate_limit_class = limit_class
+        fn.rate_limit_when = when
+        return fn
+    return decorator
+
+
+def _current_view() -> Optional[Callable]:
+    return current_app.view_functions.get(request.endpoint or '')
+
+
+def request_cost() -> int:
+    """Cost of the current request as declared with rate_cost."""
+    view = _current_view()
+    if view is None:
+        return 1
+    when = getattr(view, 'rate_limit_when', None)
+    if when is not None and not when():
+        return 1
+    return getattr(view, 'rate_limit_cost', 1)
+
+
+def _outside_class() -> bool:
+    view = _current_view()
+    when = getattr(view, 'rate_limit_when', None)
+    return when is not None and not when()
+
+
+def request_class() -> Optional[str]:
+    """Expensive-endpoint class of the current request as declared with rate_cost."""
+    view = _current_view()
+    if view is None or _outside_class():
+        return None
+    return getattr(view, 'rate_limit_class', None)
+
+
+def init_rate_limiting(app: Flask) -> Optional[Limiter]:
+    """
+    Create the limiter and attach class budgets to declared routes.
+
+    Must run after blueprints are registered.
+
+    Args:
+        app: Flask application
+
+    Returns:
+        Limiter, or None when RATELIMIT_ENABLED is false
+    """
+    if not app.config.get('RATELIMIT_ENABLED', True):
+        return None
+
+    limiter = Limiter(
+        app=app,
+        key_func=rate_limit_key,
+        default_limits=[app.config.get('RATELIMIT_DEFAULT', '100 per minute')],
+        default_limits_cost=request_cost,
+        storage_uri=app.config.get('RATELIMIT_STORAGE_URL', 'memory://'),
+        headers_enabled=app.config.get('RATELIMIT_HEADERS_ENABLED', True)
+    )
+
+    budgets = app.config.get('RATELIMIT_CLASSES', {})
+    for endpoint, view in list(app.view_functions.items()):
+        if getattr(view, 'rate_limit_exempt', False):
+            app.view_functions[endpoint] = limiter.exempt(view)
+            continue
+        limit_class = getattr(view, 'rate_limit_class', None)
+        if not limit_class:
+            continue
+        if limit_class not in budgets:
+            logger.warning(f"No RATELIMIT_CLASSES budget for '{limit_class}' used by {endpoint}")
+            continue
+        app.view_functions[endpoint] = limiter.shared_limit(
+            budgets[limit_class],
+            scope=f"class:{limit_class}",
+            cost=request_cost,
+            exempt_when=_outside_class,
+            override_defaults=False,
+        )(view)
+
+    @app.after_request
+    def add_rate_limit_usage_headers(response):
+        """Report the request's cost and its class budget usage."""
+        if not app.config.get('RATELIMIT_HEADERS_ENABLED', True) or request.endpoint is None:
+            return response
+        try:
+            response.headers['X-RateLimit-Cost'] = str(request_cost())
+            for current in limiter.current_limits:
+                if not current.shared:
+                    continue
+                response.headers['X-RateLimit-Class'] = current.request_args[-1].split(':', 1)[-1]
+                response.headers['X-RateLimit-Class-Limit'] = str(current.limit.amount)
+                response.headers['X-RateLimit-Class-Remaining'] = str(current.remaining)
+                response.headers['X-RateLimit-Class-Reset'] = str(current.reset_at)
+        except Exception as e:
+            logger.warning(f"Failed to add rate limit headers: {str(e)}")
+        return response
+
+    app.limiter = limiter
+    return limiter
@@ -7,6 +7,7 @@ from .issue import Issue
 from .label import Label
 from .comment import Comment
 from .associations import ProjectMember, Assignment, issue_labels
+from .revoked_token import RevokedToken
 
 # Setup relationships that need to be imported after all models are defined
 # This ensures circular imports don't cause issues
@@ -29,4 +30,5 @@ __all__ = [
     'ProjectMember',
     'Assignment',
     'issue_labels',
+    'RevokedToken',
 ]
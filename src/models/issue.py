@@ -16,6 +16,8 @@ class Issue(db.Model, TimestampMixin):
     status = db.Column(db.String(20), nullable=False, default='open')  # open, in_progress, resolved, closed
     priority = db.Column(db.String(20), nullable=False, default='medium')  # low, medium, high, critical
     reporter_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'))
+    suggested_priority = db.Column(db.String(20))  # set by background triage
+    suggestion_confidence = db.Column(db.String(10))  # low, medium, high
     
     # Relationships
     project = db.relationship('Project', back_populates='issues')
@@ -47,6 +49,8 @@ class Issue(db.Model, TimestampMixin):
             'status': self.status,
             'priority': self.priority,
             'reporter_id': self.reporter_id,
+            'suggested_priority': self.suggested_priority,
+            'suggestion_confidence': self.suggestion_confidence,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -13,6 +13,8 @@ class Project(db.Model, TimestampMixin):
     description = db.Column(db.Text)
     owner_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     is_active = db.Column(db.Boolean, nullable=False, default=True)
+    auto_triage = db.Column(db.Boolean, nullable=False, default=False)
+    auto_triage_min_confidence = db.Column(db.String(10))  # low, medium, high; NULL = never auto-apply
     
     # Relationships
     owner = db.relationship('User', back_populates='owned_projects', foreign_keys=[owner_id])
@@ -36,6 +38,8 @@ class Project(db.Model, TimestampMixin):
             'description': self.description,
             'owner_id': self.owner_id,
             'is_active': self.is_active,
+            'auto_triage': self.auto_triage,
+            'auto_triage_min_confidence': self.auto_triage_min_confidence,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -0,0 +1,20 @@
+"""Revoked token model."""
+
+from datetime import datetime
+from .base import db
+
+
+class RevokedToken(db.Model):
+    """JWT revoked before its expiry (logout, password change)."""
+    
+    __tablename__ = 'revoked_tokens'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(36), unique=True, nullable=False, index=True)
+    token_type = db.Column(db.String(10), nullable=False, default='access')
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=True, index=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.now)
+    
+    def __repr__(self):
+        return f'<RevokedToken {self.jti}>'
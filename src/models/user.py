@@ -14,6 +14,8 @@ class User(db.Model, TimestampMixin):
     password_hash = db.Column(db.String(255), nullable=False)
     role = db.Column(db.String(20), nullable=False, default='developer')  # admin, developer, viewer
     is_active = db.Column(db.Boolean, nullable=False, default=True)
+    tokens_valid_after = db.Column(db.DateTime, nullable=True)  # tokens issued at or before are revoked
+    membership_epoch = db.Column(db.Integer, nullable=False, default=0)  # bumped when project roles change
     
     # Relationships
     owned_projects = db.relationship('Project', back_populates='owner', lazy='dynamic', foreign_keys='Project.owner_id')
@@ -6,6 +6,7 @@ from .project_repository import ProjectRepository
 from .issue_repository import IssueRepository
 from .label_repository import LabelRepository
 from .comment_repository import CommentRepository
+from .revoked_token_repository import RevokedTokenRepository
 
 __all__ = [
     'BaseRepository',
@@ -14,4 +15,5 @@ __all__ = [
     'IssueRepository',
     'LabelRepository',
     'CommentRepository',
+    'RevokedTokenRepository',
 ]
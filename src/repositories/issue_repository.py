@@ -1,6 +1,7 @@
 """Issue repository with specific queries."""
 
 from typing import List, Optional, Dict, Any
+from sqlalchemy import update
 from src.models import Issue, Assignment
 from .base import BaseRepository
 
@@ -107,3 +108,50 @@ class IssueRepository(BaseRepository):
             issue_id=issue_id,
             user_id=user_id
         ).first() is not None
+    
+    def get_unclassified_chunk(self, after_id: int = 0, limit: int = 200) -> List[Any]:
+        """
+        Get the next id-ordered chunk of issues without a suggested priority.
+        
+        Only the columns needed for classification are loaded.
+        """
+        return self.session.query(
+            Issue.id, Issue.project_id, Issue.title, Issue.description
+        ).filter(
+            Issue.suggested_priority.is_(None),
+            Issue.id > after_id
+        ).order_by(Issue.id).limit(limit).all()
+    
+    def get_unclassified_by_ids(self, issue_ids: List[int]) -> List[Any]:
+        """Get the issues among ``issue_ids`` that still have no suggested priority."""
+        if not issue_ids:
+            return []
+        return self.session.query(
+            Issue.id, Issue.project_id, Issue.title, Issue.description
+        ).filter(
+            Issue.suggested_priority.is_(None),
+            Issue.id.in_(issue_ids)
+        ).order_by(Issue.id).all()
+    
+    def update_priority_if(self, issue_id: int, expected: str, priority: str) -> bool:
+        """
+        Set an issue's priority only if it still equals ``expected`` and commit.
+        
+        Returns:
+            True if the priority was changed
+        """
+        result = self.session.execute(
+            update(Issue)
+            .where(Issue.id == issue_id, Issue.priority == expected)
+            .values(priority=priority)
+            .execution_options(synchronize_session='fetch')
+        )
+        self.session.commit()
+        return result.rowcount == 1
+    
+    def bulk_update(self, rows: List[Dict[str, Any]]) -> None:
+        """Update many issues by primary key in one statement batch and commit."""
+        if not rows:
+            return
+        self.session.execute(update(Issue), rows)
+        self.session.commit()
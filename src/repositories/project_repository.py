@@ -4,6 +4,7 @@ from typing import List, Optional, Dict, Any
 from sqlalchemy import or_
 from src.models import Project, ProjectMember
 from .base import BaseRepository
+from .user_repository import UserRepository, user_status_cache
 
 
 class ProjectRepository(BaseRepository):
@@ -93,7 +94,9 @@ class ProjectRepository(BaseRepository):
         """Add a member to a project."""
         member = ProjectMember(project_id=project_id, user_id=user_id, role=role)
         self.session.add(member)
+        UserRepository().bump_membership_epochs([user_id])
         self.session.commit()
+        user_status_cache.invalidate(user_id)
         self.session.refresh(member)
         return member
     
@@ -106,7 +109,9 @@ class ProjectRepository(BaseRepository):
         
         if member:
             self.session.delete(member)
+            UserRepository().bump_membership_epochs([user_id])
             self.session.commit()
+            user_status_cache.invalidate(user_id)
             return True
         return False
     
@@ -117,6 +122,42 @@ class ProjectRepository(BaseRepository):
             user_id=user_id
         ).first()
     
+    def get_triage_thresholds(self, project_ids: List[int]) -> Dict[int, Optional[str]]:
+        """Get the auto-apply confidence threshold of each project."""
+        if not project_ids:
+            return {}
+        rows = self.session.query(Project.id, Project.auto_triage_min_confidence).filter(
+            Project.id.in_(project_ids)
+        ).all()
+        return {row.id: row.auto_triage_min_confidence for row in rows}
+    
+    def delete(self, id: int) -> bool:
+        """Delete project and invalidate its members' project claims."""
+        project = self.get_by_id(id)
+        if not project:
+            return False
+        user_ids = [
+            user_id for (user_id,) in
+            self.session.query(ProjectMember.user_id).filter(ProjectMember.project_id == id)
+        ] + [project.owner_id]
+        UserRepository().bump_membership_epochs(user_ids)
+        self.session.delete(project)
+        self.session.commit()
+        user_status_cache.invalidate(*user_ids)
+        return True
+    
+    def get_user_roles(self, user_id: int) -> Dict[int, str]:
+        """Get the user's role in every project they belong to (owner included)."""
+        roles = {
+            row.project_id: row.role
+            for row in self.session.query(ProjectMember.project_id, ProjectMember.role).filter(
+                ProjectMember.user_id == user_id
+            )
+        }
+        for (project_id,) in self.session.query(Project.id).filter(Project.owner_id == user_id):
+            roles[project_id] = 'owner'
+        return roles
+    
     def is_member(self, project_id: int, user_id: int) -> bool:
         """Check if user is a member of project."""
         project = self.get_by_id(project_id)
@@ -0,0 +1,66 @@
+"""Revoked token repository."""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from src.models import RevokedToken
+from .base import BaseRepository
+
+
+class RevokedTokenRepository(BaseRepository):
+    """Repository for RevokedToken model."""
+    
+    def __init__(self):
+        super().__init__(RevokedToken)
+    
+    def add(
+        self,
+        jti: str,
+        expires_at: datetime,
+        token_type: str = 'access',
+        user_id: Optional[int] = None
+    ) -> bool:
+        """
+        Record a revoked token, ignoring duplicates.
+        
+        Returns:
+            True if a new row was written
+        """
+        try:
+            self.create(jti=jti, expires_at=expires_at, token_type=token_type, user_id=user_id)
+            return True
+        except IntegrityError:
+            self.session.rollback()
+            return False
+    
+    def is_revoked(self, jti: str) -> bool:
+        """Check if a jti is in the store."""
+        return self.exists(jti=jti)
+    
+    def get_active_since(self, after_id: int = 0) -> List[Tuple[int, str]]:
+        """
+        Unexpired revocations with id greater than after_id.
+        
+        Args:
+            after_id: Last id already loaded
+        
+        Returns:
+            List of (id, jti) ordered by id
+        """
+        stmt = (
+            select(RevokedToken.id, RevokedToken.jti)
+            .where(RevokedToken.id > after_id, RevokedToken.expires_at > datetime.now())
+            .order_by(RevokedToken.id)
+        )
+        return [tuple(row) for row in self.session.execute(stmt)]
+    
+    def purge_expired(self) -> int:
+        """Delete revocations of tokens that have expired anyway."""
+        deleted = (
+            self.session.query(RevokedToken)
+            .filter(RevokedToken.expires_at <= datetime.now())
+            .delete(synchronize_session=False)
+        )
+        self.session.commit()
+        return deleted
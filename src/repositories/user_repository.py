@@ -1,9 +1,111 @@
 """User repository with specific queries."""
 
-from typing import Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, NamedTuple, Optional
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
 from src.models import User
+from src.utils.metrics import record_cache_lookup
 from .base import BaseRepository
 
+# Unique violations as reported by SQLite ("users.email") and PostgreSQL
+# (constraint/index names and "Key (email)=")
+_DUPLICATE_PATTERNS = {
+    field: re.compile(rf'users\.{field}\b|users_{field}_key|ix_users_{field}\b|\({field}\)=')
+    for field in ('username', 'email')
+}
+
+
+def duplicate_field(error: IntegrityError) -> Optional[str]:
+    """
+    Name the unique users column an IntegrityError was raised for.
+    
+    Args:
+        error: Error raised by an insert into users
+    
+    Returns:
+        'username', 'email', or None for other constraint violations
+    """
+    message = str(getattr(error, 'orig', error))
+    for field, pattern in _DUPLICATE_PATTERNS.items():
+        if pattern.search(message):
+            return field
+    return None
+
+
+class UserStatus(NamedTuple):
+    """The few user columns needed to authorize a request."""
+    
+    id: int
+    is_active: bool
+    role: str
+    tokens_valid_after: Optional[datetime]
+    membership_epoch: int = 0
+
+
+class UserStatusCache:
+    """
+    Per-process LRU of UserStatus with a TTL.
+    
+    UserRepository writes invalidate entries in this process; the TTL bounds
+    how long another worker's change can go unnoticed.
+    """
+    
+    def __init__(self, ttl: float = 30.0, max_size: int = 10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[int, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def init_app(self, app) -> None:
+        """Configure TTL and size from app config and drop cached entries."""
+        self.ttl = app.config.get('USER_STATUS_CACHE_TTL', 30.0)
+        self.max_size = app.config.get('USER_STATUS_CACHE_SIZE', 10000)
+        self.clear()
+    
+    def get(self, user_id: int) -> Optional[UserStatus]:
+        """Cached status, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= time.monotonic():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, status: UserStatus) -> None:
+        """Store a freshly loaded status."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[status.id] = (time.monotonic() + self.ttl, status)
+            self._entries.move_to_end(status.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, *user_ids: int) -> None:
+        """Forget the given users."""
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+    
+    def clear(self) -> None:
+        """Forget all users."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+# Shared per-process cache, configured by create_app
+user_status_cache = UserStatusCache()
+
 
 class UserRepository(BaseRepository):
     """Repository for User model."""
@@ -11,6 +113,84 @@ class UserRepository(BaseRepository):
     def __init__(self):
         super().__init__(User)
     
+    def create(self, **kwargs) -> User:
+        """Create a user, dropping any stale status cached under its ID."""
+        user = super().create(**kwargs)
+        user_status_cache.invalidate(user.id)
+        return user
+    
+    def insert(self, **values) -> User:
+        """
+        Insert and commit a user with a single INSERT ... RETURNING.
+        
+        Uniqueness is left to the database constraints, so there is no
+        pre-check to race with, and the returned row stays loaded after the
+        commit instead of being re-read.
+        
+        Args:
+            **values: User column values
+        
+        Returns:
+            Created User
+        
+        Raises:
+            IntegrityError: On a duplicate username or email (rolled back)
+        """
+        try:
+            user = self.session.scalars(insert(User).values(**values).returning(User)).one()
+            self.session.expunge(user)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        self.session.add(user)
+        user_status_cache.invalidate(user.id)
+        return user
+    
+    def update(self, id: int, **kwargs) -> Optional[User]:
+        """Update a user and invalidate its cached status."""
+        try:
+            return super().update(id, **kwargs)
+        finally:
+            user_status_cache.invalidate(id)
+    
+    def delete(self, id: int) -> bool:
+        """Delete a user and invalidate its cached status."""
+        try:
+            return super().delete(id)
+        finally:
+            user_status_cache.invalidate(id)
+    
+    def get_status(self, user_id: int) -> Optional[UserStatus]:
+        """
+        Get the user's active flag, role, token watermark and membership epoch.
+        
+        Served from the status cache when possible, otherwise loaded with a
+        primary-key lookup of just those columns.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            UserStatus or None if the user does not exist
+        """
+        status = user_status_cache.get(user_id)
+        record_cache_lookup('user_status', status is not None)
+        if status is not None:
+            return status
+        
+        row = self.session.execute(
+            select(
+                User.id, User.is_active, User.role, User.tokens_valid_after, User.membership_epoch
+            ).where(User.id == user_id)
+        ).first()
+        if row is None:
+            return None
+        
+        status = UserStatus(*row)
+        user_status_cache.put(status)
+        return status
+    
     def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username."""
         return self.filter_one(username=username)
@@ -33,3 +213,38 @@ class UserRepository(BaseRepository):
     def email_exists(self, email: str) -> bool:
         """Check if email exists."""
         return self.exists(email=email)
+    
+    def get_token_watermarks(self, since: datetime) -> Dict[int, datetime]:
+        """
+        Users whose tokens were bulk-revoked after a point in time.
+        
+        Args:
+            since: Ignore watermarks older than this (no live token predates them)
+        
+        Returns:
+            Mapping of user ID to tokens_valid_after
+        """
+        stmt = select(User.id, User.tokens_valid_after).where(User.tokens_valid_after > since)
+        return {user_id: valid_after for user_id, valid_after in self.session.execute(stmt)}
+    
+    def get_membership_epoch(self, user_id: int) -> Optional[int]:
+        """Get a user's membership epoch without loading the row."""
+        return self.session.execute(
+            select(User.membership_epoch).where(User.id == user_id)
+        ).scalar_one_or_none()
+    
+    def bump_membership_epochs(self, user_ids: Iterable[int]) -> None:
+        """
+        Invalidate project claims of the given users.
+        
+        Flushes without committing so the bump lands in the caller's
+        transaction together with the membership change. The caller
+        invalidates the users' cached status after committing.
+        """
+        user_ids = list(set(user_ids))
+        if user_ids:
+            self.session.execute(
+                update(User)
+                .where(User.id.in_(user_ids))
+                .values(membership_epoch=User.membership_epoch + 1)
+            )
@@ -7,6 +7,8 @@ from .issues import issues_bp
 from .comments import comments_bp
 from .labels import labels_bp
 from .health import health_bp
+from .metrics import metrics_bp
+from .profiling import profiling_bp
 
 
 def register_blueprints(app: Flask) -> None:
@@ -22,6 +24,8 @@ def register_blueprints(app: Flask) -> None:
     app.register_blueprint(comments_bp)
     app.register_blueprint(labels_bp)
     app.register_blueprint(health_bp)
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(profiling_bp)
 
 
 __all__ = [
@@ -32,4 +36,6 @@ __all__ = [
     'comments_bp',
     'labels_bp',
     'health_bp',
+    'metrics_bp',
+    'profiling_bp',
 ]
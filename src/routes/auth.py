@@ -1,23 +1,36 @@
 """Authentication routes."""
 
-from flask import Blueprint, request
+import math
+from flask import Blueprint, current_app, request
 from marshmallow import ValidationError
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 from src.services import AuthService
-from src.schemas import UserRegistrationSchema, UserLoginSchema, UserResponseSchema
+from src.schemas import UserRegistrationSchema, UserLoginSchema, UserProvisionSchema, UserResponseSchema
 from src.utils.responses import (
     success_response,
     error_response,
     validation_error_response,
     created_response,
 )
-from src.middleware import require_auth
+from src.middleware import require_auth, require_role, rate_cost
 from src.utils.logger import logger
+from src.utils.login_guard import LoginThrottledError
+from src.utils.password_hashing import HashingBusyError
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/v1/auth')
 auth_service = AuthService()
 
 
+def hashing_busy_response():
+    """503 returned when the password hashing pool is saturated."""
+    body, status = error_response(
+        "Authentication service is busy, please retry",
+        status_code=503,
+        error_code="HASHING_BUSY"
+    )
+    return body, status, {'Retry-After': '1'}
+
+
 @auth_bp.route('/register', methods=['POST'])
 def register():
     """
@@ -58,11 +71,53 @@ def register():
     
     except ValidationError as e:
         return validation_error_response(e.messages)
+    except HashingBusyError:
+        return hashing_busy_response()
     except Exception as e:
         logger.error(f"Error in register: {str(e)}")
         return error_response("Registration failed", status_code=500)
 
 
+@auth_bp.route('/provision', methods=['POST'])
+@rate_cost(1, limit_class='bulk')
+@require_role('admin')
+def provision_users():
+    """
+    Register a batch of users (admin only).
+    
+    Request body:
+        users: list of {username, email, password, role}
+    
+    Returns:
+        200: Per-user results; duplicates are reported, not fatal
+        400: Validation error or batch too large
+        403: Not an admin
+    """
+    try:
+        data = UserProvisionSchema().load(request.get_json())
+        
+        max_users = current_app.config.get('BULK_PROVISION_MAX_USERS', 500)
+        if len(data['users']) > max_users:
+            return error_response(f"At most {max_users} users per request", status_code=400)
+        
+        results, error = auth_service.provision_users(data['users'])
+        
+        if error:
+            return error_response(error, status_code=500)
+        
+        created = sum(1 for result in results if result['error'] is None)
+        return success_response(
+            data={'created': created, 'failed': len(results) - created, 'results': results},
+            message=f"Provisioned {created} of {len(results)} users"
+        )
+    
+    except ValidationError as e:
+        return validation_error_response(e.messages)
+    except Exception as e:
+        logger.error(f"Error in provision_users: {str(e)}")
+        return error_response("Provisioning failed", status_code=500)
+
+
 @auth_bp.route('/login', methods=['POST'])
 def login():
     """
@@ -76,6 +131,7 @@ def login():
         200: Login successful with tokens
         400: Validation error
         401: Invalid credentials
+        429: Too many failed attempts for the username or address
     """
     try:
         # Validate input
@@ -85,7 +141,8 @@ def login():
         # Authenticate user
         result, error = auth_service.login(
             username=data['username'],
-            password=data['password']
+            password=data['password'],
+            ip_address=request.remote_addr
         )
         
         if error:
@@ -98,6 +155,15 @@ def login():
     
     except ValidationError as e:
         return validation_error_response(e.messages)
+    except LoginThrottledError as e:
+        body, status = error_response(
+            "Too many login attempts, please retry later",
+            status_code=429,
+            error_code="LOGIN_THROTTLED"
+        )
+        return body, status, {'Retry-After': str(max(1, math.ceil(e.retry_after)))}
+    except HashingBusyError:
+        return hashing_busy_response()
     except Exception as e:
         logger.error(f"Error in login: {str(e)}")
         return error_response("Login failed", status_code=500)
@@ -136,17 +202,25 @@ def refresh():
 @require_auth
 def logout():
     """
-    Logout user (client should discard tokens).
+    Logout user by revoking the current access token.
     
-    Note: Since we're using JWT, actual logout is handled client-side
-    by discarding the tokens. This endpoint is mainly for logging purposes.
+    Request body (optional):
+        refresh_token: str - also revoke this refresh token
     
     Returns:
         200: Logout successful
+        400: Refresh token invalid or not owned by the caller
     """
     try:
         identity = get_jwt_identity()
-        logger.info(f"User {identity['username']} logged out")
+        data = request.get_json(silent=True) or {}
+        
+        success, error = auth_service.logout(get_jwt(), refresh_token=data.get('refresh_token'))
+        
+        if error:
+            return error_response(error, status_code=400)
+        
+        logger.info("User logged out", extra={'username': identity['username']})
         
         return success_response(message="Logout successful")
     
@@ -155,6 +229,30 @@ def logout():
         return error_response("Logout failed", status_code=500)
 
 
+@auth_bp.route('/logout-all', methods=['POST'])
+@require_auth
+def logout_all():
+    """
+    Revoke every token issued to the current user, on all devices.
+    
+    Returns:
+        200: Tokens revoked
+    """
+    try:
+        identity = get_jwt_identity()
+        
+        success, error = auth_service.revoke_all_tokens(identity['user_id'])
+        
+        if error:
+            return error_response(error, status_code=400)
+        
+        return success_response(message="All sessions logged out")
+    
+    except Exception as e:
+        logger.error(f"Error in logout_all: {str(e)}")
+        return error_response("Logout failed", status_code=500)
+
+
 @auth_bp.route('/me', methods=['GET'])
 @require_auth
 def get_current_user():
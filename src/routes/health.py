@@ -2,7 +2,8 @@
 
 from flask import Blueprint
 from src.utils.responses import success_response, error_response
-from src.utils.logger import logger
+from src.utils.readiness import readiness_monitor
+from src.utils.token_cache import token_cache
 import os
 
 health_bp = Blueprint('health', __name__, url_prefix='/api/v1')
@@ -13,25 +14,22 @@ def health_check():
     """
     Health check endpoint.
     
-    Returns application health status and database connectivity.
+    Returns application health status and database connectivity from the
+    cached readiness report, so frequent checks do not use pool connections.
     """
-    try:
-        # Check database connection
-        from src.models.base import db
-        db.session.execute(db.text('SELECT 1'))
-        db_status = 'healthy'
-    except Exception as e:
-        logger.error(f"Database health check failed: {str(e)}")
-        db_status = 'unhealthy'
+    readiness = readiness_monitor.report()
+    db_status = 'healthy' if readiness['database'] == 'ok' else 'unhealthy'
     
     health_status = {
-        'status': 'healthy' if db_status == 'healthy' else 'degraded',
+        'status': 'healthy' if readiness['ready'] else 'degraded',
         'service': os.getenv('APP_NAME', 'Issue Tracker API'),
         'version': os.getenv('APP_VERSION', '1.0.0'),
         'database': db_status,
+        'auth_cache': token_cache.stats(),
+        'readiness': readiness,
     }
     
-    status_code = 200 if db_status == 'healthy' else 503
+    status_code = 200 if readiness['ready'] else 503
     
     if status_code == 200:
         return success_response(data=health_status)
@@ -43,7 +41,38 @@ def health_check():
         )
 
 
+@health_bp.route('/health/live', methods=['GET'])
+def liveness():
+    """
+    Liveness probe: the worker is up and serving requests.
+    
+    Checks no dependencies, so a database outage does not get workers restarted.
+    """
+    return success_response(data={'status': 'alive'})
+
+
+@health_bp.route('/health/ready', methods=['GET'])
+def readiness():
+    """
+    Readiness probe from a report cached for READINESS_TTL seconds.
+    
+    Returns:
+        200: Database reachable, migrations at head and pool not saturated
+        503: Not ready; details hold the report
+    """
+    report = readiness_monitor.report()
+    if report['ready']:
+        return success_response(data=report)
+    return error_response(message="Service not ready", status_code=503, details=report)
+
+
 @health_bp.route('/ping', methods=['GET'])
 def ping():
     """Simple ping endpoint."""
     return success_response(data={'message': 'pong'})
+
+
+# Probes must not eat into client rate limit budgets
+health_check.rate_limit_exempt = True
+liveness.rate_limit_exempt = True
+readiness.rate_limit_exempt = True
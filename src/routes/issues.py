@@ -9,7 +9,7 @@ from src.utils.responses import (
     not_found_response, forbidden_response, no_content_response,
 )
 from src.utils.pagination import get_pagination_params
-from src.middleware import require_auth, get_current_user_id
+from src.middleware import require_auth, get_current_user_id, rate_cost, admission_priority
 from src.utils.logger import logger
 
 issues_bp = Blueprint('issues', __name__, url_prefix='/api/v1')
@@ -17,6 +17,7 @@ issue_service = IssueService()
 
 
 @issues_bp.route('/projects/<int:project_id>/issues', methods=['GET'])
+@rate_cost(3, limit_class='search', when=lambda: bool(request.args.get('search')))
 @require_auth
 def get_issues(project_id):
     """Get issues for a project with pagination and filters."""
@@ -87,7 +88,7 @@ def create_issue(project_id):
             title=data['title'],
             reporter_id=user_id,
             description=data.get('description'),
-            priority=data.get('priority', 'medium'),
+            priority=data.get('priority'),
             status=data.get('status', 'open')
         )
         
@@ -263,6 +264,8 @@ def add_label(issue_id):
 
 
 @issues_bp.route('/issues/suggest', methods=['POST'])
+@rate_cost(10, limit_class='llm')
+@admission_priority('low')
 @require_auth
 def suggest_issue():
     """Suggest priority and status for an issue using AI classification."""
@@ -0,0 +1,31 @@
+"""Prometheus metrics route."""
+
+import hmac
+from flask import Blueprint, current_app, request
+from src.utils.metrics import render_metrics
+from src.utils.responses import unauthorized_response
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Prometheus scrape endpoint.
+    
+    When METRICS_TOKEN is set, scrapers must send it as a Bearer token.
+    
+    Returns:
+        200: Metrics in Prometheus text format
+        401: Missing or wrong token
+    """
+    token = current_app.config.get('METRICS_TOKEN')
+    if token:
+        supplied = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+        if not hmac.compare_digest(supplied, token):
+            return unauthorized_response("Invalid metrics token")
+    return render_metrics()
+
+
+# Scrapes must not eat into client rate limit budgets
+metrics.rate_limit_exempt = True
@@ -0,0 +1,27 @@
+"""Request profile retrieval routes."""
+
+from flask import Blueprint, Response
+from src.middleware import require_role
+from src.utils.profiling import request_profiler
+from src.utils.responses import not_found_response
+
+profiling_bp = Blueprint('profiling', __name__, url_prefix='/api/v1/profiles')
+
+
+@profiling_bp.route('/<profile_id>', methods=['GET'])
+@require_role('admin')
+def get_profile(profile_id: str):
+    """
+    Download a request profile in collapsed-stack format (admin only).
+
+    Args:
+        profile_id: Request id of the profiled request (or its X-Profile-Id)
+
+    Returns:
+        200: Collapsed stacks as text/plain
+        404: Unknown or pruned profile
+    """
+    collapsed = request_profiler.load(profile_id)
+    if collapsed is None:
+        return not_found_response("Profile not found")
+    return Response(collapsed, mimetype='text/plain')
@@ -14,7 +14,7 @@ from src.utils.responses import (
     no_content_response,
 )
 from src.utils.pagination import get_pagination_params, build_pagination_response
-from src.middleware import require_auth, get_current_user_id
+from src.middleware import require_auth, get_current_user_id, rate_cost
 from src.utils.logger import logger
 
 projects_bp = Blueprint('projects', __name__, url_prefix='/api/v1/projects')
@@ -22,6 +22,7 @@ project_service = ProjectService()
 
 
 @projects_bp.route('', methods=['GET'])
+@rate_cost(3, limit_class='search', when=lambda: bool(request.args.get('search')))
 @require_auth
 def get_projects():
     """Get all projects for current user with pagination and filters."""
@@ -93,7 +94,9 @@ def create_project():
         project, error = project_service.create_project(
             name=data['name'],
             owner_id=user_id,
-            description=data.get('description')
+            description=data.get('description'),
+            auto_triage=data.get('auto_triage', False),
+            auto_triage_min_confidence=data.get('auto_triage_min_confidence')
         )
         
         if error:
@@ -3,6 +3,7 @@
 from .user_schema import (
     UserRegistrationSchema,
     UserLoginSchema,
+    UserProvisionSchema,
     UserUpdateSchema,
     UserResponseSchema,
     UserPublicSchema,
@@ -35,6 +36,7 @@ from .comment_schema import (
 __all__ = [
     'UserRegistrationSchema',
     'UserLoginSchema',
+    'UserProvisionSchema',
     'UserUpdateSchema',
     'UserResponseSchema',
     'UserPublicSchema',
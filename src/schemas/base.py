@@ -0,0 +1,12 @@
+"""Shared schema base classes."""
+
+from marshmallow import Schema
+from src.utils.server_timing import timed_phase
+
+
+class ResponseSchema(Schema):
+    """Base for response schemas; dump time is reported as the 'serialize' phase."""
+
+    def dump(self, obj, *, many=None):
+        with timed_phase('serialize'):
+            return super().dump(obj, many=many)
@@ -1,6 +1,7 @@
 """Comment validation schemas."""
 
 from marshmallow import Schema, fields, validate
+from src.schemas.base import ResponseSchema
 
 
 class CommentCreateSchema(Schema):
@@ -19,7 +20,7 @@ class CommentUpdateSchema(Schema):
     )
 
 
-class CommentResponseSchema(Schema):
+class CommentResponseSchema(ResponseSchema):
     """Schema for comment response."""
     id = fields.Int(dump_only=True)
     issue_id = fields.Int()
@@ -1,6 +1,7 @@
 """Issue validation schemas."""
 
 from marshmallow import Schema, fields, validate
+from src.schemas.base import ResponseSchema
 
 
 class IssueCreateSchema(Schema):
@@ -10,9 +11,9 @@ class IssueCreateSchema(Schema):
         validate=validate.Length(min=1, max=200)
     )
     description = fields.Str(validate=validate.Length(max=5000))
+    # No default, so an explicit priority can be told from one left to triage
     priority = fields.Str(
-        validate=validate.OneOf(['low', 'medium', 'high', 'critical']),
-        load_default='medium'
+        validate=validate.OneOf(['low', 'medium', 'high', 'critical'])
     )
     status = fields.Str(
         validate=validate.OneOf(['open', 'in_progress', 'resolved', 'closed']),
@@ -32,7 +33,7 @@ class IssueUpdateSchema(Schema):
     )
 
 
-class IssueResponseSchema(Schema):
+class IssueResponseSchema(ResponseSchema):
     """Schema for issue response."""
     id = fields.Int(dump_only=True)
     project_id = fields.Int()
@@ -41,6 +42,8 @@ class IssueResponseSchema(Schema):
     status = fields.Str()
     priority = fields.Str()
     reporter_id = fields.Int()
+    suggested_priority = fields.Str(allow_none=True)
+    suggestion_confidence = fields.Str(allow_none=True)
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
 
@@ -1,6 +1,7 @@
 """Label validation schemas."""
 
 from marshmallow import Schema, fields, validate, validates, ValidationError
+from src.schemas.base import ResponseSchema
 import re
 
 
@@ -34,7 +35,7 @@ class LabelUpdateSchema(Schema):
             raise ValidationError('Color must be a valid hex color code (e.g., #FF0000)')
 
 
-class LabelResponseSchema(Schema):
+class LabelResponseSchema(ResponseSchema):
     """Schema for label response."""
     id = fields.Int(dump_only=True)
     name = fields.Str()
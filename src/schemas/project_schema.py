@@ -1,6 +1,7 @@
 """Project validation schemas."""
 
 from marshmallow import Schema, fields, validate
+from src.schemas.base import ResponseSchema
 
 
 class ProjectCreateSchema(Schema):
@@ -10,6 +11,11 @@ class ProjectCreateSchema(Schema):
         validate=validate.Length(min=1, max=100)
     )
     description = fields.Str(validate=validate.Length(max=2000))
+    auto_triage = fields.Bool(load_default=False)
+    auto_triage_min_confidence = fields.Str(
+        validate=validate.OneOf(['low', 'medium', 'high']),
+        allow_none=True
+    )
 
 
 class ProjectUpdateSchema(Schema):
@@ -17,15 +23,22 @@ class ProjectUpdateSchema(Schema):
     name = fields.Str(validate=validate.Length(min=1, max=100))
     description = fields.Str(validate=validate.Length(max=2000))
     is_active = fields.Bool()
+    auto_triage = fields.Bool()
+    auto_triage_min_confidence = fields.Str(
+        validate=validate.OneOf(['low', 'medium', 'high']),
+        allow_none=True
+    )
 
 
-class ProjectResponseSchema(Schema):
+class ProjectResponseSchema(ResponseSchema):
     """Schema for project response."""
     id = fields.Int(dump_only=True)
     name = fields.Str()
     description = fields.Str()
     owner_id = fields.Int()
     is_active = fields.Bool()
+    auto_triage = fields.Bool()
+    auto_triage_min_confidence = fields.Str(allow_none=True)
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
 
@@ -39,7 +52,7 @@ class ProjectMemberAddSchema(Schema):
     )
 
 
-class ProjectMemberResponseSchema(Schema):
+class ProjectMemberResponseSchema(ResponseSchema):
     """Schema for project member response."""
     id = fields.Int(dump_only=True)
     project_id = fields.Int()
@@ -2,6 +2,7 @@
 
 from marshmallow import Schema, fields, validate, validates, ValidationError
 import re
+from src.schemas.base import ResponseSchema
 
 
 class UserRegistrationSchema(Schema):
@@ -35,6 +36,15 @@ class UserRegistrationSchema(Schema):
             raise ValidationError('Password must contain at least one digit')
 
 
+class UserProvisionSchema(Schema):
+    """Schema for bulk user provisioning."""
+    users = fields.List(
+        fields.Nested(UserRegistrationSchema),
+        required=True,
+        validate=validate.Length(min=1)
+    )
+
+
 class UserLoginSchema(Schema):
     """Schema for user login."""
     username = fields.Str(required=True)
@@ -48,7 +58,7 @@ class UserUpdateSchema(Schema):
     is_active = fields.Bool()
 
 
-class UserResponseSchema(Schema):
+class UserResponseSchema(ResponseSchema):
     """Schema for user response."""
     id = fields.Int(dump_only=True)
     username = fields.Str()
@@ -59,7 +69,7 @@ class UserResponseSchema(Schema):
     updated_at = fields.DateTime(dump_only=True)
 
 
-class UserPublicSchema(Schema):
+class UserPublicSchema(ResponseSchema):
     """Schema for public user info (without email)."""
     id = fields.Int(dump_only=True)
     username = fields.Str()
@@ -5,6 +5,9 @@ from .project_service import ProjectService
 from .issue_service import IssueService
 from .label_service import LabelService
 from .comment_service import CommentService
+from .triage_service import TriageService
+from .backfill_service import BackfillService
+from .revocation_service import TokenRevocationStore, revocation_store
 
 __all__ = [
     'AuthService',
@@ -12,4 +15,8 @@ __all__ = [
     'IssueService',
     'LabelService',
     'CommentService',
+    'TriageService',
+    'BackfillService',
+    'TokenRevocationStore',
+    'revocation_store',
 ]
@@ -1,17 +1,26 @@
 """Authentication service with JWT and password hashing."""
 
-import bcrypt
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from flask import current_app, has_app_context
 from flask_jwt_extended import (
     create_access_token,
     create_refresh_token,
+    decode_token,
     get_jwt_identity,
     get_jwt,
 )
 from src.models import User
+from sqlalchemy.exc import IntegrityError
 from src.repositories import UserRepository
+from src.repositories.user_repository import duplicate_field
+from src.services.membership_claims import build_project_claims
+from src.services.revocation_service import revocation_store
 from src.utils.logger import logger
+from src.utils.login_guard import login_guard
+from src.utils.password_hashing import needs_rehash, password_hasher
+
+DEFAULT_BCRYPT_LOG_ROUNDS = 12
 
 
 class AuthService:
@@ -20,24 +29,31 @@ class AuthService:
     def __init__(self):
         self.user_repo = UserRepository()
     
+    @staticmethod
+    def log_rounds() -> int:
+        """Configured bcrypt cost (BCRYPT_LOG_ROUNDS)."""
+        if has_app_context():
+            return current_app.config.get('BCRYPT_LOG_ROUNDS', DEFAULT_BCRYPT_LOG_ROUNDS)
+        return DEFAULT_BCRYPT_LOG_ROUNDS
+    
     def hash_password(self, password: str) -> str:
         """
-        Hash password using bcrypt.
+        Hash password using bcrypt in the hashing pool.
         
         Args:
             password: Plain text password
         
         Returns:
             Hashed password
+        
+        Raises:
+            HashingBusyError: If the hashing pool is saturated
         """
-        password_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt(rounds=12)
-        hashed = bcrypt.hashpw(password_bytes, salt)
-        return hashed.decode('utf-8')
+        return password_hasher.hash(password, self.log_rounds())
     
     def verify_password(self, password: str, password_hash: str) -> bool:
         """
-        Verify password against hash.
+        Verify password against hash in the hashing pool.
         
         Args:
             password: Plain text password
@@ -45,10 +61,22 @@ class AuthService:
         
         Returns:
             True if password matches, False otherwise
+        
+        Raises:
+            HashingBusyError: If the hashing pool is saturated
         """
-        password_bytes = password.encode('utf-8')
-        hash_bytes = password_hash.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hash_bytes)
+        return password_hasher.verify(password, password_hash)
+    
+    def _upgrade_hash(self, user: User, password: str) -> None:
+        """Rehash a verified password if the configured cost has changed."""
+        rounds = self.log_rounds()
+        if not needs_rehash(user.password_hash, rounds):
+            return
+        try:
+            self.user_repo.update(user.id, password_hash=self.hash_password(password))
+            logger.info("Password hash upgraded", extra={'user_id': user.id, 'rounds': rounds})
+        except Exception as e:
+            logger.warning(f"Could not upgrade password hash for user {user.username}: {str(e)}")
     
     def register(
         self,
@@ -69,36 +97,84 @@ class AuthService:
         Returns:
             Tuple of (User, error_message)
         """
-        # Check if username exists
-        if self.user_repo.username_exists(username):
-            return None, "Username already exists"
-        
-        # Check if email exists
-        if self.user_repo.email_exists(email):
-            return None, "Email already exists"
-        
-        # Hash password
-        password_hash = self.hash_password(password)
-        
-        # Create user
+        user, error = self._insert_user(username, email, self.hash_password(password), role)
+        if user:
+            logger.info("User registered", extra={'username': username})
+        return user, error
+    
+    def _insert_user(
+        self,
+        username: str,
+        email: str,
+        password_hash: str,
+        role: str
+    ) -> Tuple[Optional[User], Optional[str]]:
+        """Insert a user in one statement, mapping unique violations to messages."""
         try:
-            user = self.user_repo.create(
+            user = self.user_repo.insert(
                 username=username,
                 email=email,
                 password_hash=password_hash,
                 role=role,
                 is_active=True
             )
-            logger.info(f"User registered: {username}")
             return user, None
+        except IntegrityError as e:
+            field = duplicate_field(e)
+            if field == 'username':
+                return None, "Username already exists"
+            if field == 'email':
+                return None, "Email already exists"
+            logger.error(f"Error registering user: {str(e)}")
+            return None, "Failed to register user"
         except Exception as e:
             logger.error(f"Error registering user: {str(e)}")
             return None, "Failed to register user"
     
+    def provision_users(self, entries: List[Dict]) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Register a batch of users, e.g. when onboarding a team.
+        
+        Passwords are hashed in parallel across CPU cores first; each user is
+        then inserted through the same single-statement path as register, so
+        one duplicate does not abort the rest of the batch.
+        
+        Args:
+            entries: Dicts with username, email, password and optional role
+        
+        Returns:
+            Tuple of (per-entry results with username, id and error; error_message)
+        """
+        workers = current_app.config.get('PASSWORD_HASH_BULK_WORKERS', 0) if has_app_context() else 0
+        try:
+            hashes = password_hasher.hash_many(
+                [entry['password'] for entry in entries],
+                self.log_rounds(),
+                workers=workers or None
+            )
+        except Exception as e:
+            logger.error(f"Error hashing provisioned passwords: {str(e)}")
+            return [], "Failed to hash passwords"
+        
+        results = []
+        for entry, password_hash in zip(entries, hashes):
+            user, error = self._insert_user(
+                entry['username'],
+                entry['email'],
+                password_hash,
+                entry.get('role', 'developer')
+            )
+            results.append({'username': entry['username'], 'id': user.id if user else None, 'error': error})
+        
+        created = sum(1 for result in results if result['error'] is None)
+        logger.info("Users provisioned", extra={'provisioned': created, 'requested': len(entries)})
+        return results, None
+    
     def login(
         self,
         username: str,
-        password: str
+        password: str,
+        ip_address: Optional[str] = None
     ) -> Tuple[Optional[Dict], Optional[str]]:
         """
         Authenticate user and generate tokens.
@@ -106,24 +182,34 @@ class AuthService:
         Args:
             username: Username
             password: Plain text password
+            ip_address: Client address for login throttling (optional)
         
         Returns:
             Tuple of (tokens_dict, error_message)
+        
+        Raises:
+            LoginThrottledError: If the username or address is locked out
         """
+        # Fail fast while locked out, before any bcrypt work
+        login_guard.check(username, ip_address)
+        
         # Get user by username
         user = self.user_repo.get_by_username(username)
         
-        if not user:
-            return None, "Invalid credentials"
-        
-        # Check if user is active
-        if not user.is_active:
-            return None, "Account is disabled"
+        # Unknown and disabled accounts cost the same as a wrong password
+        if not user or not user.is_active:
+            password_hasher.verify_dummy(password, self.log_rounds())
+            login_guard.record_failure(username, ip_address)
+            return None, "Invalid credentials" if not user else "Account is disabled"
         
         # Verify password
         if not self.verify_password(password, user.password_hash):
+            login_guard.record_failure(username, ip_address)
             return None, "Invalid credentials"
         
+        login_guard.record_success(username, ip_address)
+        self._upgrade_hash(user, password)
+        
         # Generate tokens
         identity = {
             'user_id': user.id,
@@ -131,10 +217,13 @@ class AuthService:
             'role': user.role
         }
         
-        access_token = create_access_token(identity=identity)
+        access_token = create_access_token(
+            identity=identity,
+            additional_claims=build_project_claims(user.id)
+        )
         refresh_token = create_refresh_token(identity=identity)
         
-        logger.info(f"User logged in: {username}")
+        logger.info("User logged in", extra={'username': username})
         
         return {
             'access_token': access_token,
@@ -153,23 +242,26 @@ class AuthService:
         Returns:
             Tuple of (tokens_dict, error_message)
         """
-        # Verify user still exists and is active
-        user = self.user_repo.get_by_id(current_user_identity['user_id'])
+        # Verify user still exists and is active (cached narrow lookup)
+        status = self.user_repo.get_status(current_user_identity['user_id'])
         
-        if not user:
+        if not status:
             return None, "User not found"
         
-        if not user.is_active:
+        if not status.is_active:
             return None, "Account is disabled"
         
-        # Generate new access token
+        # Generate new access token; the role is re-read, the username is immutable
         identity = {
-            'user_id': user.id,
-            'username': user.username,
-            'role': user.role
+            'user_id': status.id,
+            'username': current_user_identity['username'],
+            'role': status.role
         }
         
-        access_token = create_access_token(identity=identity)
+        access_token = create_access_token(
+            identity=identity,
+            additional_claims=build_project_claims(status.id)
+        )
         
         return {
             'access_token': access_token,
@@ -217,11 +309,81 @@ class AuthService:
         # Hash new password
         new_password_hash = self.hash_password(new_password)
         
-        # Update password
+        # Update password and revoke tokens issued with the old one
         try:
             self.user_repo.update(user_id, password_hash=new_password_hash)
-            logger.info(f"Password updated for user: {user.username}")
+            revocation_store.revoke_all(user_id)
+            logger.info("Password updated", extra={'user_id': user.id})
             return True, None
         except Exception as e:
             logger.error(f"Error updating password: {str(e)}")
             return False, "Failed to update password"
+    
+    def logout(
+        self,
+        jwt_payload: Dict,
+        refresh_token: Optional[str] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Revoke the current access token and, optionally, a refresh token.
+        
+        Args:
+            jwt_payload: Decoded claims of the access token
+            refresh_token: Encoded refresh token to revoke as well (optional)
+        
+        Returns:
+            Tuple of (success, error_message)
+        """
+        refresh_payload = None
+        if refresh_token:
+            try:
+                refresh_payload = decode_token(refresh_token)
+            except Exception:
+                return False, "Invalid refresh token"
+            if refresh_payload.get('type') != 'refresh' or refresh_payload.get('sub') != jwt_payload.get('sub'):
+                return False, "Invalid refresh token"
+        
+        try:
+            revocation_store.revoke(jwt_payload)
+            if refresh_payload:
+                revocation_store.revoke(refresh_payload)
+            return True, None
+        except Exception as e:
+            logger.error(f"Error revoking token: {str(e)}")
+            return False, "Failed to revoke token"
+    
+    def revoke_all_tokens(self, user_id: int) -> Tuple[bool, Optional[str]]:
+        """
+        Revoke every access and refresh token issued to a user so far.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if not self.user_repo.get_by_id(user_id):
+            return False, "User not found"
+        
+        try:
+            revocation_store.revoke_all(user_id)
+            logger.info("All tokens revoked", extra={'user_id': user_id})
+            return True, None
+        except Exception as e:
+            logger.error(f"Error revoking tokens: {str(e)}")
+            return False, "Failed to revoke tokens"
+    
+    def deactivate_user(self, user_id: int) -> Tuple[bool, Optional[str]]:
+        """
+        Disable an account and revoke its outstanding tokens.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Tuple of (success, error_message)
+        """
+        user = self.user_repo.update(user_id, is_active=False)
+        if not user:
+            return False, "User not found"
+        return self.revoke_all_tokens(user_id)
@@ -0,0 +1,195 @@
+"""Bulk classification of existing issues."""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from src.repositories import IssueRepository, ProjectRepository
+from src.services.suggest_service import SuggestService
+from src.services.triage_service import CONFIDENCE_LEVELS, meets_confidence
+from src.utils.logger import logger
+from src.utils.resilience import CircuitBreaker
+
+
+def load_checkpoint(path: Optional[str]) -> Dict[str, Any]:
+    """
+    Load a backfill checkpoint.
+
+    Args:
+        path: Checkpoint file path (None disables checkpointing)
+
+    Returns:
+        Checkpoint dict, empty if missing
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: Optional[str], state: Dict[str, Any]) -> None:
+    """Atomically write a backfill checkpoint."""
+    if not path:
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+class BackfillService:
+    """Service for classifying existing issues in bulk."""
+
+    def __init__(self, suggest_service: Optional[SuggestService] = None):
+        self.issue_repo = IssueRepository()
+        self.project_repo = ProjectRepository()
+        self.suggest_service = suggest_service or SuggestService()
+
+    def run(
+        self,
+        chunk_size: int = 200,
+        batch_size: int = 5,
+        concurrency: int = 4,
+        checkpoint_path: Optional[str] = None,
+        limit: Optional[int] = None,
+        max_failed_chunks: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Classify unclassified issues and write suggestions back.
+
+        Issues are read in id-ordered chunks, split into prompts of
+        ``batch_size`` issues, classified by up to ``concurrency`` parallel
+        LLM calls and written back with one batched update per chunk. The
+        last processed id and the ids that failed to classify are
+        checkpointed after every chunk. A resumed run retries the failed
+        ids first and then continues after the last processed id.
+
+        A chunk in which nothing could be classified means the provider is
+        failing rather than the issues. Such a chunk does not move the
+        checkpoint, and the run stops once the LLM circuit breaker is no
+        longer closed or after ``max_failed_chunks`` of them in a row, so an
+        outage neither scans the whole table nor grows the checkpoint.
+
+        Args:
+            chunk_size: Issues read and written per chunk
+            batch_size: Issues per LLM prompt
+            concurrency: Maximum parallel LLM calls
+            checkpoint_path: Checkpoint file (None disables resuming)
+            limit: Stop after this many issues (optional)
+            max_failed_chunks: Consecutive fully failed chunks before stopping
+
+        Returns:
+            Stats dict with counts, elapsed seconds, throughput and whether
+            the run stopped early
+        """
+        checkpoint = load_checkpoint(checkpoint_path)
+        last_id = checkpoint.get('last_id', 0)
+        failed_ids = set(checkpoint.get('failed_ids', []))
+        retry_ids = sorted(failed_ids)
+        stats = {'processed': 0, 'classified': 0, 'failed': 0, 'prompts': 0, 'stopped_early': False}
+        failed_chunks = 0
+        started = time.monotonic()
+
+        if last_id or retry_ids:
+            logger.info("Resuming backfill", extra={'after_issue_id': last_id, 'retrying': len(retry_ids)})
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='backfill') as executor:
+            while limit is None or stats['processed'] < limit:
+                size = chunk_size if limit is None else min(chunk_size, limit - stats['processed'])
+                chunk_start = last_id
+                if retry_ids:
+                    # Issues classified or deleted since the last run are simply dropped
+                    chunk_ids, retry_ids = retry_ids[:size], retry_ids[size:]
+                    failed_ids.difference_update(chunk_ids)
+                    rows = self.issue_repo.get_unclassified_by_ids(chunk_ids)
+                    if not rows:
+                        continue
+                else:
+                    rows = self.issue_repo.get_unclassified_chunk(after_id=last_id, limit=size)
+                    if not rows:
+                        break
+                    last_id = rows[-1].id
+
+                batches = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+                results = executor.map(self._classify_batch, batches)
+                suggestions: Dict[int, dict] = {}
+                for batch_result in results:
+                    suggestions.update(batch_result)
+                stats['prompts'] += len(batches)
+
+                updates = self._build_updates(rows, suggestions)
+                self.issue_repo.bulk_update(updates)
+
+                stats['processed'] += len(rows)
+                stats['classified'] += len(updates)
+                stats['failed'] += len(rows) - len(updates)
+                if not updates:
+                    failed_chunks += 1
+                    if last_id != chunk_start:
+                        # Unclassified issues after the checkpoint are read again by the next run
+                        last_id = chunk_start
+                    else:
+                        failed_ids.update(row.id for row in rows)
+                    save_checkpoint(checkpoint_path, {'last_id': last_id, 'failed_ids': sorted(failed_ids)})
+                    breaker_state = self.suggest_service.breaker.state
+                    if breaker_state != CircuitBreaker.CLOSED or failed_chunks >= max_failed_chunks:
+                        stats['stopped_early'] = True
+                        logger.warning(
+                            "Backfill stopped, provider is failing",
+                            extra={'last_id': last_id, 'failed_chunks': failed_chunks, 'breaker': breaker_state}
+                        )
+                        break
+                    continue
+
+                failed_chunks = 0
+                classified_ids = {update['id'] for update in updates}
+                failed_ids.update(row.id for row in rows if row.id not in classified_ids)
+                save_checkpoint(checkpoint_path, {'last_id': last_id, 'failed_ids': sorted(failed_ids)})
+
+                elapsed = time.monotonic() - started
+                logger.info(
+                    "Backfill progress",
+                    extra={'last_id': last_id, 'processed': stats['processed'],
+                           'classified': stats['classified'],
+                           'rate_per_second': round(stats['processed'] / elapsed, 1)}
+                )
+
+        elapsed = time.monotonic() - started
+        stats['last_id'] = last_id
+        stats['pending_retry'] = len(failed_ids)
+        stats['elapsed'] = round(elapsed, 3)
+        stats['issues_per_second'] = round(stats['processed'] / elapsed, 2) if elapsed > 0 else 0.0
+        return stats
+
+    def _classify_batch(self, rows: List[Any]) -> Dict[int, dict]:
+        """Classify one prompt's worth of issues (runs on a worker thread)."""
+        suggestions, error = self.suggest_service.suggest_batch([
+            {'id': row.id, 'title': row.title, 'description': row.description}
+            for row in rows
+        ])
+        if error:
+            logger.warning(f"Backfill batch starting at issue {rows[0].id} failed: {error}")
+            return {}
+        return suggestions
+
+    def _build_updates(self, rows: List[Any], suggestions: Dict[int, dict]) -> List[Dict[str, Any]]:
+        """Turn suggestions into primary-key update rows, applying project thresholds."""
+        thresholds = self.project_repo.get_triage_thresholds(
+            list({row.project_id for row in rows})
+        )
+        updates = []
+        for row in rows:
+            suggestion = suggestions.get(row.id)
+            if not suggestion:
+                continue
+            confidence = suggestion['confidence'] if suggestion['confidence'] in CONFIDENCE_LEVELS else 'low'
+            update = {
+                'id': row.id,
+                'suggested_priority': suggestion['priority'],
+                'suggestion_confidence': confidence,
+            }
+            if meets_confidence(confidence, thresholds.get(row.project_id)):
+                update['priority'] = suggestion['priority']
+            updates.append(update)
+        return updates
@@ -3,6 +3,7 @@
 from typing import Optional, Tuple
 from src.models import Comment
 from src.repositories import CommentRepository, IssueRepository, ProjectRepository
+from src.services.membership_claims import is_project_admin, is_project_member
 from src.utils.logger import logger
 
 
@@ -37,7 +38,7 @@ class CommentService:
             return None, "Issue not found"
         
         # Check if user is member of the project
-        if not self.project_repo.is_member(issue.project_id, author_id):
+        if not is_project_member(self.project_repo, issue.project_id, author_id):
             return None, "User is not a member of the project"
         
         try:
@@ -46,7 +47,7 @@ class CommentService:
                 author_id=author_id,
                 content=content
             )
-            logger.info(f"Comment created on issue {issue_id} by user {author_id}")
+            logger.info("Comment created", extra={'issue_id': issue_id, 'user_id': author_id})
             return comment, None
         except Exception as e:
             logger.error(f"Error creating comment: {str(e)}")
@@ -83,7 +84,7 @@ class CommentService:
         
         try:
             updated_comment = self.comment_repo.update(comment_id, content=content)
-            logger.info(f"Comment {comment_id} updated")
+            logger.info("Comment updated", extra={'comment_id': comment_id})
             return updated_comment, None
         except Exception as e:
             logger.error(f"Error updating comment: {str(e)}")
@@ -114,7 +115,7 @@ class CommentService:
         
         try:
             self.comment_repo.delete(comment_id)
-            logger.info(f"Comment {comment_id} deleted")
+            logger.info("Comment deleted", extra={'comment_id': comment_id})
             return True, None
         except Exception as e:
             logger.error(f"Error deleting comment: {str(e)}")
@@ -145,8 +146,7 @@ class CommentService:
             return False
         
         # Project admin can modify
-        member = self.project_repo.get_member(issue.project_id, user_id)
-        if member and member.role in ['owner', 'admin']:
+        if is_project_admin(self.project_repo, issue.project_id, user_id):
             return True
         
         return False
@@ -172,4 +172,4 @@ class CommentService:
             return False
         
         # Check if user is member of the project
-        return self.project_repo.is_member(issue.project_id, user_id)
+        return is_project_member(self.project_repo, issue.project_id, user_id)
@@ -3,6 +3,7 @@
 from typing import Dict, List, Optional, Tuple
 from src.models import Issue, Label
 from src.repositories import IssueRepository, ProjectRepository, LabelRepository
+from src.services.membership_claims import is_project_admin, is_project_member
 from src.utils.logger import logger
 
 
@@ -20,7 +21,7 @@ class IssueService:
         title: str,
         reporter_id: int,
         description: Optional[str] = None,
-        priority: str = 'medium',
+        priority: Optional[str] = None,
         status: str = 'open'
     ) -> Tuple[Optional[Issue], Optional[str]]:
         """
@@ -31,7 +32,7 @@ class IssueService:
             title: Issue title
             reporter_id: Reporter user ID
             description: Issue description
-            priority: Priority level
+            priority: Priority level (None for 'medium', which auto-triage may replace)
             status: Issue status
         
         Returns:
@@ -43,7 +44,7 @@ class IssueService:
             return None, "Project not found"
         
         # Verify user is member
-        if not self.project_repo.is_member(project_id, reporter_id):
+        if not is_project_member(self.project_repo, project_id, reporter_id):
             return None, "User is not a member of this project"
         
         try:
@@ -52,14 +53,21 @@ class IssueService:
                 title=title,
                 description=description,
                 reporter_id=reporter_id,
-                priority=priority,
+                priority=priority or 'medium',
                 status=status
             )
-            logger.info(f"Issue created: {title} in project {project_id}")
-            return issue, None
+            logger.info("Issue created", extra={'project_id': project_id})
         except Exception as e:
             logger.error(f"Error creating issue: {str(e)}")
             return None, "Failed to create issue"
+        
+        # Classify in the background once the issue is committed
+        if project.auto_triage:
+            from src.services.triage_service import TriageService
+            # A priority chosen by the reporter is never replaced by a suggestion
+            TriageService().enqueue(issue.id, expected_priority=None if priority else issue.priority)
+        
+        return issue, None
     
     def get_issue(self, issue_id: int) -> Optional[Issue]:
         """Get issue by ID."""
@@ -92,7 +100,7 @@ class IssueService:
         
         try:
             updated_issue = self.issue_repo.update(issue_id, **kwargs)
-            logger.info(f"Issue {issue_id} updated by user {user_id}")
+            logger.info("Issue updated", extra={'issue_id': issue_id, 'user_id': user_id})
             return updated_issue, None
         except Exception as e:
             logger.error(f"Error updating issue: {str(e)}")
@@ -123,7 +131,7 @@ class IssueService:
         
         try:
             self.issue_repo.delete(issue_id)
-            logger.info(f"Issue {issue_id} deleted by user {user_id}")
+            logger.info("Issue deleted", extra={'issue_id': issue_id, 'user_id': user_id})
             return True, None
         except Exception as e:
             logger.error(f"Error deleting issue: {str(e)}")
@@ -164,7 +172,7 @@ class IssueService:
         
         try:
             self.issue_repo.assign_user(issue_id, assignee_id)
-            logger.info(f"User {assignee_id} assigned to issue {issue_id}")
+            logger.info("Issue assigned", extra={'issue_id': issue_id, 'assignee_id': assignee_id})
             return True, None
         except Exception as e:
             logger.error(f"Error assigning user: {str(e)}")
@@ -198,7 +206,7 @@ class IssueService:
         try:
             success = self.issue_repo.unassign_user(issue_id, assignee_id)
             if success:
-                logger.info(f"User {assignee_id} unassigned from issue {issue_id}")
+                logger.info("Issue unassigned", extra={'issue_id': issue_id, 'assignee_id': assignee_id})
                 return True, None
             return False, "User is not assigned to this issue"
         except Exception as e:
@@ -243,7 +251,7 @@ class IssueService:
             issue.labels.append(label)
             from src.models.base import db
             db.session.commit()
-            logger.info(f"Label {label_id} added to issue {issue_id}")
+            logger.info("Issue label added", extra={'issue_id': issue_id, 'label_id': label_id})
             return True, None
         except Exception as e:
             logger.error(f"Error adding label: {str(e)}")
@@ -289,7 +297,7 @@ class IssueService:
             issue.labels.remove(label)
             from src.models.base import db
             db.session.commit()
-            logger.info(f"Label {label_id} removed from issue {issue_id}")
+            logger.info("Issue label removed", extra={'issue_id': issue_id, 'label_id': label_id})
             return True, None
         except Exception as e:
             logger.error(f"Error removing label: {str(e)}")
@@ -321,8 +329,7 @@ class IssueService:
             return True
         
         # Project admin can modify
-        member = self.project_repo.get_member(issue.project_id, user_id)
-        if member and member.role in ['owner', 'admin']:
+        if is_project_admin(self.project_repo, issue.project_id, user_id):
             return True
         
         return False
@@ -347,8 +354,7 @@ class IssueService:
             return True
         
         # Project admin can delete
-        member = self.project_repo.get_member(issue.project_id, user_id)
-        if member and member.role in ['owner', 'admin']:
+        if is_project_admin(self.project_repo, issue.project_id, user_id):
             return True
         
         return False
@@ -369,4 +375,4 @@ class IssueService:
             return False
         
         # Check if user is member of the project
-        return self.project_repo.is_member(issue.project_id, user_id)
+        return is_project_member(self.project_repo, issue.project_id, user_id)
@@ -41,7 +41,7 @@ class LabelService:
         
         try:
             label = self.label_repo.create(name=name, color=color)
-            logger.info(f"Label created: {name}")
+            logger.info("Label created", extra={'label_name': name})
             return label, None
         except Exception as e:
             logger.error(f"Error creating label: {str(e)}")
@@ -89,7 +89,7 @@ class LabelService:
         
         try:
             updated_label = self.label_repo.update(label_id, **kwargs)
-            logger.info(f"Label {label_id} updated")
+            logger.info("Label updated", extra={'label_id': label_id})
             return updated_label, None
         except Exception as e:
             logger.error(f"Error updating label: {str(e)}")
@@ -121,7 +121,7 @@ class LabelService:
         
         try:
             self.label_repo.delete(label_id)
-            logger.info(f"Label {label_id} deleted")
+            logger.info("Label deleted", extra={'label_id': label_id})
             return True, None
         except Exception as e:
             logger.error(f"Error deleting label: {str(e)}")
@@ -0,0 +1,147 @@
+"""Project membership claims embedded in access tokens."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from flask import current_app, has_request_context
+from flask_jwt_extended import get_jwt
+from src.repositories import ProjectRepository, UserRepository
+
+# Single-letter role codes keep the claim small
+ROLE_CODES = {'owner': 'o', 'admin': 'a', 'member': 'm', 'viewer': 'v'}
+CODE_ROLES = {code: role for role, code in ROLE_CODES.items()}
+
+_digest_maps: 'OrderedDict[str, Dict[str, str]]' = OrderedDict()
+_digest_lock = threading.Lock()
+DIGEST_CACHE_SIZE = 1024
+
+
+def memberships_digest(memberships: Dict[str, str]) -> str:
+    """Stable short digest of a project -> role code map."""
+    encoded = json.dumps(memberships, sort_keys=True, separators=(',', ':')).encode()
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+def _load_memberships(user_id: int) -> Dict[str, str]:
+    return {
+        str(project_id): ROLE_CODES.get(role, 'm')
+        for project_id, role in ProjectRepository().get_user_roles(user_id).items()
+    }
+
+
+def build_project_claims(user_id: int) -> Dict:
+    """
+    Additional JWT claims describing the user's project roles.
+
+    Users with at most JWT_PROJECT_CLAIMS_MAX projects get the full map
+    under 'prj'; others get its digest under 'prjd', resolved server-side.
+    Both carry the user's membership epoch under 'pe'.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Claims dict, empty when JWT_PROJECT_CLAIMS is disabled
+    """
+    if not current_app.config.get('JWT_PROJECT_CLAIMS', False):
+        return {}
+
+    epoch = UserRepository().get_membership_epoch(user_id)
+    memberships = _load_memberships(user_id)
+    if len(memberships) <= current_app.config.get('JWT_PROJECT_CLAIMS_MAX', 50):
+        return {'prj': memberships, 'pe': epoch}
+
+    digest = memberships_digest(memberships)
+    _remember_digest(digest, memberships)
+    return {'prjd': digest, 'pe': epoch}
+
+
+def _remember_digest(digest: str, memberships: Dict[str, str]) -> None:
+    with _digest_lock:
+        _digest_maps[digest] = memberships
+        _digest_maps.move_to_end(digest)
+        while len(_digest_maps) > DIGEST_CACHE_SIZE:
+            _digest_maps.popitem(last=False)
+
+
+def _resolve_digest(digest: str, user_id: int) -> Optional[Dict[str, str]]:
+    with _digest_lock:
+        memberships = _digest_maps.get(digest)
+        if memberships is not None:
+            _digest_maps.move_to_end(digest)
+            return memberships
+
+    memberships = _load_memberships(user_id)
+    if memberships_digest(memberships) != digest:
+        return None
+    _remember_digest(digest, memberships)
+    return memberships
+
+
+def _current_epoch(user_id: int) -> Optional[int]:
+    """
+    Membership epoch of the user, served from the user status cache.
+
+    Membership changes in this process invalidate the cached status; a
+    change made by another worker is noticed within USER_STATUS_CACHE_TTL.
+    """
+    status = UserRepository().get_status(user_id)
+    return status.membership_epoch if status else None
+
+
+def claimed_project_role(project_id: int, user_id: int) -> Tuple[bool, Optional[str]]:
+    """
+    Look up the caller's project role in the current access token.
+
+    Claims are used only for the token's own user and only while the token's
+    membership epoch is current; otherwise the caller must query memberships.
+
+    Args:
+        project_id: Project ID
+        user_id: User ID being authorized
+
+    Returns:
+        Tuple of (answered, role). answered is False when claims cannot be
+        trusted; role is None when the user is not a member.
+    """
+    if not has_request_context() or not current_app.config.get('JWT_PROJECT_CLAIMS', False):
+        return False, None
+
+    try:
+        claims = get_jwt()
+    except RuntimeError:
+        return False, None
+
+    identity = claims.get('sub')
+    if not isinstance(identity, dict) or identity.get('user_id') != user_id or 'pe' not in claims:
+        return False, None
+    if claims['pe'] != _current_epoch(user_id):
+        return False, None
+
+    memberships = claims.get('prj')
+    if memberships is None and 'prjd' in claims:
+        memberships = _resolve_digest(claims['prjd'], user_id)
+    if memberships is None:
+        return False, None
+
+    code = memberships.get(str(project_id))
+    return True, CODE_ROLES.get(code) if code else None
+
+
+def is_project_member(project_repo: ProjectRepository, project_id: int, user_id: int) -> bool:
+    """Membership check that prefers token claims over a query."""
+    answered, role = claimed_project_role(project_id, user_id)
+    if answered:
+        return role is not None
+    return project_repo.is_member(project_id, user_id)
+
+
+def is_project_admin(project_repo: ProjectRepository, project_id: int, user_id: int) -> bool:
+    """Owner/admin membership check that prefers token claims over a query."""
+    answered, role = claimed_project_role(project_id, user_id)
+    if answered:
+        return role in ('owner', 'admin')
+    member = project_repo.get_member(project_id, user_id)
+    return bool(member and member.role in ['owner', 'admin'])
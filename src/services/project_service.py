@@ -3,6 +3,7 @@
 from typing import Dict, List, Optional, Tuple
 from src.models import Project, User
 from src.repositories import ProjectRepository, UserRepository
+from src.services.membership_claims import is_project_admin, is_project_member
 from src.utils.logger import logger
 
 
@@ -17,7 +18,9 @@ class ProjectService:
         self,
         name: str,
         owner_id: int,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        auto_triage: bool = False,
+        auto_triage_min_confidence: Optional[str] = None
     ) -> Tuple[Optional[Project], Optional[str]]:
         """
         Create a new project.
@@ -26,6 +29,8 @@ class ProjectService:
             name: Project name
             owner_id: Owner user ID
             description: Project description
+            auto_triage: Classify new issues in the background
+            auto_triage_min_confidence: Confidence at which suggestions are applied
         
         Returns:
             Tuple of (Project, error_message)
@@ -41,13 +46,15 @@ class ProjectService:
                 name=name,
                 owner_id=owner_id,
                 description=description,
-                is_active=True
+                is_active=True,
+                auto_triage=auto_triage,
+                auto_triage_min_confidence=auto_triage_min_confidence
             )
             
             # Automatically add owner as a member with 'owner' role
             self.project_repo.add_member(project.id, owner_id, role='owner')
             
-            logger.info(f"Project created: {name} by user {owner_id}")
+            logger.info("Project created", extra={'project_name': name, 'user_id': owner_id})
             return project, None
         except Exception as e:
             logger.error(f"Error creating project: {str(e)}")
@@ -84,7 +91,7 @@ class ProjectService:
         
         try:
             updated_project = self.project_repo.update(project_id, **kwargs)
-            logger.info(f"Project {project_id} updated by user {user_id}")
+            logger.info("Project updated", extra={'project_id': project_id, 'user_id': user_id})
             return updated_project, None
         except Exception as e:
             logger.error(f"Error updating project: {str(e)}")
@@ -118,7 +125,7 @@ class ProjectService:
         
         try:
             self.project_repo.delete(project_id)
-            logger.info(f"Project {project_id} deleted by user {user_id}")
+            logger.info("Project deleted", extra={'project_id': project_id, 'user_id': user_id})
             return True, None
         except Exception as e:
             logger.error(f"Error deleting project: {str(e)}")
@@ -158,7 +165,7 @@ class ProjectService:
         
         try:
             self.project_repo.add_member(project_id, member_user_id, role)
-            logger.info(f"User {member_user_id} added to project {project_id}")
+            logger.info("Project member added", extra={'project_id': project_id, 'member_id': member_user_id})
             return True, None
         except Exception as e:
             logger.error(f"Error adding member: {str(e)}")
@@ -196,7 +203,7 @@ class ProjectService:
         try:
             success = self.project_repo.remove_member(project_id, member_user_id)
             if success:
-                logger.info(f"User {member_user_id} removed from project {project_id}")
+                logger.info("Project member removed", extra={'project_id': project_id, 'member_id': member_user_id})
                 return True, None
             return False, "Member not found"
         except Exception as e:
@@ -222,9 +229,8 @@ class ProjectService:
         if project.owner_id == user_id:
             return True
         
-        # Check if user is admin member
-        member = self.project_repo.get_member(project_id, user_id)
-        if member and member.role in ['owner', 'admin']:
+        # Check if user is admin member (token claims first)
+        if is_project_admin(self.project_repo, project_id, user_id):
             return True
         
         # Check if user has global admin role
@@ -245,8 +251,8 @@ class ProjectService:
         Returns:
             True if user can access, False otherwise
         """
-        # Check if user is member (includes owner)
-        return self.project_repo.is_member(project_id, user_id)
+        # Check if user is member (includes owner), token claims first
+        return is_project_member(self.project_repo, project_id, user_id)
     
     def get_user_projects(self, user_id: int) -> List[Project]:
         """
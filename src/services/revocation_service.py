@@ -0,0 +1,157 @@
+"""Token revocation store with an in-process Bloom filter in front of the database."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from src.repositories import RevokedTokenRepository, UserRepository
+from src.utils.bloom import BloomFilter
+from src.utils.logger import logger
+
+
+def _token_user_id(jwt_payload: Dict) -> Optional[int]:
+    """User ID from the identity stored in a token's subject."""
+    identity = jwt_payload.get('sub')
+    if isinstance(identity, dict):
+        return identity.get('user_id')
+    return None
+
+
+class TokenRevocationStore:
+    """
+    Answers "is this token revoked?" without a query in the common case.
+
+    Revoked jtis live in the revoked_tokens table. Each process keeps a Bloom
+    filter of them plus a map of per-user ``tokens_valid_after`` watermarks,
+    both refreshed from the database every ``sync_interval`` seconds. A token
+    that is absent from the filter and newer than its user's watermark is
+    accepted from memory; a filter hit is confirmed with an indexed lookup.
+    Revocations made in another worker become visible after the next sync.
+    """
+
+    def __init__(
+        self,
+        sync_interval: float = 30.0,
+        capacity: int = 100000,
+        error_rate: float = 0.001,
+        watermark_horizon: timedelta = timedelta(days=7)
+    ):
+        self.sync_interval = sync_interval
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.watermark_horizon = watermark_horizon
+        self._lock = threading.Lock()
+        self.reset()
+
+    def init_app(self, app) -> None:
+        """Configure sync interval and filter size from app config."""
+        self.sync_interval = app.config.get('REVOCATION_SYNC_INTERVAL', 30.0)
+        self.capacity = app.config.get('REVOCATION_BLOOM_CAPACITY', 100000)
+        self.error_rate = app.config.get('REVOCATION_BLOOM_ERROR_RATE', 0.001)
+        self.watermark_horizon = app.config.get('JWT_REFRESH_TOKEN_EXPIRES', timedelta(days=7))
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop in-process state so the next check reloads from the database."""
+        with self._lock:
+            self._bloom: Optional[BloomFilter] = None
+            self._last_id = 0
+            self._watermarks: Dict[int, float] = {}
+            self._synced_at: Optional[float] = None
+
+    def is_revoked(self, jwt_payload: Dict) -> bool:
+        """
+        Check a decoded token against the blocklist and user watermark.
+
+        Watermarks and the iat of tokens issued by this app have sub-second
+        resolution. Older tokens with a whole-second iat that falls in the
+        watermark's second are treated as revoked.
+
+        Args:
+            jwt_payload: Decoded JWT claims
+
+        Returns:
+            True if the token must be rejected
+        """
+        self._maybe_sync()
+
+        user_id = _token_user_id(jwt_payload)
+        watermark = self._watermarks.get(user_id)
+        if watermark is not None and jwt_payload.get('iat', 0) <= watermark:
+            return True
+
+        jti = jwt_payload.get('jti')
+        if not jti or self._bloom is None or jti not in self._bloom:
+            return False
+
+        try:
+            return RevokedTokenRepository().is_revoked(jti)
+        except Exception as e:
+            logger.error(f"Revocation lookup failed, rejecting token: {str(e)}")
+            return True
+
+    def revoke(self, jwt_payload: Dict) -> None:
+        """
+        Revoke a single token until it expires.
+
+        Args:
+            jwt_payload: Decoded JWT claims
+        """
+        jti = jwt_payload['jti']
+        RevokedTokenRepository().add(
+            jti=jti,
+            expires_at=datetime.fromtimestamp(jwt_payload['exp']),
+            token_type=jwt_payload.get('type', 'access'),
+            user_id=_token_user_id(jwt_payload),
+        )
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+
+    def revoke_all(self, user_id: int) -> datetime:
+        """
+        Revoke every token issued to a user up to now.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            The new tokens_valid_after watermark
+        """
+        watermark = datetime.now()
+        UserRepository().update(user_id, tokens_valid_after=watermark)
+        with self._lock:
+            self._watermarks[user_id] = watermark.timestamp()
+        return watermark
+
+    def sync(self) -> None:
+        """Load new revocations and current watermarks from the database."""
+        with self._lock:
+            if self._bloom is None or self._bloom.saturated:
+                rows = RevokedTokenRepository().get_active_since(0)
+                self._bloom = BloomFilter(max(self.capacity, 2 * len(rows)), self.error_rate)
+            else:
+                rows = RevokedTokenRepository().get_active_since(self._last_id)
+            self._bloom.update(jti for _, jti in rows)
+            if rows:
+                self._last_id = rows[-1][0]
+
+            since = datetime.now() - self.watermark_horizon
+            self._watermarks = {
+                user_id: valid_after.timestamp()
+                for user_id, valid_after in UserRepository().get_token_watermarks(since).items()
+            }
+            self._synced_at = time.monotonic()
+
+    def _maybe_sync(self) -> None:
+        if self._synced_at is not None and time.monotonic() - self._synced_at < self.sync_interval:
+            return
+        try:
+            self.sync()
+        except Exception as e:
+            self._synced_at = time.monotonic()
+            logger.warning(f"Revocation sync failed, using cached state: {str(e)}")
+
+
+# Shared per-process store, configured by create_app
+revocation_store = TokenRevocationStore()
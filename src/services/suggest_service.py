@@ -2,8 +2,23 @@
 
 import json
 import os
-from typing import Optional
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
 from src.utils.logger import logger
+from src.utils.metrics import record_llm_call
+from src.utils.deadlines import remaining_time
+from src.utils.server_timing import record_phase
+from src.utils.tracing import tracing
+from src.utils.prompt_compaction import CompactionResult, compact_description
+from src.utils.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    RetryPolicy,
+    call_with_resilience,
+)
 
 
 SYSTEM_PROMPT = (
@@ -12,9 +27,7 @@ SYSTEM_PROMPT = (
     "No explanations, no markdown, no code blocks."
 )
 
-CLASSIFY_TEMPLATE = """Classify the following software issue.
-
-Priority definitions:
+CLASSIFICATION_GUIDE = """Priority definitions:
 - "critical": system down, data loss, security breach, complete feature failure blocking all users
 - "high": important feature broken with no workaround, significant performance degradation
 - "medium": feature partially broken, workaround exists, moderate impact
@@ -24,7 +37,11 @@ Status definitions:
 - "open": new issue, not yet triaged
 - "in_progress": actively being worked on
 - "resolved": fix implemented, pending verification
-- "closed": verified fixed or rejected
+- "closed": verified fixed or rejected"""
+
+CLASSIFY_TEMPLATE = """Classify the following software issue.
+
+""" + CLASSIFICATION_GUIDE + """
 
 Issue title: {title}
 Issue description: {description}
@@ -35,10 +52,175 @@ Respond ONLY with a JSON object with these exact fields:
 - confidence: string (high | medium | low)
 - reason: string (one sentence explaining the classification)"""
 
+CLASSIFY_BATCH_TEMPLATE = """Classify each of the following software issues independently.
+
+""" + CLASSIFICATION_GUIDE + """
+
+{issues}
+
+Respond ONLY with a JSON array containing one object per issue, with these exact fields:
+- id: integer (the issue id shown above)
+- priority: string (critical | high | medium | low)
+- status: string (open | in_progress | resolved | closed)
+- confidence: string (high | medium | low)
+- reason: string (one sentence explaining the classification)"""
+
+BATCH_ITEM_TEMPLATE = """Issue id: {id}
+Issue title: {title}
+Issue description: {description}"""
+
+
+# Generic severity and issue-type signals for the local fallback classifier,
+# checked in order and matched on word boundaries.
+HEURISTIC_RULES = (
+    ("critical", (
+        "security", "vulnerability", "exploit", "breach", "unauthorized access",
+        "data loss", "data corruption", "outage", "downtime", "production down",
+    )),
+    ("high", (
+        "crash", "crashes", "crashed", "error", "errors", "exception", "traceback",
+        "fatal", "deadlock", "memory leak", "timeout", "regression", "broken",
+    )),
+    ("low", (
+        "typo", "spelling", "docs", "documentation", "readme", "wording",
+        "cosmetic", "feature request", "enhancement", "proposal",
+    )),
+)
+
+_HEURISTIC_PATTERNS = tuple(
+    (priority, tuple((keyword, re.compile(rf"\b{re.escape(keyword)}\b")) for keyword in keywords))
+    for priority, keywords in HEURISTIC_RULES
+)
+
+# Process-wide breaker shared by every SuggestService instance.
+llm_breaker = CircuitBreaker(
+    failure_threshold=int(os.getenv("SUGGEST_BREAKER_THRESHOLD", "5")),
+    reset_timeout=float(os.getenv("SUGGEST_BREAKER_RESET", "30")),
+)
+
+
+# Provider clients, one per process and (base_url, api_key, timeout). Reusing a
+# client keeps its TLS context and keep-alive connections across calls.
+_clients: Dict[tuple, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def llm_client(base_url: Optional[str], api_key: Optional[str], timeout: float):
+    """
+    Shared OpenAI client for the given settings, created on first use.
+
+    Clients are keyed by process id as well, so a worker forked from a
+    process that already had one builds its own connection pool.
+
+    Args:
+        base_url: Provider base URL (None for the SDK default)
+        api_key: Provider API key
+        timeout: Default request timeout in seconds
+
+    Returns:
+        openai.OpenAI client
+    """
+    key = (os.getpid(), base_url, api_key, timeout)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            from openai import OpenAI
+            # Retries are handled by the resilience layer, not the SDK
+            client = OpenAI(api_key=api_key, base_url=base_url, timeout=timeout, max_retries=0)
+            _clients[key] = client
+        return client
+
+
+def _transient_errors() -> tuple:
+    """Provider errors worth retrying (imported lazily with the SDK)."""
+    import openai
+    return (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)
+
+
+def _timeout_errors() -> tuple:
+    """Deadline and SDK request timeouts, reported as timeouts rather than outages."""
+    import openai
+    return (DeadlineExceededError, openai.APITimeoutError)
+
+
+def _strip_code_fence(raw: str) -> str:
+    """Strip markdown code blocks if the model adds them."""
+    clean = raw.strip()
+    if clean.startswith("```"):
+        clean = "\n".join(clean.split("\n")[1:])
+    if clean.endswith("```"):
+        clean = "\n".join(clean.split("\n")[:-1])
+    return clean.strip()
+
+
+def heuristic_suggest(title: str, description: Optional[str] = None) -> dict:
+    """
+    Classify an issue with local keyword rules, without calling the LLM.
+
+    Args:
+        title: Issue title
+        description: Issue description (optional)
+
+    Returns:
+        Suggestion dict with the same fields as the LLM classifier
+    """
+    text = f"{title} {description or ''}".lower()
+    for priority, patterns in _HEURISTIC_PATTERNS:
+        matched = next((keyword for keyword, pattern in patterns if pattern.search(text)), None)
+        if matched:
+            return {
+                "priority": priority,
+                "status": "open",
+                "confidence": "low",
+                "reason": f"Heuristic fallback matched '{matched}'.",
+                "source": "heuristic",
+            }
+    return {
+        "priority": "medium",
+        "status": "open",
+        "confidence": "low",
+        "reason": "Heuristic fallback found no strong signal.",
+        "source": "heuristic",
+    }
+
 
 class SuggestService:
     """Service for AI-powered issue classification suggestions."""
 
+    def __init__(
+        self,
+        breaker: Optional[CircuitBreaker] = None,
+        compaction: Optional[bool] = None,
+    ):
+        self.breaker = breaker or llm_breaker
+        if compaction is None:
+            compaction = os.getenv("SUGGEST_COMPACTION", "true").lower() == "true"
+        self.compaction = compaction
+        self.last_compaction: Optional[CompactionResult] = None
+
+    def _prepare_description(self, description: Optional[str]) -> str:
+        """Compact the description to the configured token budget."""
+        if not description:
+            return "(no description provided)"
+        if not self.compaction:
+            return description
+
+        result = compact_description(
+            description,
+            token_budget=int(os.getenv("SUGGEST_TOKEN_BUDGET", "400")),
+            max_stack_frames=int(os.getenv("SUGGEST_MAX_STACK_FRAMES", "5")),
+        )
+        self.last_compaction = result
+        logger.info(
+            "Prompt compacted",
+            extra={'tokens_before': result.tokens_before, 'tokens_after': result.tokens_after,
+                   'tokens_saved': result.tokens_saved}
+        )
+        return result.text
+
     def suggest(
         self,
         title: str,
@@ -47,6 +229,16 @@ class SuggestService:
         """
         Suggest priority and status for an issue using LLM.
 
+        The provider call runs under a deadline (SUGGEST_TIMEOUT) with bounded,
+        jittered retries (SUGGEST_MAX_RETRIES), an optional hedged duplicate
+        (SUGGEST_HEDGE_DELAY) and a circuit breaker. When the breaker is open or
+        the call keeps failing, the heuristic classifier is used if
+        SUGGEST_FALLBACK=heuristic, otherwise an error is returned.
+
+        Long descriptions are compacted first (deduplicated log lines,
+        shortened stack traces, SUGGEST_TOKEN_BUDGET) unless
+        SUGGEST_COMPACTION=false.
+
         Args:
             title: Issue title
             description: Issue description (optional)
@@ -55,62 +247,194 @@ class SuggestService:
             Tuple of (suggestion_dict, error_message)
         """
         try:
-            from openai import OpenAI
-
-            api_key = os.getenv("OPENAI_API_KEY")
-            base_url = os.getenv("OPENAI_BASE_URL")
-            model = os.getenv("SUGGEST_MODEL", "llama-3.3-70b-versatile")
-
-            if not api_key:
+            if not os.getenv("OPENAI_API_KEY"):
                 return {}, "OPENAI_API_KEY not configured"
 
-            client = OpenAI(api_key=api_key, base_url=base_url or None)
-
             prompt = CLASSIFY_TEMPLATE.format(
                 title=title,
-                description=description or "(no description provided)",
+                description=self._prepare_description(description),
             )
 
-            response = client.chat.completions.create(
+            try:
+                raw = self._complete(prompt, max_tokens=256)
+            except CircuitOpenError:
+                logger.warning("LLM circuit breaker open, skipping provider call")
+                return self._fallback(title, description, "Classification service temporarily unavailable")
+            except _timeout_errors():
+                logger.warning("LLM call exceeded its deadline")
+                return self._fallback(title, description, "Classification timed out")
+            except _transient_errors() as e:
+                logger.warning(f"LLM call failed after retries: {e}")
+                return self._fallback(title, description, "Classification service temporarily unavailable")
+
+            suggestion = self._normalize(json.loads(_strip_code_fence(raw or "{}")))
+
+            logger.info("Issue classified", extra={'priority': suggestion['priority'], 'confidence': suggestion['confidence']})
+            return suggestion, None
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse LLM response: {e}")
+            return {}, "Failed to parse classification response"
+        except Exception as e:
+            logger.error(f"Suggest service error: {e}")
+            return {}, f"Classification failed: {str(e)}"
+
+    def suggest_batch(
+        self,
+        issues: List[Dict[str, Any]],
+    ) -> tuple[Dict[int, dict], Optional[str]]:
+        """
+        Classify several issues with a single LLM prompt.
+
+        Uses the same resilience settings as suggest(). Issues missing from
+        the model's answer are simply absent from the result.
+
+        Args:
+            issues: Dicts with 'id', 'title' and optional 'description'
+
+        Returns:
+            Tuple of (suggestions keyed by issue id, error_message)
+        """
+        if not issues:
+            return {}, None
+
+        try:
+            if not os.getenv("OPENAI_API_KEY"):
+                return {}, "OPENAI_API_KEY not configured"
+
+            blocks = [
+                BATCH_ITEM_TEMPLATE.format(
+                    id=issue["id"],
+                    title=issue["title"],
+                    description=self._prepare_description(issue.get("description")),
+                )
+                for issue in issues
+            ]
+            prompt = CLASSIFY_BATCH_TEMPLATE.format(issues="\n\n".join(blocks))
+
+            try:
+                raw = self._complete(prompt, max_tokens=64 + 96 * len(issues), operation="batch")
+            except (CircuitOpenError, DeadlineExceededError) + _transient_errors() as e:
+                logger.warning(f"Batch classification failed: {e}")
+                return {}, "Classification service temporarily unavailable"
+
+            parsed = json.loads(_strip_code_fence(raw or "[]"))
+            if isinstance(parsed, dict):
+                parsed = parsed.get("issues", [])
+
+            wanted = {issue["id"] for issue in issues}
+            suggestions = {}
+            for item in parsed:
+                if not isinstance(item, dict):
+                    continue
+                try:
+                    issue_id = int(item.get("id"))
+                except (TypeError, ValueError):
+                    continue
+                if issue_id in wanted:
+                    suggestions[issue_id] = self._normalize(item)
+
+            logger.info("Batch classified", extra={'requested': len(issues), 'returned': len(suggestions)})
+            return suggestions, None
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse batch LLM response: {e}")
+            return {}, "Failed to parse classification response"
+        except Exception as e:
+            logger.error(f"Suggest service error: {e}")
+            return {}, f"Classification failed: {str(e)}"
+
+    def _complete(self, prompt: str, max_tokens: int, operation: str = "suggest") -> str:
+        """
+        Send a prompt to the provider through the resilience layer.
+
+        Each call is counted in llm_calls_total by operation and outcome
+        and its duration is reported as the request's 'llm' phase. When
+        tracing is enabled the call gets an 'llm.chat' span.
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+            DeadlineExceededError: If SUGGEST_TIMEOUT or the request's time budget elapses
+            openai.APIError: On provider errors that survive retries
+        """
+        model = os.getenv("SUGGEST_MODEL", "llama-3.3-70b-versatile")
+        timeout = float(os.getenv("SUGGEST_TIMEOUT", "10"))
+        client = llm_client(os.getenv("OPENAI_BASE_URL") or None, os.getenv("OPENAI_API_KEY"), timeout)
+
+        def create(timeout: float):
+            return client.chat.completions.create(
                 model=model,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
                 temperature=0.0,
-                max_tokens=256,
+                max_tokens=max_tokens,
+                timeout=timeout,
             )
 
-            raw = response.choices[0].message.content or "{}"
-
-            # Strip markdown code blocks if model adds them
-            clean = raw.strip()
-            if clean.startswith("```"):
-                clean = "\n".join(clean.split("\n")[1:])
-            if clean.endswith("```"):
-                clean = "\n".join(clean.split("\n")[:-1])
-
-            suggestion = json.loads(clean.strip())
+        # Never outlive the request's time budget
+        deadline = timeout
+        remaining = remaining_time()
+        if remaining is not None:
+            deadline = max(0.0, min(deadline, remaining))
 
-            # Validate required fields
-            valid_priorities = {"critical", "high", "medium", "low"}
-            valid_statuses = {"open", "in_progress", "resolved", "closed"}
+        started = time.perf_counter()
+        outcome = "error"
+        with tracing.span("llm.chat", **{
+            "gen_ai.operation.name": operation,
+            "gen_ai.request.model": model,
+            "gen_ai.request.max_tokens": max_tokens,
+        }) as span:
+            try:
+                response = call_with_resilience(
+                    create,
+                    deadline=deadline,
+                    retry=RetryPolicy(
+                        max_attempts=int(os.getenv("SUGGEST_MAX_RETRIES", "2")) + 1,
+                        retry_on=_transient_errors(),
+                    ),
+                    breaker=self.breaker,
+                    hedge_delay=float(os.getenv("SUGGEST_HEDGE_DELAY", "0")) or None,
+                )
+                outcome = "ok"
+            except CircuitOpenError:
+                outcome = "circuit_open"
+                raise
+            except _timeout_errors():
+                outcome = "timeout"
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                record_llm_call(operation, outcome, elapsed)
+                record_phase('llm', elapsed)
+                if span is not None:
+                    span.set_attribute("llm.outcome", outcome)
+        return response.choices[0].message.content
 
-            if suggestion.get("priority") not in valid_priorities:
-                suggestion["priority"] = "medium"
-            if suggestion.get("status") not in valid_statuses:
-                suggestion["status"] = "open"
-            if "confidence" not in suggestion:
-                suggestion["confidence"] = "medium"
-            if "reason" not in suggestion:
-                suggestion["reason"] = ""
+    @staticmethod
+    def _normalize(suggestion: dict) -> dict:
+        """Fill in defaults for missing or invalid suggestion fields."""
+        valid_priorities = {"critical", "high", "medium", "low"}
+        valid_statuses = {"open", "in_progress", "resolved", "closed"}
 
-            logger.info(f"Issue classified: priority={suggestion['priority']} confidence={suggestion['confidence']}")
-            return suggestion, None
+        if suggestion.get("priority") not in valid_priorities:
+            suggestion["priority"] = "medium"
+        if suggestion.get("status") not in valid_statuses:
+            suggestion["status"] = "open"
+        if "confidence" not in suggestion:
+            suggestion["confidence"] = "medium"
+        if "reason" not in suggestion:
+            suggestion["reason"] = ""
+        return suggestion
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response: {e}")
-            return {}, "Failed to parse classification response"
-        except Exception as e:
-            logger.error(f"Suggest service error: {e}")
-            return {}, f"Classification failed: {str(e)}"
\ No newline at end of file
+    def _fallback(
+        self,
+        title: str,
+        description: Optional[str],
+        error: str,
+    ) -> tuple[dict, Optional[str]]:
+        """Return the heuristic suggestion if enabled, otherwise the error."""
+        if os.getenv("SUGGEST_FALLBACK", "none").lower() == "heuristic":
+            return heuristic_suggest(title, description), None
+        return {}, error
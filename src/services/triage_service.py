@@ -0,0 +1,139 @@
+"""Background triage service that classifies new issues with the LLM."""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+from flask import current_app
+from src.models import Issue
+from src.repositories import IssueRepository, ProjectRepository
+from src.utils.logger import logger
+
+CONFIDENCE_LEVELS = {'low': 0, 'medium': 1, 'high': 2}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the triage thread pool, recreating it after a fork."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv('TRIAGE_WORKERS', '2')),
+                thread_name_prefix='triage'
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def meets_confidence(confidence: Optional[str], min_confidence: Optional[str]) -> bool:
+    """
+    Check if a suggestion confidence reaches a project's auto-apply threshold.
+
+    Args:
+        confidence: Suggestion confidence (low, medium, high)
+        min_confidence: Project threshold, or None to never auto-apply
+
+    Returns:
+        True if the suggestion should be applied
+    """
+    if min_confidence is None or confidence not in CONFIDENCE_LEVELS:
+        return False
+    return CONFIDENCE_LEVELS[confidence] >= CONFIDENCE_LEVELS.get(min_confidence, len(CONFIDENCE_LEVELS))
+
+
+class TriageService:
+    """Service for automatic issue classification."""
+
+    def __init__(self):
+        self.issue_repo = IssueRepository()
+        self.project_repo = ProjectRepository()
+
+    def enqueue(self, issue_id: int, expected_priority: Optional[str] = None) -> Optional[Future]:
+        """
+        Schedule classification of an issue without blocking the caller.
+
+        Args:
+            issue_id: Issue ID
+            expected_priority: Priority at enqueue time that an auto-applied
+                suggestion may replace (None never replaces the priority)
+
+        Returns:
+            Future of the triage result, or None if scheduling failed
+        """
+        try:
+            app = current_app._get_current_object()
+            return _get_executor().submit(self._run_in_context, app, issue_id, expected_priority)
+        except Exception as e:
+            logger.error(f"Failed to enqueue triage for issue {issue_id}: {str(e)}")
+            return None
+
+    def _run_in_context(self, app, issue_id: int,
+                        expected_priority: Optional[str]) -> Tuple[Optional[Issue], Optional[str]]:
+        with app.app_context():
+            try:
+                return TriageService().triage_issue(issue_id, expected_priority)
+            except Exception as e:
+                logger.error(f"Triage failed for issue {issue_id}: {str(e)}")
+                from src.models.base import db
+                db.session.rollback()
+                return None, "Triage failed"
+
+    def triage_issue(self, issue_id: int,
+                     expected_priority: Optional[str] = None) -> Tuple[Optional[Issue], Optional[str]]:
+        """
+        Classify an issue and store the suggestion on it.
+
+        The suggested priority is also applied when the project has an
+        auto-apply threshold and the suggestion confidence reaches it, but
+        only as a compare-and-set against ``expected_priority``: a priority
+        edited since triage was queued is kept.
+
+        Args:
+            issue_id: Issue ID
+            expected_priority: Priority the suggestion may replace (None
+                stores the suggestion without applying it)
+
+        Returns:
+            Tuple of (Issue, error_message)
+        """
+        from src.services.suggest_service import SuggestService
+
+        issue = self.issue_repo.get_by_id(issue_id)
+        if not issue:
+            return None, "Issue not found"
+
+        suggestion, error = SuggestService().suggest(
+            title=issue.title,
+            description=issue.description,
+        )
+        if error:
+            logger.warning(f"Triage skipped for issue {issue_id}: {error}")
+            return None, error
+
+        confidence = suggestion['confidence'] if suggestion['confidence'] in CONFIDENCE_LEVELS else 'low'
+        applied = False
+        project = self.project_repo.get_by_id(issue.project_id)
+        if (expected_priority is not None and project
+                and meets_confidence(confidence, project.auto_triage_min_confidence)):
+            applied = self.issue_repo.update_priority_if(issue_id, expected_priority, suggestion['priority'])
+            if not applied:
+                logger.info(
+                    "Suggested priority not applied, priority changed since triage was queued",
+                    extra={'issue_id': issue_id, 'expected_priority': expected_priority}
+                )
+
+        updated_issue = self.issue_repo.update(
+            issue_id,
+            suggested_priority=suggestion['priority'],
+            suggestion_confidence=confidence,
+        )
+        logger.info(
+            "Issue triaged",
+            extra={'issue_id': issue_id, 'suggested_priority': suggestion['priority'],
+                   'confidence': confidence, 'applied': applied}
+        )
+        return updated_issue, None
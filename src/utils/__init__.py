@@ -1,6 +1,6 @@
 """Utils package."""
 
-from .logger import logger, setup_logger
+from .logger import current_request_id, logger, setup_logger
 from .pagination import (
     get_pagination_params,
     build_pagination_response,
@@ -18,10 +18,32 @@ from .responses import (
     conflict_response,
     internal_error_response,
 )
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    RetryPolicy,
+    call_with_resilience,
+)
+from .bloom import BloomFilter
+from .token_cache import VerifiedTokenCache, token_cache
+from .login_guard import LoginGuard, LoginThrottledError, login_guard
+from .password_hashing import (
+    HashingBusyError,
+    PasswordHasher,
+    password_hasher,
+)
+from .rate_limit_storage import SQLiteStorage
+from .profiling import RequestProfiler, profile_signature, request_profiler
+from .server_timing import ServerTiming, record_phase, server_timing, timed_phase
+from .tracing import Tracing, tracing
+from .readiness import ReadinessMonitor, readiness_monitor
+from .db_pool import TimedQueuePool, engine_options, pool_size_for, warm_pool
 
 __all__ = [
     'logger',
     'setup_logger',
+    'current_request_id',
     'get_pagination_params',
     'build_pagination_response',
     'Pagination',
@@ -35,4 +57,34 @@ __all__ = [
     'not_found_response',
     'conflict_response',
     'internal_error_response',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'DeadlineExceededError',
+    'RetryPolicy',
+    'call_with_resilience',
+    'HashingBusyError',
+    'PasswordHasher',
+    'password_hasher',
+    'SQLiteStorage',
+    'LoginGuard',
+    'LoginThrottledError',
+    'login_guard',
+    'VerifiedTokenCache',
+    'token_cache',
+    'BloomFilter',
+    'RequestProfiler',
+    'profile_signature',
+    'request_profiler',
+    'ServerTiming',
+    'record_phase',
+    'server_timing',
+    'timed_phase',
+    'Tracing',
+    'tracing',
+    'ReadinessMonitor',
+    'readiness_monitor',
+    'TimedQueuePool',
+    'engine_options',
+    'pool_size_for',
+    'warm_pool',
 ]
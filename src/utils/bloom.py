@@ -0,0 +1,49 @@
+"""Compact Bloom filter for in-process membership pre-checks."""
+
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Probabilistic set with no false negatives.
+
+    Sized for ``capacity`` items at ``error_rate`` false positives; bit
+    positions come from double hashing a single SHA-256 digest.
+    """
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.sha256(item.encode('utf-8')).digest()
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:16], 'big') | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        """Insert an item."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """Insert several items."""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def saturated(self) -> bool:
+        """True once more items than planned were added."""
+        return self.count > self.capacity
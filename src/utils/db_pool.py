@@ -0,0 +1,189 @@
+"""
+Connection pool sizing, warm-up and checkout wait telemetry.
+
+Pool sizes are derived from how many requests a worker can run at once
+(``WEB_THREADS``; 1 for sync workers) plus the background threads that use
+the database, then capped so that ``WEB_CONCURRENCY`` workers stay within
+``DB_MAX_CONNECTIONS`` in total. ``DB_POOL_SIZE`` and ``DB_MAX_OVERFLOW``
+override the derived values.
+
+With ``DB_PGBOUNCER`` the app runs behind a transaction-mode pooler. It then
+keeps no pool of its own, and it disables driver-side prepared statements,
+because a transaction pooler may run consecutive transactions of one client
+on different server connections.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from src.utils.logger import logger
+from src.utils.metrics import DB_POOL_TIMEOUTS, DB_POOL_WAIT
+
+
+class PoolPressure:
+    """Checkouts currently waiting and a moving average of checkout wait time."""
+
+    def __init__(self, smoothing: float = 0.2):
+        self.smoothing = smoothing
+        self.waiting = 0
+        self.average_wait = 0.0
+        self.last_sample = 0.0
+        self._lock = threading.Lock()
+
+    def enter(self) -> None:
+        with self._lock:
+            self.waiting += 1
+
+    def exit(self, seconds: float) -> None:
+        with self._lock:
+            self.waiting -= 1
+            self.average_wait += self.smoothing * (seconds - self.average_wait)
+            self.last_sample = time.monotonic()
+
+    def congested(self, threshold: float, window: float) -> bool:
+        """
+        Whether checkouts wait at least ``threshold`` seconds on average.
+
+        The average only moves when connections are checked out, so it is
+        trusted while checkouts are waiting or for ``window`` seconds after
+        the last one.
+        """
+        if self.average_wait < threshold:
+            return False
+        return self.waiting > 0 or time.monotonic() - self.last_sample < window
+
+    def reset(self) -> None:
+        with self._lock:
+            self.waiting = 0
+            self.average_wait = 0.0
+            self.last_sample = 0.0
+
+
+# Pressure on this process's TimedQueuePools, read by admission control
+pool_pressure = PoolPressure()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that observes how long checkouts wait for a free connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        pool_pressure.enter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            pool_pressure.exit(waited)
+            DB_POOL_WAIT.observe(waited)
+
+
+def pool_size_for(config) -> Dict[str, int]:
+    """
+    Pool size and overflow for one worker process.
+
+    Args:
+        config: Flask config mapping
+
+    Returns:
+        Dict with 'pool_size' and 'max_overflow'
+    """
+    workers = max(1, int(config.get('WEB_CONCURRENCY', 1)))
+    threads = max(1, int(config.get('WEB_THREADS', 1)))
+    background = max(0, int(os.getenv('TRIAGE_WORKERS', '2')))
+
+    # One connection per request thread, one for readiness/EXPLAIN helpers,
+    # and overflow for bursts of background triage work
+    pool_size = threads + 1
+    max_overflow = background
+
+    max_connections = config.get('DB_MAX_CONNECTIONS')
+    if max_connections:
+        per_worker = max(1, int(max_connections) // workers)
+        pool_size = min(pool_size, per_worker)
+        max_overflow = max(0, min(max_overflow, per_worker - pool_size))
+
+    if config.get('DB_POOL_SIZE') is not None:
+        pool_size = int(config['DB_POOL_SIZE'])
+    if config.get('DB_MAX_OVERFLOW') is not None:
+        max_overflow = int(config['DB_MAX_OVERFLOW'])
+    return {'pool_size': pool_size, 'max_overflow': max_overflow}
+
+
+def engine_options(config) -> Dict[str, Any]:
+    """
+    SQLALCHEMY_ENGINE_OPTIONS with workload-derived pool settings.
+
+    SQLite databases keep the configured options unchanged.
+
+    Args:
+        config: Flask config mapping
+
+    Returns:
+        Engine options for Flask-SQLAlchemy
+    """
+    options = dict(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    uri = config.get('SQLALCHEMY_DATABASE_URI') or ''
+    if not uri or uri.startswith('sqlite'):
+        return options
+
+    for key in ('pool_size', 'max_overflow', 'pool_timeout', 'poolclass'):
+        options.pop(key, None)
+
+    if config.get('DB_PGBOUNCER', False):
+        options['poolclass'] = NullPool
+        options.pop('pool_recycle', None)
+        options.pop('pool_pre_ping', None)
+        driver = make_url(uri).get_driver_name()
+        connect_args = dict(options.get('connect_args') or {})
+        if driver == 'psycopg':
+            # psycopg 3 prepares repeated statements server-side by default
+            connect_args['prepare_threshold'] = None
+        elif driver == 'asyncpg':
+            connect_args['statement_cache_size'] = 0
+        # psycopg2 never uses server-side prepared statements
+        if connect_args:
+            options['connect_args'] = connect_args
+        return options
+
+    options.update(pool_size_for(config))
+    options['poolclass'] = TimedQueuePool
+    options['pool_timeout'] = float(config.get('DB_POOL_TIMEOUT', 10))
+    return options
+
+
+def warm_pool(engine, connections: int) -> int:
+    """
+    Open up to ``connections`` pooled connections ahead of the first requests.
+
+    Call once per worker process after it has forked.
+
+    Args:
+        engine: Engine whose pool to fill
+        connections: Connections to open, capped at the pool size
+
+    Returns:
+        Number of connections opened
+    """
+    size = getattr(engine.pool, 'size', None)
+    if not callable(size) or connections <= 0:
+        return 0
+    held = []
+    try:
+        for _ in range(min(connections, size())):
+            held.append(engine.connect())
+    except Exception as e:
+        logger.warning(f"Pool warm-up stopped early: {str(e)}")
+    finally:
+        for connection in held:
+            connection.close()
+    logger.info("Database pool warmed", extra={'connections': len(held), 'pid': os.getpid()})
+    return len(held)
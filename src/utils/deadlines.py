@@ -0,0 +1,192 @@
+"""
+Per-request time budgets enforced on database statements and LLM calls.
+
+Every request gets a deadline from ``TIME_BUDGETS``: the budget of its
+expensive-endpoint class (the ``limit_class`` declared with ``rate_cost``), or
+``'default'``. Work done for the request is bounded by the time left:
+
+* PostgreSQL transactions start with ``SET LOCAL statement_timeout``, which
+  is transaction-scoped and so also safe behind PgBouncer.
+* SQLite connections get a progress handler that interrupts the running
+  statement once the deadline has passed.
+* The LLM call uses the time left as its deadline when that is shorter than
+  ``SUGGEST_TIMEOUT``.
+
+A request that fails after running out of time gets a 504. Its session is
+rolled back so the connection goes back to the pool.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from flask import current_app, has_request_context, request
+from prometheus_client import Counter
+from sqlalchemy import event
+
+from src.utils.logger import logger
+
+_TOKEN_ENVIRON = 'issue_tracker.deadline_token'
+_BUDGET_ENVIRON = 'issue_tracker.deadline_budget'
+_EXPIRED_ENVIRON = 'issue_tracker.deadline_expired'
+
+# SQLite VM instructions between deadline checks
+_PROGRESS_STEPS = 1000
+# PostgreSQL query_canceled, raised when statement_timeout fires
+_QUERY_CANCELED = '57014'
+
+_deadline: ContextVar[Optional[float]] = ContextVar('issue_tracker_deadline', default=None)
+
+DEADLINES_EXCEEDED = Counter(
+    'request_deadline_exceeded_total',
+    'Requests answered with 504 after exhausting their time budget',
+    ['budget'],
+)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Seconds left before the current deadline.
+
+    Returns:
+        Seconds left (negative once expired), or None without a deadline
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[None]:
+    """
+    Run a block under a time budget outside a request (CLI commands, jobs).
+
+    Args:
+        seconds: Budget for the block
+    """
+    token = _deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _interrupt_if_expired() -> int:
+    deadline = _deadline.get()
+    return int(deadline is not None and time.monotonic() >= deadline)
+
+
+def _on_begin(conn) -> None:
+    """Bound the transaction that is starting by the time left."""
+    remaining = remaining_time()
+    if remaining is None:
+        return
+    dbapi_connection = conn.connection.dbapi_connection
+    if conn.dialect.name == 'postgresql':
+        # Run on the DBAPI cursor; it opens the transaction the setting is scoped to
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"SET LOCAL statement_timeout = {max(1, int(remaining * 1000))}")
+        finally:
+            cursor.close()
+    elif conn.dialect.name == 'sqlite':
+        dbapi_connection.set_progress_handler(_interrupt_if_expired, _PROGRESS_STEPS)
+
+
+def _is_timeout(error: Optional[BaseException]) -> bool:
+    if error is None:
+        return False
+    code = getattr(error, 'pgcode', None) or getattr(error, 'sqlstate', None)
+    return code == _QUERY_CANCELED or str(error) == 'interrupted'
+
+
+def _on_error(context) -> None:
+    if has_request_context() and _deadline.get() is not None and _is_timeout(context.original_exception):
+        request.environ[_EXPIRED_ENVIRON] = True
+
+
+class RequestDeadlines:
+    """Assigns each request its time budget and answers 504 when it runs out."""
+
+    def __init__(self):
+        self.budgets = {'default': 30.0}
+
+    def init_app(self, app) -> None:
+        """
+        Read TIME_BUDGETS and install the engine and request hooks.
+
+        Call after the other request hooks are registered, so that they
+        (security headers, access log, metrics) see the 504.
+        """
+        if not app.config.get('TIME_BUDGETS_ENABLED', True):
+            return
+        self.budgets = {'default': 30.0, **app.config.get('TIME_BUDGETS', {})}
+
+        from src.models.base import db
+        with app.app_context():
+            self.instrument(db.engine)
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+
+    @staticmethod
+    def instrument(engine) -> None:
+        """Install the transaction hooks on an engine (idempotent)."""
+        if not event.contains(engine, 'begin', _on_begin):
+            event.listen(engine, 'begin', _on_begin)
+            event.listen(engine, 'handle_error', _on_error)
+
+    def budget_for(self, budget_class: Optional[str]) -> float:
+        """Budget in seconds for an expensive-endpoint class (None for 'default')."""
+        return float(self.budgets.get(budget_class or 'default', self.budgets['default']))
+
+    def _start(self) -> None:
+        from src.middleware.rate_limiting import request_class
+        budget_class = request_class() or 'default'
+        request.environ[_BUDGET_ENVIRON] = budget_class
+        request.environ[_TOKEN_ENVIRON] = _deadline.set(time.monotonic() + self.budget_for(budget_class))
+
+    def _finish(self, response):
+        if _TOKEN_ENVIRON not in request.environ:
+            return response
+        expired = request.environ.get(_EXPIRED_ENVIRON, False)
+        if not expired and not (response.status_code >= 500 and remaining_time() <= 0):
+            return response
+
+        budget_class = request.environ[_BUDGET_ENVIRON]
+        from src.models.base import db
+        try:
+            db.session.rollback()
+        except Exception as e:
+            logger.error(f"Rollback after deadline failed: {str(e)}")
+
+        DEADLINES_EXCEEDED.labels(budget_class).inc()
+        logger.warning(
+            "Request exceeded its time budget",
+            extra={'endpoint': request.endpoint, 'budget': budget_class,
+                   'budget_seconds': self.budget_for(budget_class), 'status': response.status_code}
+        )
+
+        from src.utils.responses import error_response
+        body, status = error_response(
+            message="Request exceeded its time budget",
+            status_code=504,
+            error_code="DEADLINE_EXCEEDED"
+        )
+        response.set_data(current_app.json.dumps(body))
+        response.mimetype = 'application/json'
+        response.status_code = status
+        return response
+
+    @staticmethod
+    def _teardown(exc: Optional[BaseException] = None) -> None:
+        token = request.environ.pop(_TOKEN_ENVIRON, None)
+        if token is not None:
+            _deadline.reset(token)
+
+
+# Shared request deadlines, configured by create_app
+request_deadlines = RequestDeadlines()
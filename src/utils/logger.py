@@ -1,32 +1,163 @@
-"""Structured logging configuration."""
+"""
+Structured logging configuration.
 
+Records are put on an in-memory queue by the calling thread and formatted and
+written by a QueueListener thread, so log I/O never runs on the request path.
+Records carry the request id of the request that produced them, and records
+below WARNING can be sampled per logger.
+"""
+
+import atexit
 import logging
+import queue
+import random
+import re
 import sys
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from flask import has_request_context, request
 from pythonjsonlogger import json as jsonlogger
 
+REQUEST_ID_HEADER = 'X-Request-ID'
+
+_REQUEST_ID_ENVIRON = 'issue_tracker.request_id'
+_VALID_REQUEST_ID = re.compile(r'^[A-Za-z0-9._:-]{1,128}$')
+_RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'taskName'}
+
+# Listener per configured logger name, stopped (and flushed) at exit
+_listeners: Dict[str, QueueListener] = {}
+
+
+def current_request_id() -> Optional[str]:
+    """
+    Id of the current request, assigned on first use.
+
+    Reuses a well-formed incoming X-Request-ID header, otherwise generates one.
+
+    Returns:
+        Request id, or None outside a request
+    """
+    if not has_request_context():
+        return None
+    request_id = request.environ.get(_REQUEST_ID_ENVIRON)
+    if request_id is None:
+        incoming = request.headers.get(REQUEST_ID_HEADER, '')
+        request_id = incoming if _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+        request.environ[_REQUEST_ID_ENVIRON] = request_id
+    return request_id
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """
+    Parse 'logger=rate,...' into a mapping, e.g. 'issue_tracker.access=0.1'.
+
+    Args:
+        spec: Comma-separated logger=rate pairs
 
-def setup_logger(name: str = 'issue_tracker', level: str = 'INFO', log_format: str = 'json') -> logging.Logger:
+    Returns:
+        Rate per logger name
+    """
+    rates = {}
+    for item in (spec or '').split(','):
+        name, _, rate = item.partition('=')
+        if name.strip() and rate.strip():
+            rates[name.strip()] = float(rate)
+    return rates
+
+
+class RequestContextFilter(logging.Filter):
+    """Adds ``request_id`` to records emitted while handling a request."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'request_id'):
+            request_id = current_request_id()
+            if request_id is not None:
+                record.request_id = request_id
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of records below WARNING from the configured loggers and their children."""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not self.rates or record.levelno >= logging.WARNING:
+            return True
+        name = record.name
+        while name:
+            rate = self.rates.get(name)
+            if rate is not None:
+                return random.random() < rate
+            name = name.rpartition('.')[0]
+        return True
+
+
+class BackgroundQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread without formatting them.
+
+    Messages and fields are formatted by the listener, so arguments passed to
+    a logging call should not be mutated afterwards. When the queue is full
+    records are dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class TextFormatter(logging.Formatter):
+    """Plain text formatter that appends structured fields as key=value pairs."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        fields = {key: value for key, value in vars(record).items() if key not in _RESERVED_ATTRS}
+        if fields:
+            text += ' ' + ' '.join(f'{key}={value}' for key, value in fields.items())
+        return text
+
+
+def setup_logger(name: str = 'issue_tracker', level: str = 'INFO', log_format: str = 'json',
+                 sample_rates: Optional[Dict[str, float]] = None,
+                 queue_size: int = 10000) -> logging.Logger:
     """
     Setup structured logger.
-    
+
     Args:
         name: Logger name
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: Format type ('json' or 'text')
-    
+        sample_rates: Fraction of sub-WARNING records kept per logger name
+        queue_size: Records buffered for the writer thread before dropping
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
-    
-    # Remove existing handlers
+
+    # Remove existing handlers and flush their writer thread
     logger.handlers = []
-    
-    # Create console handler
+    stop_logger(name)
+
+    # Console handler, driven by the listener thread
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(getattr(logging, level.upper()))
-    
+
     # Set formatter based on format type
     if log_format.lower() == 'json':
         formatter = jsonlogger.JsonFormatter(
@@ -34,16 +165,38 @@ def setup_logger(name: str = 'issue_tracker', level: str = 'INFO', log_format: s
             rename_fields={'levelname': 'level', 'asctime': 'timestamp'}
         )
     else:
-        formatter = logging.Formatter(
+        formatter = TextFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-    
+
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
-    
+
+    queue_handler = BackgroundQueueHandler(queue.Queue(queue_size))
+    queue_handler.addFilter(RequestContextFilter())
+    if sample_rates:
+        queue_handler.addFilter(SamplingFilter(sample_rates))
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(queue_handler.queue, handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+
     return logger
 
 
+def stop_logger(name: str = 'issue_tracker') -> None:
+    """Write out queued records of a logger set up by setup_logger and stop its writer thread."""
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    for name in list(_listeners):
+        stop_logger(name)
+
+
 # Default logger instance
 logger = setup_logger()
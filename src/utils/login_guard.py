@@ -0,0 +1,178 @@
+"""Login throttling with sliding-window failure counters and exponential backoff."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class LoginThrottledError(Exception):
+    """Raised when a username or client address is temporarily locked out."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Too many login attempts, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class _Entry:
+    """Failure counts for one key over the current and previous window."""
+
+    __slots__ = ('window_start', 'previous', 'current', 'strikes', 'locked_until')
+
+    def __init__(self, window_start: float):
+        self.window_start = window_start
+        self.previous = 0
+        self.current = 0
+        self.strikes = 0
+        self.locked_until = 0.0
+
+
+class LoginGuard:
+    """
+    Tracks failed logins per username and per client address.
+
+    Counts use a two-bucket sliding window: the previous window's count is
+    weighted by how much of it still overlaps the sliding window. Once a key
+    reaches its limit it is locked for ``backoff_base * 2**(strikes - 1)``
+    seconds, capped at ``backoff_max``. Entries live in an LRU map bounded by
+    ``max_entries`` so a flood of random usernames cannot grow memory.
+    """
+
+    def __init__(
+        self,
+        max_per_user: int = 5,
+        max_per_ip: int = 50,
+        window: float = 300.0,
+        backoff_base: float = 1.0,
+        backoff_max: float = 900.0,
+        max_entries: int = 10000,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_per_user = max_per_user
+        self.max_per_ip = max_per_ip
+        self.window = window
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._clock = clock
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Configure limits from app config and clear existing counters."""
+        self.max_per_user = app.config.get('LOGIN_MAX_FAILURES_PER_USER', 5)
+        self.max_per_ip = app.config.get('LOGIN_MAX_FAILURES_PER_IP', 50)
+        self.window = app.config.get('LOGIN_FAILURE_WINDOW', 300.0)
+        self.backoff_base = app.config.get('LOGIN_BACKOFF_BASE', 1.0)
+        self.backoff_max = app.config.get('LOGIN_BACKOFF_MAX', 900.0)
+        self.max_entries = app.config.get('LOGIN_GUARD_MAX_ENTRIES', 10000)
+        self.enabled = app.config.get('LOGIN_GUARD_ENABLED', True)
+        self.reset()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def check(self, username: str, ip_address: Optional[str] = None) -> None:
+        """
+        Reject the attempt if the username or address is locked.
+
+        Args:
+            username: Submitted username
+            ip_address: Client address (optional)
+
+        Raises:
+            LoginThrottledError: With the seconds until the lock expires
+        """
+        if not self.enabled:
+            return
+        now = self._clock()
+        with self._lock:
+            retry_after = max(
+                (entry.locked_until - now for entry in self._lookup(username, ip_address) if entry),
+                default=0.0
+            )
+        if retry_after > 0:
+            raise LoginThrottledError(retry_after)
+
+    def record_failure(self, username: str, ip_address: Optional[str] = None) -> None:
+        """
+        Count a failed attempt and lock keys that reach their limit.
+
+        Args:
+            username: Submitted username
+            ip_address: Client address (optional)
+        """
+        if not self.enabled:
+            return
+        now = self._clock()
+        with self._lock:
+            self._hit(self._user_key(username), self.max_per_user, now)
+            if ip_address:
+                self._hit(self._ip_key(ip_address), self.max_per_ip, now)
+
+    def record_success(self, username: str, ip_address: Optional[str] = None) -> None:
+        """
+        Clear the username's failures after a successful login.
+
+        Address counters are kept so one valid account cannot reset a
+        credential-stuffing source.
+
+        Args:
+            username: Username that logged in
+            ip_address: Client address (unused, for symmetry)
+        """
+        with self._lock:
+            self._entries.pop(self._user_key(username), None)
+
+    def reset(self) -> None:
+        """Forget all counters."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _user_key(username: str) -> str:
+        return f"u:{username.lower()}"
+
+    @staticmethod
+    def _ip_key(ip_address: str) -> str:
+        return f"ip:{ip_address}"
+
+    def _lookup(self, username: str, ip_address: Optional[str]):
+        yield self._entries.get(self._user_key(username))
+        if ip_address:
+            yield self._entries.get(self._ip_key(ip_address))
+
+    def _hit(self, key: str, limit: int, now: float) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _Entry(now)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+            self._roll(entry, now)
+
+        entry.current += 1
+        elapsed = (now - entry.window_start) / self.window
+        estimate = entry.previous * max(0.0, 1.0 - elapsed) + entry.current
+        if estimate >= limit:
+            entry.strikes += 1
+            backoff = min(self.backoff_max, self.backoff_base * 2 ** (entry.strikes - 1))
+            entry.locked_until = now + backoff
+
+    def _roll(self, entry: _Entry, now: float) -> None:
+        windows = int((now - entry.window_start) // self.window)
+        if windows <= 0:
+            return
+        entry.previous = entry.current if windows == 1 else 0
+        entry.current = 0
+        entry.window_start += windows * self.window
+        if windows > 1 and now >= entry.locked_until:
+            entry.strikes = 0
+
+
+# Shared per-process guard, configured by create_app
+login_guard = LoginGuard()
@@ -0,0 +1,165 @@
+"""
+Prometheus metrics for requests, the database pool, LLM calls and caches.
+
+Under gunicorn, set ``PROMETHEUS_MULTIPROC_DIR`` to an empty writable
+directory before the workers start (see gunicorn.conf.py). Every worker then
+writes its samples to memory-mapped files there, and ``/metrics`` served by
+any worker aggregates all of them.
+"""
+
+import os
+import time
+from typing import Optional
+
+from flask import Response, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import event
+
+_STARTED_ENVIRON = 'issue_tracker.metrics_started'
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Request latency by route and status',
+    ['method', 'route', 'blueprint', 'status'],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    'http_requests_in_progress',
+    'Requests being handled',
+    multiprocess_mode='livesum',
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out',
+    'Database connections checked out of the pool',
+    multiprocess_mode='livesum',
+)
+DB_POOL_OVERFLOW = Gauge(
+    'db_pool_overflow',
+    'Database connections open beyond the pool size',
+    multiprocess_mode='livesum',
+)
+DB_POOL_SIZE = Gauge(
+    'db_pool_size',
+    'Configured database pool size',
+    multiprocess_mode='livesum',
+)
+DB_POOL_WAIT = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting for a pooled database connection',
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10),
+)
+DB_POOL_TIMEOUTS = Counter(
+    'db_pool_checkout_timeouts_total',
+    'Checkouts that gave up after DB_POOL_TIMEOUT',
+)
+LLM_CALLS = Counter(
+    'llm_calls_total',
+    'Calls to the classification LLM by outcome',
+    ['operation', 'outcome'],
+)
+LLM_LATENCY = Histogram(
+    'llm_call_duration_seconds',
+    'Latency of classification LLM calls, including retries',
+    ['operation'],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 32),
+)
+CACHE_LOOKUPS = Counter(
+    'cache_lookups_total',
+    'In-process cache lookups by cache and result',
+    ['cache', 'result'],
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count one lookup in a named in-process cache."""
+    CACHE_LOOKUPS.labels(cache, 'hit' if hit else 'miss').inc()
+
+
+def record_llm_call(operation: str, outcome: str, seconds: float) -> None:
+    """Count one LLM call and observe its latency."""
+    LLM_CALLS.labels(operation, outcome).inc()
+    LLM_LATENCY.labels(operation).observe(seconds)
+
+
+def render_metrics() -> Response:
+    """Prometheus text exposition of this process, or of all workers in multiprocess mode."""
+    registry = REGISTRY
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+
+class RequestMetrics:
+    """Records request latency and in-flight requests, and tracks the DB pool."""
+
+    def init_app(self, app) -> None:
+        """Register request hooks and pool listeners."""
+        if not app.config.get('METRICS_ENABLED', True):
+            return
+
+        app.before_request(self._start)
+        app.after_request(self._observe)
+        app.teardown_request(self._finish)
+
+        from src.models.base import db
+        with app.app_context():
+            self.instrument_pool(db.engine)
+
+    @staticmethod
+    def instrument_pool(engine) -> None:
+        """Track checkouts and overflow of an engine's pool (idempotent)."""
+        pool = engine.pool
+        if getattr(pool, '_issue_tracker_metrics', False):
+            return
+        pool._issue_tracker_metrics = True
+
+        def overflow() -> int:
+            value = getattr(pool, 'overflow', None)
+            return max(value(), 0) if callable(value) else 0
+
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            DB_POOL_CHECKED_OUT.inc()
+            DB_POOL_OVERFLOW.set(overflow())
+
+        def on_checkin(dbapi_connection, connection_record):
+            DB_POOL_CHECKED_OUT.dec()
+            DB_POOL_OVERFLOW.set(overflow())
+
+        event.listen(pool, 'checkout', on_checkout)
+        event.listen(pool, 'checkin', on_checkin)
+        size = getattr(pool, 'size', None)
+        if callable(size):
+            DB_POOL_SIZE.set(size())
+
+    @staticmethod
+    def _start() -> None:
+        request.environ[_STARTED_ENVIRON] = time.perf_counter()
+        REQUESTS_IN_PROGRESS.inc()
+
+    @staticmethod
+    def _observe(response):
+        started = request.environ.get(_STARTED_ENVIRON)
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            REQUEST_LATENCY.labels(
+                request.method, route, request.blueprint or '', str(response.status_code)
+            ).observe(time.perf_counter() - started)
+        return response
+
+    @staticmethod
+    def _finish(exc: Optional[BaseException] = None) -> None:
+        if request.environ.pop(_STARTED_ENVIRON, None) is not None:
+            REQUESTS_IN_PROGRESS.dec()
+
+
+# Shared request metrics, configured by create_app
+request_metrics = RequestMetrics()
@@ -0,0 +1,222 @@
+"""Bounded off-thread bcrypt hashing and verification."""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional
+
+import bcrypt
+
+
+class HashingBusyError(Exception):
+    """Raised when the hashing pool is saturated or too slow to answer."""
+
+
+def _hashpw(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def _checkpw(password: str, password_hash: str) -> bool:
+    return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+
+
+def _mp_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def hash_cost(password_hash: str) -> Optional[int]:
+    """
+    Read the cost factor of a bcrypt hash.
+
+    Args:
+        password_hash: Hash in modular crypt format ($2b$12$...)
+
+    Returns:
+        Log rounds, or None if the hash is not a bcrypt hash
+    """
+    parts = password_hash.split('$')
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(password_hash: str, rounds: int) -> bool:
+    """
+    Check if a stored hash was made with a different cost than configured.
+
+    Args:
+        password_hash: Stored hash
+        rounds: Configured log rounds
+
+    Returns:
+        True if the hash should be upgraded
+    """
+    return hash_cost(password_hash) != rounds
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a process pool so request threads are not held by hashing.
+
+    At most ``max_pending`` operations may be queued or running per process;
+    beyond that calls fail fast with HashingBusyError instead of queueing.
+    With ``workers=0`` bcrypt runs inline on the calling thread.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, timeout: float = 5.0):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.rejected = 0
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_pid: Optional[int] = None
+        self._dummy_hashes: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Configure pool size, queue depth and timeout from app config."""
+        self.configure(
+            workers=app.config.get('PASSWORD_HASH_WORKERS', 2),
+            max_pending=app.config.get('PASSWORD_HASH_MAX_PENDING', 16),
+            timeout=app.config.get('PASSWORD_HASH_TIMEOUT', 5.0),
+        )
+
+    def configure(self, workers: int, max_pending: int, timeout: float) -> None:
+        """Apply new settings, replacing the pool if its size changed."""
+        with self._lock:
+            if workers != self.workers:
+                self._shutdown_pool()
+            self.workers = workers
+            self.timeout = timeout
+            if max_pending != self.max_pending:
+                self.max_pending = max_pending
+                self._pending = threading.BoundedSemaphore(max_pending)
+
+    def hash(self, password: str, rounds: int) -> str:
+        """
+        Hash a password with the given cost.
+
+        Args:
+            password: Plain text password
+            rounds: bcrypt log rounds
+
+        Returns:
+            Hashed password
+
+        Raises:
+            HashingBusyError: If the pool is saturated or times out
+        """
+        return self._run(_hashpw, password, rounds)
+
+    def hash_many(self, passwords: List[str], rounds: int, workers: Optional[int] = None) -> List[str]:
+        """
+        Hash a batch of passwords across CPU cores.
+
+        Uses a temporary pool separate from the request pool, so bulk jobs
+        neither fill its queue nor wait behind logins. Runs inline when the
+        hasher is configured with ``workers=0``.
+
+        Args:
+            passwords: Plain text passwords
+            rounds: bcrypt log rounds
+            workers: Processes to use (default: CPU count)
+
+        Returns:
+            Hashes in the order of ``passwords``
+        """
+        if self.workers <= 0 or len(passwords) < 2:
+            return [_hashpw(password, rounds) for password in passwords]
+
+        size = min(workers or os.cpu_count() or 1, len(passwords))
+        chunksize = max(1, len(passwords) // (size * 4))
+        with ProcessPoolExecutor(max_workers=size, mp_context=_mp_context()) as pool:
+            return list(pool.map(_hashpw, passwords, [rounds] * len(passwords), chunksize=chunksize))
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        """
+        Verify a password against a stored hash.
+
+        Args:
+            password: Plain text password
+            password_hash: Hashed password
+
+        Returns:
+            True if password matches, False otherwise
+
+        Raises:
+            HashingBusyError: If the pool is saturated or times out
+        """
+        return self._run(_checkpw, password, password_hash)
+
+    def verify_dummy(self, password: str, rounds: int) -> bool:
+        """
+        Run a verification against a fixed hash of the given cost.
+
+        Used for unknown or disabled accounts so they take as long as a real
+        check. The dummy hash is computed once per cost and then reused.
+
+        Args:
+            password: Submitted password
+            rounds: bcrypt log rounds of real hashes
+
+        Returns:
+            Always False
+
+        Raises:
+            HashingBusyError: If the pool is saturated or times out
+        """
+        dummy = self._dummy_hashes.get(rounds)
+        if dummy is None:
+            dummy = self._dummy_hashes.setdefault(rounds, _hashpw('dummy-password', rounds))
+        self.verify(password, dummy)
+        return False
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            self._shutdown_pool()
+
+    def _run(self, fn: Callable, *args):
+        pending = self._pending
+        if not pending.acquire(blocking=False):
+            self.rejected += 1
+            raise HashingBusyError("Password hashing queue is full")
+
+        if self.workers <= 0:
+            try:
+                return fn(*args)
+            finally:
+                pending.release()
+
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except Exception:
+            pending.release()
+            raise
+        future.add_done_callback(lambda _: pending.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise HashingBusyError("Password hashing timed out")
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool, recreating it after a fork."""
+        with self._lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=_mp_context())
+                self._pool_pid = os.getpid()
+            return self._pool
+
+    def _shutdown_pool(self) -> None:
+        if self._pool is not None and self._pool_pid == os.getpid():
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._pool_pid = None
+
+
+# Shared per-process hasher, configured by create_app
+password_hasher = PasswordHasher()
@@ -0,0 +1,227 @@
+"""
+On-demand statistical profiling of single requests.
+
+An admin opts a request in by sending ``X-Profile: <signature>`` (or the
+``_profile`` query argument), where the signature is the hex HMAC-SHA256 of
+``"<METHOD> <path>"`` under ``PROFILING_SECRET``. The request's thread is then
+sampled every ``PROFILING_INTERVAL_MS`` and the stacks are written in
+collapsed-stack format (one ``frame;frame;frame count`` line per stack, as
+read by flamegraph.pl, speedscope and inferno) to ``PROFILING_DIR``. Profiles
+are stored under the request id (``X-Request-ID``, as logged), so a slow request
+found in the logs can be fetched directly; the response also carries the id in
+``X-Profile-Id``.
+
+Requests without the header pay for one dictionary lookup.
+"""
+
+import hashlib
+import hmac
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from flask import request
+
+from src.utils.logger import current_request_id, logger
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ARG = '_profile'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+
+_SAMPLER_ENVIRON = 'issue_tracker.profiler'
+_UNSAFE_ID_CHARS = re.compile(r'[^A-Za-z0-9_-]')
+
+
+def profile_id_for(request_id: str) -> str:
+    """
+    File-safe profile id of a request id.
+
+    Request ids may contain '.' and ':', which are replaced by '_'.
+
+    Args:
+        request_id: X-Request-ID of the profiled request
+
+    Returns:
+        Profile id (empty if request_id is empty)
+    """
+    return _UNSAFE_ID_CHARS.sub('_', request_id[:128])
+
+
+def profile_signature(secret: str, method: str, path: str) -> str:
+    """
+    Signature that opts one route into profiling.
+
+    Args:
+        secret: PROFILING_SECRET
+        method: HTTP method, e.g. 'GET'
+        path: Request path without query string
+
+    Returns:
+        Hex HMAC-SHA256 of '<METHOD> <path>'
+    """
+    message = f"{method.upper()} {path}".encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float, max_seconds: float):
+        super().__init__(name='request-profiler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        deadline = time.monotonic() + self.max_seconds
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None or time.monotonic() > deadline:
+                return
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(labels))] += 1
+            self.samples += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+    def collapsed(self) -> str:
+        """Samples in collapsed-stack format."""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class RequestProfiler:
+    """Profiles individual requests opted in by an admin with a signed header."""
+
+    def __init__(self):
+        self.secret: Optional[str] = None
+        self.directory = os.path.join(tempfile.gettempdir(), 'issue-tracker-profiles')
+        self.interval = 0.005
+        self.max_seconds = 60.0
+        self.max_files = 200
+
+    def init_app(self, app) -> None:
+        """Register request hooks when PROFILING_SECRET is configured."""
+        self.secret = app.config.get('PROFILING_SECRET')
+        if not self.secret:
+            return
+        self.directory = app.config.get('PROFILING_DIR') or self.directory
+        self.interval = app.config.get('PROFILING_INTERVAL_MS', 5) / 1000
+        self.max_seconds = app.config.get('PROFILING_MAX_SECONDS', 60)
+        self.max_files = app.config.get('PROFILING_MAX_FILES', 200)
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+
+    def _start(self) -> None:
+        signature = request.headers.get(PROFILE_HEADER) or request.args.get(PROFILE_ARG)
+        if signature:
+            self._begin(signature)
+
+    def _begin(self, signature: str) -> None:
+        expected = profile_signature(self.secret, request.method, request.path)
+        if not hmac.compare_digest(signature, expected):
+            logger.warning(f"Ignoring profiling request with bad signature for {request.method} {request.path}")
+            return
+
+        from src.middleware.auth_middleware import get_current_user_role, verify_access_token
+        try:
+            verify_access_token()
+        except Exception:
+            return
+        if get_current_user_role() != 'admin':
+            logger.warning(f"Ignoring profiling request from non-admin for {request.method} {request.path}")
+            return
+
+        sampler = StackSampler(threading.get_ident(), self.interval, self.max_seconds)
+        request.environ[_SAMPLER_ENVIRON] = sampler
+        sampler.start()
+
+    def _finish(self, response):
+        sampler = request.environ.pop(_SAMPLER_ENVIRON, None)
+        if sampler is None:
+            return response
+        sampler.stop()
+        profile_id = profile_id_for(current_request_id())
+        try:
+            self._save(profile_id, sampler.collapsed())
+            response.headers[PROFILE_ID_HEADER] = profile_id
+            logger.info(
+                "Request profiled",
+                extra={'profile_id': profile_id, 'samples': sampler.samples, 'endpoint': request.endpoint}
+            )
+        except OSError as e:
+            logger.error(f"Failed to store profile: {str(e)}")
+        return response
+
+    @staticmethod
+    def _teardown(exc: Optional[BaseException] = None) -> None:
+        sampler = request.environ.pop(_SAMPLER_ENVIRON, None)
+        if sampler is not None:
+            sampler.stop()
+
+    def _path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.collapsed")
+
+    def _save(self, profile_id: str, collapsed: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        partial = self._path(profile_id) + '.tmp'
+        with open(partial, 'w', encoding='utf-8') as f:
+            f.write(collapsed)
+        os.replace(partial, self._path(profile_id))
+        self._prune()
+
+    def _prune(self) -> None:
+        paths = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory) if name.endswith('.collapsed')
+        ]
+        if len(paths) <= self.max_files:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def load(self, profile_id: str) -> Optional[str]:
+        """
+        Stored collapsed stacks of a profiled request.
+
+        Args:
+            profile_id: Request id of the profiled request, or the
+                X-Profile-Id header of its response
+
+        Returns:
+            Collapsed-stack text, or None if unknown
+        """
+        profile_id = profile_id_for(profile_id)
+        if not profile_id:
+            return None
+        try:
+            with open(self._path(profile_id), encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+
+# Shared request profiler, configured by create_app
+request_profiler = RequestProfiler()
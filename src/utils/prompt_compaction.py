@@ -0,0 +1,219 @@
+"""Token-budgeted compaction of issue descriptions before they reach the LLM."""
+
+import re
+from dataclasses import dataclass
+from typing import List
+
+# Rough chars-per-token ratio for English text and code with BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+# Volatile fragments stripped before comparing log lines. Other numbers (line
+# numbers, ports, ids, status codes) are kept: they tell lines apart.
+_TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?')
+_CLOCK_RE = re.compile(r'\b\d{2}:\d{2}:\d{2}(?:[.,]\d+)?\b')
+_EPOCH_RE = re.compile(r'\b1\d{9}(?:\d{3})?(?:\.\d+)?\b')
+_DURATION_RE = re.compile(r'\b\d+(?:\.\d+)?\s?(?:ns|us|µs|ms|s|sec|secs|seconds)\b')
+_COUNTER_RE = re.compile(
+    r'\b(attempt|retry|retries|try|request|req|iteration|iter|seq|pid|tid|thread)([\s:=#]*)\d+\b',
+    re.IGNORECASE,
+)
+_SEQUENCE_RE = re.compile(r'#\d+\b')
+_HEX_RE = re.compile(r'0x[0-9a-fA-F]+')
+
+_PY_TRACEBACK_START = 'Traceback (most recent call last):'
+_PY_FRAME_RE = re.compile(r'^\s+File ".*", line \d+')
+_JAVA_FRAME_RE = re.compile(r'^\s+at \S+')
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of compacting a piece of text."""
+    text: str
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated tokens removed by compaction."""
+        return max(0, self.tokens_before - self.tokens_after)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a string.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Approximate token count
+    """
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _normalize_line(line: str) -> str:
+    line = _TIMESTAMP_RE.sub('<ts>', line)
+    line = _CLOCK_RE.sub('<ts>', line)
+    line = _EPOCH_RE.sub('<ts>', line)
+    line = _DURATION_RE.sub('<duration>', line)
+    line = _COUNTER_RE.sub(r'\1\2<n>', line)
+    line = _SEQUENCE_RE.sub('#<n>', line)
+    return _HEX_RE.sub('<hex>', line).strip()
+
+
+def dedupe_log_lines(lines: List[str]) -> List[str]:
+    """
+    Collapse log lines that differ only by timestamps, durations, counters or addresses.
+
+    The first occurrence is kept and annotated with the repeat count.
+
+    Args:
+        lines: Input lines
+
+    Returns:
+        Deduplicated lines
+    """
+    counts = {}
+    order = []
+    for line in lines:
+        key = _normalize_line(line)
+        if not key:
+            order.append((None, line))
+            continue
+        if key in counts:
+            counts[key] += 1
+            continue
+        counts[key] = 1
+        order.append((key, line))
+
+    result = []
+    for key, line in order:
+        if key is not None and counts[key] > 1:
+            result.append(f"{line} [repeated {counts[key]}x]")
+        else:
+            result.append(line)
+    return result
+
+
+def truncate_stack_traces(lines: List[str], max_frames: int = 5) -> List[str]:
+    """
+    Keep only the frames nearest to the error in Python and Java stack traces.
+
+    Python tracebacks list the innermost frame last, so the last frames are
+    kept; Java traces list it first, so the first frames are kept.
+
+    Args:
+        lines: Input lines
+        max_frames: Frames to keep per trace
+
+    Returns:
+        Lines with long traces shortened
+    """
+    result: List[str] = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        if line.strip() == _PY_TRACEBACK_START:
+            frames: List[List[str]] = []
+            j = i + 1
+            while j < len(lines) and (_PY_FRAME_RE.match(lines[j]) or (frames and lines[j].startswith('    '))):
+                if _PY_FRAME_RE.match(lines[j]):
+                    frames.append([lines[j]])
+                else:
+                    frames[-1].append(lines[j])
+                j += 1
+            result.append(line)
+            if len(frames) > max_frames:
+                result.append(f"  ... {len(frames) - max_frames} frames omitted ...")
+                frames = frames[-max_frames:]
+            for frame in frames:
+                result.extend(frame)
+            i = j
+            continue
+
+        if _JAVA_FRAME_RE.match(line):
+            j = i
+            while j < len(lines) and _JAVA_FRAME_RE.match(lines[j]):
+                j += 1
+            frames_block = lines[i:j]
+            result.extend(frames_block[:max_frames])
+            if len(frames_block) > max_frames:
+                result.append(f"\t... {len(frames_block) - max_frames} more")
+            i = j
+            continue
+
+        result.append(line)
+        i += 1
+    return result
+
+
+def enforce_token_budget(text: str, token_budget: int) -> str:
+    """
+    Trim text to a token budget, keeping its head and tail.
+
+    The omission marker counts against the budget. When even the marker does
+    not fit, the text is simply cut at the budget.
+
+    Args:
+        text: Input text
+        token_budget: Maximum estimated tokens
+
+    Returns:
+        Text within the budget
+    """
+    if token_budget <= 0 or estimate_tokens(text) <= token_budget:
+        return text
+
+    max_chars = token_budget * CHARS_PER_TOKEN
+    # Reserve room for the longest marker this text could need
+    longest_marker = _omission_marker(estimate_tokens(text))
+    keep = max_chars - len(longest_marker)
+    if keep <= 0:
+        return text[:max_chars]
+
+    head = keep * 2 // 3
+    tail = keep - head
+    marker = _omission_marker(estimate_tokens(text[head:len(text) - tail]))
+    return text[:head] + marker + (text[-tail:] if tail else '')
+
+
+def _omission_marker(tokens: int) -> str:
+    return f"\n[... {tokens} tokens omitted ...]\n"
+
+
+def compact_description(
+    text: str,
+    token_budget: int = 400,
+    max_stack_frames: int = 5
+) -> CompactionResult:
+    """
+    Compact an issue description for prompting.
+
+    Repeated log lines are collapsed, stack traces are cut down to the frames
+    nearest the error, and the result is trimmed to ``token_budget``.
+
+    Args:
+        text: Raw description
+        token_budget: Maximum estimated tokens for the description
+        max_stack_frames: Frames to keep per stack trace
+
+    Returns:
+        CompactionResult with the compacted text and token estimates
+    """
+    tokens_before = estimate_tokens(text)
+    if not text:
+        return CompactionResult(text=text, tokens_before=0, tokens_after=0)
+
+    lines = text.splitlines()
+    lines = truncate_stack_traces(lines, max_frames=max_stack_frames)
+    lines = dedupe_log_lines(lines)
+    compacted = enforce_token_budget('\n'.join(lines), token_budget)
+
+    return CompactionResult(
+        text=compacted,
+        tokens_before=tokens_before,
+        tokens_after=estimate_tokens(compacted),
+    )
@@ -0,0 +1,215 @@
+"""
+Host-local rate limit storage shared by all workers through a SQLite file.
+
+Importing this module registers the ``sqlite://`` scheme with the ``limits``
+library, so Flask-Limiter can be pointed at it with
+``RATELIMIT_STORAGE_URL=sqlite:////var/run/issue-tracker/ratelimit.db``.
+Every gunicorn worker on the host opens the same file, so configured limits
+hold across workers instead of being multiplied by the worker count.
+
+The database runs in WAL mode with ``synchronous=OFF``: counters are
+throwaway state, and losing the last few increments on a power cut is an
+acceptable trade for tens of thousands of atomic increments per second.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from math import floor
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+
+
+DEFAULT_PATH = os.path.join(tempfile.gettempdir(), 'issue-tracker-ratelimit.db')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_counters (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+# Single atomic statement: restart expired windows, otherwise add to the count
+_INCR = """
+INSERT INTO rate_limit_counters (key, value, expires_at) VALUES (:key, :amount, :now + :expiry)
+ON CONFLICT(key) DO UPDATE SET
+    value = CASE WHEN expires_at <= :now THEN :amount ELSE value + :amount END,
+    expires_at = CASE WHEN expires_at <= :now THEN :now + :expiry ELSE expires_at END
+RETURNING value
+"""
+
+
+def storage_path(uri: Optional[str]) -> str:
+    """Database path from a ``sqlite:///relative`` or ``sqlite:////absolute`` URI."""
+    if not uri:
+        return DEFAULT_PATH
+    path = urlparse(uri).path
+    if path.startswith('//'):
+        return path[1:]
+    return path.lstrip('/') or DEFAULT_PATH
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """
+    Fixed and sliding window counters in a shared SQLite file.
+
+    Each thread of each process keeps its own connection; a forked worker
+    opens fresh ones. Expired rows are swept opportunistically every
+    ``sweep_interval`` seconds.
+    """
+
+    STORAGE_SCHEME = ['sqlite']
+
+    def __init__(self, uri: Optional[str] = None, wrap_exceptions: bool = False,
+                 busy_timeout: float = 5.0, sweep_interval: float = 60.0, **options):
+        self.path = storage_path(uri)
+        self.busy_timeout = float(busy_timeout)
+        self.sweep_interval = float(sweep_interval)
+        self._local = threading.local()
+        self._last_sweep = time.time()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self._connection()
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout,
+                               isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.execute(_SCHEMA)
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _maybe_sweep(self, conn: sqlite3.Connection, now: float) -> None:
+        if now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+        conn.execute('DELETE FROM rate_limit_counters WHERE expires_at <= ?', (now,))
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        """
+        Atomically increment a counter, starting a new window if it expired.
+
+        Args:
+            key: Rate limit key
+            expiry: Window length in seconds
+            amount: Increment
+
+        Returns:
+            Counter value after the increment
+        """
+        conn = self._connection()
+        now = time.time()
+        self._maybe_sweep(conn, now)
+        row = conn.execute(_INCR, {'key': key, 'amount': amount, 'now': now, 'expiry': expiry}).fetchone()
+        return row[0]
+
+    def decr(self, key: str, amount: int = 1) -> int:
+        """Decrement a live counter, never below zero."""
+        row = self._connection().execute(
+            'UPDATE rate_limit_counters SET value = MAX(value - ?, 0) '
+            'WHERE key = ? AND expires_at > ? RETURNING value',
+            (amount, key, time.time())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get(self, key: str) -> int:
+        """Current value of a counter, 0 if missing or expired."""
+        row = self._connection().execute(
+            'SELECT value FROM rate_limit_counters WHERE key = ? AND expires_at > ?',
+            (key, time.time())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        """Epoch time at which the counter's window ends."""
+        now = time.time()
+        row = self._connection().execute(
+            'SELECT expires_at FROM rate_limit_counters WHERE key = ? AND expires_at > ?',
+            (key, now)
+        ).fetchone()
+        return row[0] if row else now
+
+    def clear(self, key: str) -> None:
+        """Remove a counter."""
+        self._connection().execute('DELETE FROM rate_limit_counters WHERE key = ?', (key,))
+
+    def check(self) -> bool:
+        """True if the database answers."""
+        try:
+            self._connection().execute('SELECT 1').fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> Optional[int]:
+        """Remove all counters and return how many there were."""
+        return self._connection().execute('DELETE FROM rate_limit_counters').rowcount
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        """
+        Take ``amount`` hits from a sliding window if they fit under ``limit``.
+
+        The read and increment run in one write transaction, so concurrent
+        workers cannot both take the last slot.
+        """
+        if amount > limit:
+            return False
+
+        conn = self._connection()
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            previous_count, previous_ttl, current_count, _ = self._sliding_window_info(
+                previous_key, current_key, expiry, now
+            )
+            weighted_count = previous_count * previous_ttl / expiry + current_count
+            allowed = floor(weighted_count) + amount <= limit
+            if allowed:
+                conn.execute(_INCR, {'key': current_key, 'amount': amount, 'now': now, 'expiry': 2 * expiry})
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return allowed
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        """Counts and TTLs of the previous and current windows."""
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        return self._sliding_window_info(previous_key, current_key, expiry, now)
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        """Remove both windows of a sliding window limit."""
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self.clear(previous_key)
+        self.clear(current_key)
+
+    def _sliding_window_info(self, previous_key: str, current_key: str,
+                             expiry: int, now: float) -> Tuple[int, float, int, float]:
+        previous_count = self.get(previous_key)
+        current_count = self.get(current_key)
+        if previous_count == 0:
+            previous_ttl = 0.0
+        else:
+            previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
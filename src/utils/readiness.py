@@ -0,0 +1,208 @@
+"""
+Cached readiness checks for load balancer probes.
+
+Probes read a report that is at most ``READINESS_TTL`` seconds old. When the
+report goes stale the next probe still gets the stale one, and a background
+thread rebuilds it. Each worker therefore runs its dependency checks at most
+once per TTL, however often it is probed, and apart from the first probe no
+probe takes a pool connection.
+
+Pool saturation is tracked from checkout/checkin events. A worker whose pool
+has had every connection checked out for ``READINESS_SATURATION_SECONDS``
+reports unready, so the load balancer can shed traffic to it. Under load a
+full pool keeps handing connections back and forth, so saturation only ends
+once the pool has stayed below capacity for ``READINESS_RELEASE_SECONDS``.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event, inspect, text
+
+from src.utils.logger import logger
+
+
+def _pool_capacity(pool) -> Optional[int]:
+    size = getattr(pool, 'size', None)
+    max_overflow = getattr(pool, '_max_overflow', None)
+    if not callable(size) or max_overflow is None or max_overflow < 0:
+        return None
+    return size() + max_overflow
+
+
+class ReadinessMonitor:
+    """Builds and caches the readiness report of this worker."""
+
+    def __init__(self):
+        self.app = None
+        self.ttl = 5.0
+        self.saturation_seconds = 30.0
+        self.release_seconds = 1.0
+        self.migrations_dir = str(Path(__file__).resolve().parents[2] / 'migrations')
+        self._report: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._saturated_since: Optional[float] = None
+        self._released_at: Optional[float] = None
+        self._migration_head: Optional[str] = None
+        self._pool = None
+
+    def init_app(self, app) -> None:
+        """Read settings and start tracking pool saturation."""
+        self.app = app
+        self.ttl = float(app.config.get('READINESS_TTL', 5))
+        self.saturation_seconds = float(app.config.get('READINESS_SATURATION_SECONDS', 30))
+        self.release_seconds = float(app.config.get('READINESS_RELEASE_SECONDS', 1))
+        self.migrations_dir = app.config.get('MIGRATIONS_DIR') or self.migrations_dir
+        self._report = None
+        self._migration_head = None
+
+        from src.models.base import db
+        with app.app_context():
+            self.instrument_pool(db.engine)
+
+    def instrument_pool(self, engine) -> None:
+        """Follow checkouts of an engine's pool to detect sustained saturation."""
+        pool = engine.pool
+        self._pool = pool
+        self._saturated_since = None
+        self._released_at = None
+        capacity = _pool_capacity(pool)
+        if capacity is None or getattr(pool, '_issue_tracker_readiness', False):
+            return
+        pool._issue_tracker_readiness = True
+
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            if pool.checkedout() < capacity:
+                return
+            now = time.monotonic()
+            if self._saturation_start(now) is None:
+                self._saturated_since = now
+            self._released_at = None
+
+        def on_checkin(dbapi_connection, connection_record):
+            # Fires before the connection is back in the pool, so a slot is about
+            # to free up; saturation ends unless it is taken again soon
+            if self._saturated_since is not None and self._released_at is None:
+                self._released_at = time.monotonic()
+
+        event.listen(pool, 'checkout', on_checkout)
+        event.listen(pool, 'checkin', on_checkin)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Latest readiness report, refreshed in the background once stale.
+
+        Only the first call, or every call when READINESS_TTL is 0, builds the
+        report on the calling thread.
+
+        Returns:
+            Report dict with 'ready', 'database', 'pool', 'llm' and 'migrations'
+        """
+        now = time.monotonic()
+        with self._lock:
+            report = self._report
+            stale = report is None or now - self._checked_at >= self.ttl
+            refresh_in_background = stale and report is not None and self.ttl > 0 and not self._refreshing
+            if refresh_in_background:
+                self._refreshing = True
+        if report is None or self.ttl <= 0:
+            return self.refresh()
+        if refresh_in_background:
+            threading.Thread(target=self._refresh_in_background, name='readiness-refresh', daemon=True).start()
+        # Saturation changes between refreshes and is cheap to read, so it is never cached
+        return {**report, 'pool': self._pool_stats(), 'ready': report['ready'] and not self._saturated()}
+
+    def _refresh_in_background(self) -> None:
+        try:
+            with self.app.app_context():
+                self.refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def refresh(self) -> Dict[str, Any]:
+        """Run the dependency checks now and cache the result."""
+        database, current = self._check_database()
+        migrations = {'current': current, 'head': self._head()}
+        behind = migrations.get('current') is not None and migrations['current'] != migrations['head']
+        report = {
+            'ready': database == 'ok' and not behind and not self._saturated(),
+            'database': database,
+            'pool': self._pool_stats(),
+            'llm': self._llm_state(),
+            'migrations': migrations,
+            'checked_at': time.time(),
+        }
+        with self._lock:
+            self._report = report
+            self._checked_at = time.monotonic()
+        if not report['ready']:
+            logger.warning("Worker not ready", extra={'readiness': report})
+        return report
+
+    @staticmethod
+    def _check_database() -> Tuple[str, Optional[str]]:
+        """Database reachability and its current alembic revision."""
+        from src.models.base import db
+        try:
+            with db.engine.connect() as conn:
+                conn.execute(text('SELECT 1'))
+                # Schemas created with create_all are not managed by alembic
+                current = None
+                if inspect(conn).has_table('alembic_version'):
+                    current = conn.execute(text('SELECT version_num FROM alembic_version')).scalar()
+            return 'ok', current
+        except Exception as e:
+            logger.error(f"Readiness database check failed: {str(e)}")
+            return 'unavailable', None
+
+    def _head(self) -> Optional[str]:
+        """Head revision of the migrations directory (read once)."""
+        if self._migration_head is None:
+            try:
+                from alembic.script import ScriptDirectory
+                self._migration_head = ScriptDirectory(self.migrations_dir).get_current_head()
+            except Exception as e:
+                logger.warning(f"Could not read migration head: {str(e)}")
+        return self._migration_head
+
+    @staticmethod
+    def _llm_state() -> str:
+        from src.services.suggest_service import llm_breaker
+        return llm_breaker.state
+
+    def _saturation_start(self, now: float) -> Optional[float]:
+        """Start of the current saturation, or None once the pool has had room for release_seconds."""
+        since, released = self._saturated_since, self._released_at
+        if since is None or (released is not None and now - released >= self.release_seconds):
+            return None
+        return since
+
+    def _saturated(self) -> bool:
+        now = time.monotonic()
+        since = self._saturation_start(now)
+        return since is not None and now - since >= self.saturation_seconds
+
+    def _pool_stats(self) -> Dict[str, Any]:
+        pool = self._pool
+        stats: Dict[str, Any] = {'saturated_for': None}
+        if pool is None:
+            return stats
+        for name in ('size', 'checkedout', 'overflow'):
+            value = getattr(pool, name, None)
+            if callable(value):
+                stats[name] = value()
+        stats['capacity'] = _pool_capacity(pool)
+        now = time.monotonic()
+        since = self._saturation_start(now)
+        if since is not None:
+            stats['saturated_for'] = round(now - since, 1)
+        return stats
+
+
+# Shared readiness monitor, configured by create_app
+readiness_monitor = ReadinessMonitor()
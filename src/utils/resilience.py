@@ -0,0 +1,228 @@
+"""Resilience helpers for outbound calls: deadlines, retries, hedging and circuit breaking."""
+
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+T = TypeVar('T')
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker is open."""
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a call does not complete before its deadline."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+
+    The breaker opens after ``failure_threshold`` consecutive failures and
+    rejects calls for ``reset_timeout`` seconds. After that a single trial
+    call is let through (half-open); its outcome closes or re-opens the breaker.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current breaker state."""
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets a trial call through."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        """Return True if a call may proceed."""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call and close the breaker."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Release a half-open trial without recording an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def reset(self) -> None:
+        """Force the breaker back to the closed state."""
+        self.record_success()
+
+
+class RetryPolicy:
+    """Bounded retry policy with exponential backoff and full jitter."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 2.0,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+
+    def backoff(self, attempt: int) -> float:
+        """Sleep duration before retry number ``attempt`` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+def _hedged_call(fn: Callable[[float], T], timeout: float, hedge_delay: float) -> T:
+    """
+    Run ``fn`` and, if it has not finished after ``hedge_delay``, start a
+    second identical attempt. The first successful result wins.
+    """
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        futures = {executor.submit(fn, timeout)}
+        done, _ = wait(futures, timeout=min(hedge_delay, timeout))
+        if not done:
+            remaining = timeout - (time.monotonic() - started)
+            if remaining > 0:
+                futures.add(executor.submit(fn, remaining))
+
+        error: Optional[BaseException] = None
+        pending = futures
+        while pending:
+            remaining = timeout - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+
+        if error is not None and not pending:
+            raise error
+        raise DeadlineExceededError(f"Call did not complete within {timeout:.2f}s")
+    finally:
+        executor.shutdown(wait=False)
+
+
+def call_with_resilience(
+    fn: Callable[[float], T],
+    deadline: float,
+    retry: Optional[RetryPolicy] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    hedge_delay: Optional[float] = None
+) -> T:
+    """
+    Call ``fn`` under a deadline with retries, optional hedging and a breaker.
+
+    Args:
+        fn: Callable receiving the per-attempt timeout in seconds
+        deadline: Total time budget in seconds across all attempts
+        retry: Retry policy (default: single attempt)
+        breaker: Circuit breaker guarding the call (optional)
+        hedge_delay: Start a hedged duplicate after this many seconds (optional)
+
+    Returns:
+        Result of ``fn``
+
+    Raises:
+        CircuitOpenError: If the breaker rejects the call
+        DeadlineExceededError: If the deadline elapses before a successful attempt
+    """
+    retry = retry or RetryPolicy(max_attempts=1)
+    retryable = retry.retry_on + (DeadlineExceededError,)
+
+    # Checked first, so an exhausted budget never takes the half-open trial
+    if deadline <= 0:
+        raise DeadlineExceededError("No time left for the call")
+    if breaker is not None and not breaker.allow_request():
+        raise CircuitOpenError("Circuit breaker is open")
+
+    expires_at = time.monotonic() + deadline
+    last_error: Optional[BaseException] = None
+
+    for attempt in range(retry.max_attempts):
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            break
+
+        try:
+            if hedge_delay:
+                result = _hedged_call(fn, remaining, hedge_delay)
+            else:
+                result = fn(remaining)
+        except retryable as e:
+            last_error = e
+            if breaker is not None:
+                breaker.record_failure()
+                if attempt + 1 < retry.max_attempts and not breaker.allow_request():
+                    raise CircuitOpenError("Circuit breaker opened") from e
+            if attempt + 1 < retry.max_attempts:
+                pause = min(retry.backoff(attempt), expires_at - time.monotonic())
+                if pause > 0:
+                    time.sleep(pause)
+            continue
+        except Exception:
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+    if last_error is None and breaker is not None:
+        # No attempt ran, so there is no outcome to record for the trial
+        breaker.release()
+    if isinstance(last_error, DeadlineExceededError) or last_error is None:
+        raise DeadlineExceededError(f"Call did not complete within {deadline:.2f}s") from last_error
+    raise last_error
@@ -0,0 +1,89 @@
+"""
+Per-request phase timings reported in ``Server-Timing`` and the access log.
+
+Code that does a distinct kind of work wraps it in ``timed_phase(name)`` or
+reports a measured duration with ``record_phase``. The phases in use are
+``auth`` (JWT verification), ``serialize`` (response schema dumps), ``json``
+(JSON encoding) and ``llm`` (classification provider calls). Database time is
+reported as ``db`` by src.utils.sql_instrumentation.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from flask import has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+_PHASES_ENVIRON = 'issue_tracker.phases'
+_ACTIVE_ENVIRON = 'issue_tracker.active_phases'
+
+
+def record_phase(name: str, seconds: float) -> None:
+    """Add time to a phase of the current request (no-op outside requests)."""
+    if not has_request_context():
+        return
+    phases = request.environ.setdefault(_PHASES_ENVIRON, {})
+    phases[name] = phases.get(name, 0.0) + seconds
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """
+    Time the block as part of a phase.
+
+    Nested blocks of the same phase (e.g. nested schemas) are counted once.
+
+    Args:
+        name: Phase name used as the Server-Timing metric name
+    """
+    if not has_request_context():
+        yield
+        return
+    active = request.environ.setdefault(_ACTIVE_ENVIRON, set())
+    if name in active:
+        yield
+        return
+    active.add(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        active.discard(name)
+        record_phase(name, time.perf_counter() - started)
+
+
+def phase_timings() -> Dict[str, float]:
+    """Seconds spent per phase in the current request."""
+    if not has_request_context():
+        return {}
+    return dict(request.environ.get(_PHASES_ENVIRON, {}))
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Default JSON provider that reports encoding time as the ``json`` phase."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        with timed_phase('json'):
+            return super().dumps(obj, **kwargs)
+
+
+class ServerTiming:
+    """Emits recorded phases as ``Server-Timing`` response header entries."""
+
+    def init_app(self, app) -> None:
+        """Install the timed JSON provider and the response hook."""
+        if not app.config.get('SERVER_TIMING_ENABLED', True):
+            return
+        app.json = TimedJSONProvider(app)
+        app.after_request(self._emit)
+
+    @staticmethod
+    def _emit(response):
+        for name, seconds in phase_timings().items():
+            response.headers.add('Server-Timing', f'{name};dur={seconds * 1000:.2f}')
+        return response
+
+
+# Shared phase reporting, configured by create_app
+server_timing = ServerTiming()
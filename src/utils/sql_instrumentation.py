@@ -0,0 +1,376 @@
+"""
+Per-request SQL statement counts, timings and N+1 detection, plus a slow-query log.
+
+Statements slower than ``SQL_SLOW_QUERY_MS`` are logged with their normalised
+SQL, redacted bind parameters, the endpoint and application frame that ran
+them, and the duration. A sample of slow SELECTs is re-run under ``EXPLAIN``
+(``ANALYZE, BUFFERS`` on PostgreSQL) on a background thread and the plan is
+logged as JSON next to them.
+"""
+
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+
+from flask import has_request_context, request
+from sqlalchemy import event
+
+from src.utils.logger import logger
+
+_STATS_ENVIRON = 'issue_tracker.sql_stats'
+_SKIP_OPTION = 'issue_tracker_uninstrumented'
+
+_IN_LIST = re.compile(r'\((?:\s*(?:\?|%\(\w+\)s|:\w+|\$\d+)\s*,?)+\)')
+_NUMBER = re.compile(r'\b\d+\b')
+_SPACE = re.compile(r'\s+')
+
+_BCRYPT_OR_JWT = re.compile(r'^(?:\$2[aby]?\$|eyJ)')
+_MAX_PARAM_LENGTH = 64
+
+# Bind parameter name fragments never written to the slow-query log
+DEFAULT_REDACTED_PARAMETERS = ('password', 'token', 'secret', 'email', 'jti', 'hash')
+
+# Active capture_queries() lists, fed by every instrumented engine
+_captures: List[List[str]] = []
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalise a statement so repeats of the same query compare equal.
+
+    Collapses IN lists, numeric literals and whitespace.
+
+    Args:
+        statement: SQL as sent to the driver
+
+    Returns:
+        Normalised statement
+    """
+    shape = _IN_LIST.sub('(?)', statement)
+    shape = _NUMBER.sub('N', shape)
+    return _SPACE.sub(' ', shape).strip()
+
+
+class QueryStats:
+    """Statements run while handling one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """SELECT shapes executed at least ``threshold`` times (likely N+1 loops)."""
+        return {
+            shape: count for shape, count in self.shapes.items()
+            if count >= threshold and shape[:6].upper() == 'SELECT'
+        }
+
+    def to_dict(self) -> Dict:
+        return {'db_queries': self.count, 'db_time_ms': round(self.seconds * 1000, 2)}
+
+
+def current_stats() -> Optional[QueryStats]:
+    """Query stats of the current request, if instrumentation is active."""
+    if not has_request_context():
+        return None
+    return request.environ.get(_STATS_ENVIRON)
+
+
+@contextmanager
+def capture_queries() -> Iterator[List[str]]:
+    """
+    Collect the statements run by instrumented engines inside the block.
+
+    Yields:
+        List that receives each statement as it is executed
+    """
+    statements: List[str] = []
+    _captures.append(statements)
+    try:
+        yield statements
+    finally:
+        _captures.remove(statements)
+
+
+def redact_parameters(parameters: Any, names: Optional[Sequence[str]] = None,
+                      redact: Sequence[str] = ()) -> Any:
+    """
+    Make bind parameters safe to log.
+
+    Values whose parameter name contains one of ``redact`` (e.g. 'password',
+    'email') and values that look like password hashes or JWTs are replaced
+    with '[REDACTED]'; long strings are truncated.
+
+    Args:
+        parameters: DBAPI parameters (mapping, sequence, or list of either for executemany)
+        names: Parameter names of a positional parameter sequence, if known
+        redact: Lower-case name fragments to redact
+
+    Returns:
+        Dict keyed by parameter name, or a list when names are unknown
+    """
+    def clean(name: Optional[str], value: Any) -> Any:
+        if name is not None and any(fragment in name.lower() for fragment in redact):
+            return '[REDACTED]'
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return f'<{len(value)} bytes>'
+        if isinstance(value, str):
+            if _BCRYPT_OR_JWT.match(value):
+                return '[REDACTED]'
+            if len(value) > _MAX_PARAM_LENGTH:
+                return value[:_MAX_PARAM_LENGTH] + '...'
+            return value
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        return str(value)[:_MAX_PARAM_LENGTH]
+
+    if isinstance(parameters, dict):
+        return {key: clean(key, value) for key, value in parameters.items()}
+    if not isinstance(parameters, (list, tuple)):
+        return parameters
+    if names is not None and len(names) == len(parameters):
+        return {name: clean(name, value) for name, value in zip(names, parameters)}
+    return [clean(None, value) for value in parameters]
+
+
+def _application_frame() -> Optional[str]:
+    """'module:function' of the innermost application frame outside this module."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith('src.') and module != __name__:
+            return f"{module}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _skipped(conn) -> bool:
+    return bool(conn.get_execution_options().get(_SKIP_OPTION))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _skipped(conn):
+        return
+    conn.info.setdefault('issue_tracker.query_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _skipped(conn):
+        return
+    started = conn.info.get('issue_tracker.query_started')
+    elapsed = time.perf_counter() - started.pop() if started else 0.0
+    for statements in _captures:
+        statements.append(statement)
+    if has_request_context():
+        stats = request.environ.get(_STATS_ENVIRON)
+        if stats is not None:
+            stats.record(statement, elapsed)
+    if sql_instrumentation.slow_query_ms and elapsed * 1000 >= sql_instrumentation.slow_query_ms:
+        sql_instrumentation.log_slow_query(conn.engine, statement, parameters, context, executemany, elapsed)
+
+
+class SQLInstrumentation:
+    """
+    Counts and times SQL statements per request.
+
+    Adds ``X-DB-Queries`` and a ``Server-Timing`` ``db`` entry to responses
+    and warns about statement shapes repeated ``n_plus_one_threshold`` times
+    or more within one request. Statements slower than ``slow_query_ms`` are
+    logged, and a sample of them is explained in the background.
+    """
+
+    def __init__(self, n_plus_one_threshold: int = 5):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.slow_query_ms = 0.0
+        self.explain_sample_rate = 0.0
+        self.explain_interval = 300.0
+        self.explain_timeout_ms = 5000
+        self.explain_max_pending = 4
+        self.redact: Sequence[str] = DEFAULT_REDACTED_PARAMETERS
+        self._explained: Dict[str, float] = {}
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def init_app(self, app) -> None:
+        """Attach cursor hooks to the app's engine and per-request hooks to the app."""
+        if not app.config.get('SQL_INSTRUMENTATION_ENABLED', True):
+            return
+        self.n_plus_one_threshold = app.config.get('SQL_N_PLUS_ONE_THRESHOLD', 5)
+        self.slow_query_ms = float(app.config.get('SQL_SLOW_QUERY_MS', 0))
+        self.explain_sample_rate = float(app.config.get('SQL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE', 0.0))
+        self.explain_interval = float(app.config.get('SQL_SLOW_QUERY_EXPLAIN_INTERVAL', 300))
+        self.explain_timeout_ms = int(app.config.get('SQL_SLOW_QUERY_EXPLAIN_TIMEOUT_MS', 5000))
+        self.redact = tuple(
+            fragment.strip().lower()
+            for fragment in app.config.get('SQL_SLOW_QUERY_REDACT', DEFAULT_REDACTED_PARAMETERS)
+            if fragment.strip()
+        )
+
+        from src.models.base import db
+        with app.app_context():
+            self.instrument(db.engine)
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    @staticmethod
+    def instrument(engine) -> None:
+        """Install the cursor hooks on an engine (idempotent)."""
+        if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+            event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+    def log_slow_query(self, engine, statement: str, parameters: Any, context,
+                       executemany: bool, elapsed: float) -> None:
+        """
+        Log one slow statement and maybe queue an EXPLAIN of it.
+
+        Args:
+            engine: Engine the statement ran on
+            statement: SQL as sent to the driver
+            parameters: DBAPI bind parameters
+            context: SQLAlchemy execution context (used for parameter names)
+            executemany: Whether the statement ran once per parameter set
+            elapsed: Duration in seconds
+        """
+        try:
+            shape = statement_shape(statement)
+            compiled = getattr(context, 'compiled', None)
+            names = getattr(compiled, 'positiontup', None)
+            fields: Dict[str, Any] = {
+                'event': 'slow_query',
+                'statement': shape[:2000],
+                'duration_ms': round(elapsed * 1000, 2),
+                'threshold_ms': self.slow_query_ms,
+                'caller': _application_frame(),
+            }
+            if executemany:
+                fields['parameters'] = f'<{len(parameters)} parameter sets>'
+            else:
+                fields['parameters'] = redact_parameters(parameters, names, self.redact)
+            if has_request_context():
+                fields.update(endpoint=request.endpoint, method=request.method, path=request.path)
+            logger.warning("Slow query", extra=fields)
+
+            if not executemany and self._should_explain(shape):
+                self._submit_explain(engine, statement, parameters, fields)
+        except Exception as e:
+            logger.warning(f"Failed to log slow query: {str(e)}")
+
+    def _should_explain(self, shape: str) -> bool:
+        if shape[:6].upper() != 'SELECT' or random.random() >= self.explain_sample_rate:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if len(self._pending) >= self.explain_max_pending:
+                return False
+            last = self._explained.get(shape)
+            if last is not None and now - last < self.explain_interval:
+                return False
+            if len(self._explained) >= 1000:
+                self._explained.clear()
+            self._explained[shape] = now
+        return True
+
+    def _submit_explain(self, engine, statement: str, parameters: Any, fields: Dict) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sql-explain')
+            params = dict(parameters) if isinstance(parameters, dict) else tuple(parameters or ())
+            future = self._executor.submit(self.explain, engine, statement, params, fields)
+            self._pending.add(future)
+        future.add_done_callback(self._explain_done)
+
+    def _explain_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait for queued EXPLAINs to finish."""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending, timeout=timeout)
+
+    def explain(self, engine, statement: str, parameters: Any, fields: Dict) -> Optional[Any]:
+        """
+        Capture and log the plan of a slow statement.
+
+        Uses ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` on PostgreSQL, bounded
+        by a local statement timeout and rolled back, and ``EXPLAIN QUERY PLAN``
+        on SQLite. Runs on its own connection, outside the instrumentation.
+
+        Args:
+            engine: Engine to run the EXPLAIN on
+            statement: SQL as sent to the driver
+            parameters: DBAPI bind parameters of the slow execution
+            fields: Fields of the slow query log record
+
+        Returns:
+            The plan, or None if the dialect is unsupported or EXPLAIN failed
+        """
+        dialect = engine.dialect.name
+        try:
+            with engine.connect() as conn:
+                conn = conn.execution_options(**{_SKIP_OPTION: True})
+                if dialect == 'postgresql':
+                    transaction = conn.begin()
+                    try:
+                        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}")
+                        row = conn.exec_driver_sql(
+                            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+                        ).first()
+                    finally:
+                        transaction.rollback()
+                    plan = row[0] if row else None
+                elif dialect == 'sqlite':
+                    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+                    plan = [{'id': r[0], 'parent': r[1], 'detail': r[-1]} for r in rows]
+                else:
+                    return None
+        except Exception as e:
+            logger.warning(f"EXPLAIN of slow query failed: {str(e)}", extra={'statement': fields.get('statement')})
+            return None
+
+        record = {key: value for key, value in fields.items() if key != 'parameters'}
+        record.update(event='slow_query_plan', dialect=dialect, plan=plan)
+        logger.warning("Slow query plan", extra=record)
+        return plan
+
+    @staticmethod
+    def _start() -> None:
+        request.environ[_STATS_ENVIRON] = QueryStats()
+
+    def _finish(self, response):
+        stats = current_stats()
+        if stats is None:
+            return response
+
+        response.headers['X-DB-Queries'] = str(stats.count)
+        response.headers.add('Server-Timing', f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries"')
+
+        repeated = stats.repeated(self.n_plus_one_threshold)
+        if repeated:
+            response.headers['X-DB-N-Plus-One'] = str(len(repeated))
+            for shape, count in repeated.items():
+                logger.warning(
+                    f"Possible N+1: statement repeated {count} times in {request.method} {request.path}",
+                    extra={'statement': shape[:500], 'repeats': count, 'endpoint': request.endpoint}
+                )
+        return response
+
+
+# Shared instrumentation, configured by create_app
+sql_instrumentation = SQLInstrumentation()
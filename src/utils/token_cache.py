@@ -0,0 +1,137 @@
+"""LRU cache of verified access tokens keyed by token digest."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from src.utils.metrics import record_cache_lookup
+
+
+class VerifiedTokenCache:
+    """
+    Maps SHA-256 digests of verified tokens to their decoded header and claims.
+
+    Entries expire at the token's ``exp`` and the map is bounded by ``max_size``
+    with least-recently-used eviction. Revocation is not cached: callers must
+    still run the blocklist check on every hit.
+    """
+
+    def __init__(self, max_size: int = 1024, enabled: bool = True, clock: Callable[[], float] = time.time):
+        self.max_size = max_size
+        self.enabled = enabled
+        self._clock = clock
+        self._entries: 'OrderedDict[str, Tuple[dict, dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._miss_seconds = 0.0
+        self._hit_seconds = 0.0
+
+    def init_app(self, app) -> None:
+        """Configure size and switch from app config and drop cached tokens."""
+        self.max_size = app.config.get('JWT_VERIFY_CACHE_SIZE', 1024)
+        self.enabled = app.config.get('JWT_VERIFY_CACHE_ENABLED', True)
+        self.clear()
+
+    @staticmethod
+    def digest(token: str) -> str:
+        """Cache key for a raw token."""
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def get(self, token: str) -> Optional[Tuple[dict, dict]]:
+        """
+        Look up a token verified earlier.
+
+        Args:
+            token: Raw encoded JWT
+
+        Returns:
+            (jwt_header, jwt_data) or None if unknown or expired
+        """
+        if not self.enabled:
+            return None
+        key = self.digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1].get('exp', 0) <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, token: str, jwt_header: dict, jwt_data: dict) -> None:
+        """
+        Remember a token that passed full verification.
+
+        Args:
+            token: Raw encoded JWT
+            jwt_header: Decoded header
+            jwt_data: Decoded claims
+        """
+        if not self.enabled or 'exp' not in jwt_data:
+            return
+        key = self.digest(token)
+        with self._lock:
+            self._entries[key] = (jwt_header, jwt_data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, token: str) -> None:
+        """Forget a single token."""
+        with self._lock:
+            self._entries.pop(self.digest(token), None)
+
+    def record(self, hit: bool, seconds: float) -> None:
+        """Account the time spent authenticating one request."""
+        record_cache_lookup('verified_token', hit)
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self._hit_seconds += seconds
+            else:
+                self.misses += 1
+                self._miss_seconds += seconds
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Hit rate and estimated time saved.
+
+        Time saved per hit is the mean full-verification time minus the mean
+        cached lookup time.
+
+        Returns:
+            Dict with size, hits, misses, evictions, hit_rate and saved_ms
+            (total and per hit)
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            miss_avg = self._miss_seconds / self.misses if self.misses else 0.0
+            hit_avg = self._hit_seconds / self.hits if self.hits else 0.0
+            saved_per_hit = max(0.0, miss_avg - hit_avg) if self.misses else 0.0
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0,
+                'saved_ms_per_hit': round(saved_per_hit * 1000, 4),
+                'saved_ms_total': round(saved_per_hit * self.hits * 1000, 2),
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+            self._miss_seconds = self._hit_seconds = 0.0
+
+
+# Shared per-process cache, configured by create_app
+token_cache = VerifiedTokenCache()
@@ -0,0 +1,260 @@
+"""
+OpenTelemetry tracing of requests, services, repositories, SQL and LLM calls.
+
+When ``TRACING_ENABLED`` is set, every request gets a server span whose parent
+is taken from incoming W3C ``traceparent``/``tracestate`` headers, public
+methods of the service and repository classes are wrapped in child spans, and
+each SQL statement and LLM call gets its own span. Spans are sampled with
+``ParentBased(TraceIdRatioBased(TRACING_SAMPLE_RATIO))`` and exported in
+batches to the console, a file of JSON spans, or an OTLP/HTTP collector.
+
+With tracing disabled nothing is wrapped or hooked, so the only cost is the
+``span()`` helper's flag check at the LLM call site.
+"""
+
+import functools
+import inspect
+import sys
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from flask import request
+from sqlalchemy import event
+
+from src.utils.logger import logger
+from src.utils.sql_instrumentation import statement_shape
+
+_SPAN_ENVIRON = 'issue_tracker.span'
+_TOKEN_ENVIRON = 'issue_tracker.trace_token'
+_SQL_SPANS = 'issue_tracker.sql_spans'
+
+TRACE_ID_HEADER = 'X-Trace-Id'
+
+
+def _traced_classes() -> List[type]:
+    """Service and repository classes whose public methods get spans."""
+    import src.repositories as repositories
+    import src.services as services
+    from src.services.suggest_service import SuggestService
+
+    classes = [
+        value for module in (services, repositories)
+        for value in (getattr(module, name) for name in module.__all__)
+        if inspect.isclass(value) and value.__name__.endswith(('Service', 'Repository'))
+    ]
+    return classes + [SuggestService]
+
+
+class Tracing:
+    """Builds the tracer provider and instruments the app when enabled."""
+
+    def __init__(self):
+        self.enabled = False
+        self.provider = None
+        self.tracer = None
+        self._originals: List[Tuple[type, str, Callable]] = []
+
+    def init_app(self, app) -> None:
+        """Configure sampling and export, then instrument requests, classes and SQL."""
+        if not app.config.get('TRACING_ENABLED', False):
+            return
+
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        ratio = float(app.config.get('TRACING_SAMPLE_RATIO', 1.0))
+        self.provider = TracerProvider(
+            resource=Resource.create({
+                'service.name': app.config.get('APP_NAME', 'Issue Tracker API'),
+                'service.version': app.config.get('APP_VERSION', ''),
+            }),
+            sampler=ParentBased(TraceIdRatioBased(ratio)),
+        )
+        exporter = self._exporter(app.config.get('TRACING_EXPORTER', 'console'), app.config)
+        if exporter is not None:
+            self.provider.add_span_processor(BatchSpanProcessor(exporter))
+        self.tracer = self.provider.get_tracer('issue_tracker')
+        self.enabled = True
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+
+        self.instrument_classes(_traced_classes())
+        from src.models.base import db
+        with app.app_context():
+            self.instrument_engine(db.engine)
+
+        logger.info("Tracing enabled", extra={'sample_ratio': ratio})
+
+    @staticmethod
+    def _exporter(name: str, config) -> Optional[Any]:
+        """Span exporter for TRACING_EXPORTER ('console', 'file', 'otlp' or 'none')."""
+        name = (name or 'none').lower()
+        if name == 'console':
+            from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+            return ConsoleSpanExporter(out=sys.stdout)
+        if name == 'file':
+            from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+            path = config.get('TRACING_FILE', 'traces.jsonl')
+            return ConsoleSpanExporter(
+                out=open(path, 'a', encoding='utf-8'),
+                formatter=lambda span: span.to_json(indent=None) + '\n',
+            )
+        if name == 'otlp':
+            try:
+                from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            except ImportError:
+                logger.error("TRACING_EXPORTER=otlp needs opentelemetry-exporter-otlp-proto-http")
+                return None
+            # Endpoint and headers come from the standard OTEL_EXPORTER_OTLP_* variables
+            return OTLPSpanExporter()
+        return None
+
+    def instrument_classes(self, classes: List[type]) -> None:
+        """Wrap the public methods each class defines in spans (idempotent)."""
+        for cls in classes:
+            for name, member in list(vars(cls).items()):
+                if name.startswith('_') or not inspect.isfunction(member):
+                    continue
+                if getattr(member, '__traced__', False):
+                    continue
+                self._originals.append((cls, name, member))
+                setattr(cls, name, self._wrap(cls, name, member))
+
+    def uninstrument_classes(self) -> None:
+        """Restore the methods replaced by instrument_classes."""
+        while self._originals:
+            cls, name, member = self._originals.pop()
+            setattr(cls, name, member)
+
+    def _wrap(self, cls: type, name: str, fn: Callable) -> Callable:
+        namespace = f"{cls.__module__}.{cls.__qualname__}"
+
+        @functools.wraps(fn)
+        def traced(instance, *args, **kwargs):
+            with self.tracer.start_as_current_span(
+                f"{type(instance).__name__}.{name}",
+                attributes={'code.namespace': namespace, 'code.function': name},
+            ) as current:
+                result = fn(instance, *args, **kwargs)
+                # Services report failures as (result, error_message) tuples
+                if (current.is_recording() and isinstance(result, tuple) and len(result) == 2
+                        and isinstance(result[1], str) and result[1]):
+                    current.set_attribute('app.error', result[1])
+                return result
+
+        traced.__traced__ = True
+        return traced
+
+    def instrument_engine(self, engine) -> None:
+        """Give every SQL statement on an engine its own span (idempotent)."""
+        if event.contains(engine, 'before_cursor_execute', self._before_cursor_execute):
+            return
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        event.listen(engine, 'handle_error', self._handle_error)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        from opentelemetry import trace
+        if not trace.get_current_span().is_recording():
+            return
+        shape = statement_shape(statement)
+        current = self.tracer.start_span(
+            shape.split(' ', 1)[0].upper(),
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                'db.system': conn.engine.dialect.name,
+                'db.statement': shape[:2000],
+            },
+        )
+        conn.info.setdefault(_SQL_SPANS, []).append(current)
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get(_SQL_SPANS)
+        if spans:
+            spans.pop().end()
+
+    def _handle_error(self, exception_context) -> None:
+        conn = exception_context.connection
+        spans = conn.info.get(_SQL_SPANS) if conn is not None else None
+        if spans:
+            from opentelemetry.trace import Status, StatusCode
+            current = spans.pop()
+            current.record_exception(exception_context.original_exception)
+            current.set_status(Status(StatusCode.ERROR))
+            current.end()
+
+    def _start(self) -> None:
+        from opentelemetry import context, propagate, trace
+        parent = propagate.extract(request.headers)
+        route = request.url_rule.rule if request.url_rule else request.path
+        current = self.tracer.start_span(
+            f"{request.method} {route}",
+            context=parent,
+            kind=trace.SpanKind.SERVER,
+            attributes={
+                'http.request.method': request.method,
+                'http.route': route,
+                'url.path': request.path,
+            },
+        )
+        request.environ[_SPAN_ENVIRON] = current
+        request.environ[_TOKEN_ENVIRON] = context.attach(trace.set_span_in_context(current, parent))
+
+    @staticmethod
+    def _finish(response):
+        current = request.environ.get(_SPAN_ENVIRON)
+        if current is not None:
+            current.set_attribute('http.response.status_code', response.status_code)
+            span_context = current.get_span_context()
+            if span_context.is_valid:
+                response.headers[TRACE_ID_HEADER] = format(span_context.trace_id, '032x')
+        return response
+
+    @staticmethod
+    def _teardown(exc: Optional[BaseException] = None) -> None:
+        from opentelemetry import context
+        current = request.environ.pop(_SPAN_ENVIRON, None)
+        token = request.environ.pop(_TOKEN_ENVIRON, None)
+        if current is None:
+            return
+        if exc is not None:
+            from opentelemetry.trace import Status, StatusCode
+            current.record_exception(exc)
+            current.set_status(Status(StatusCode.ERROR))
+        current.end()
+        if token is not None:
+            context.detach(token)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Any]]:
+        """
+        Child span around a block, or nothing when tracing is disabled.
+
+        Args:
+            name: Span name
+            attributes: Span attributes
+
+        Yields:
+            The span, or None when tracing is disabled
+        """
+        if not self.enabled:
+            yield None
+            return
+        with self.tracer.start_as_current_span(name, attributes=attributes) as current:
+            yield current
+
+    def current_trace_id(self) -> Optional[str]:
+        """Hex trace id of the active span, if tracing is enabled and sampling it."""
+        if not self.enabled:
+            return None
+        from opentelemetry import trace
+        span_context = trace.get_current_span().get_span_context()
+        return format(span_context.trace_id, '032x') if span_context.is_valid else None
+
+
+# Shared tracing, configured by create_app
+tracing = Tracing()
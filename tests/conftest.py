@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+from contextlib import contextmanager
 from src.app import create_app
 from src.models.base import db as _db
 from src.models import User, Project, Issue, Label, Comment
@@ -48,6 +49,28 @@ def runner(app, db):
     return app.test_cli_runner()
 
 
+@pytest.fixture
+def query_budget(db):
+    """
+    Assert that a block runs at most ``max_queries`` SQL statements.
+    
+    Usage:
+        with query_budget(3):
+            client.get(...)
+    """
+    from src.utils.sql_instrumentation import capture_queries
+    
+    @contextmanager
+    def budget(max_queries):
+        with capture_queries() as statements:
+            yield statements
+        assert len(statements) <= max_queries, (
+            f"{len(statements)} queries, budget {max_queries}:\n" + "\n".join(statements)
+        )
+    
+    return budget
+
+
 # ── Users ──────────────────────────────────────────────────────────────────
 
 @pytest.fixture
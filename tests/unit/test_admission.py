@@ -0,0 +1,138 @@
+"""Unit tests for admission control and load shedding."""
+
+import logging
+
+import pytest
+from flask import Flask
+from prometheus_client import REGISTRY
+from sqlalchemy.pool import QueuePool
+from src.middleware.admission import CRITICAL, LOW, WRITE, AdmissionController, admission_control
+from src.utils.db_pool import pool_pressure
+
+
+@pytest.fixture
+def controller():
+    """Controller with room for four requests, a quarter of them reserved."""
+    controller = AdmissionController()
+    controller.max_in_flight = 4
+    controller.reserved = 0.25
+    return controller
+
+
+@pytest.fixture
+def worker_app(tmp_path):
+    """Bare app with its own QueuePool engine, sized like a worker's."""
+    from src.models.base import db
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'worker.db'}",
+        SQLALCHEMY_ENGINE_OPTIONS={'poolclass': QueuePool, 'pool_size': 4, 'max_overflow': 2},
+    )
+    db.init_app(app)
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def congested_pool():
+    """Pool pressure as if checkouts were waiting half a second."""
+    pool_pressure.reset()
+    pool_pressure.enter()
+    pool_pressure.average_wait = 0.5
+    yield pool_pressure
+    pool_pressure.reset()
+
+
+@pytest.fixture
+def saturated(monkeypatch):
+    """Shared controller with every slot taken."""
+    monkeypatch.setattr(admission_control, 'in_flight', admission_control.max_in_flight)
+    return admission_control
+
+
+@pytest.mark.unit
+class TestAdmissionController:
+    """src.middleware.admission.AdmissionController"""
+
+    def test_reserved_share_by_priority(self, controller):
+        assert [controller.try_admit(LOW)[0] for _ in range(4)] == [True, True, True, False]
+        assert controller.try_admit(LOW) == (False, 'in_flight')
+        assert controller.try_admit(WRITE) == (True, None)
+        assert controller.try_admit(WRITE) == (False, 'in_flight')
+        assert controller.try_admit(CRITICAL) == (True, None)
+        assert controller.in_flight == 5
+
+        for _ in range(3):
+            controller.release()
+        assert controller.try_admit(LOW) == (True, None)
+
+    def test_disabled_by_default_on_sync_workers(self, worker_app, caplog):
+        caplog.set_level(logging.WARNING, logger='issue_tracker')
+        worker_app.config['WEB_THREADS'] = 1
+        controller = AdmissionController()
+        controller.init_app(worker_app)
+
+        assert controller._admit not in worker_app.before_request_funcs.get(None, [])
+        assert not [r for r in caplog.records if r.getMessage().startswith('Admission in-flight limit')]
+
+    def test_explicitly_enabled_sync_workers_warn(self, worker_app, caplog):
+        caplog.set_level(logging.WARNING, logger='issue_tracker')
+        worker_app.config.update(WEB_THREADS=1, ADMISSION_ENABLED=True)
+        controller = AdmissionController()
+        controller.init_app(worker_app)
+
+        assert controller.max_in_flight == 1
+        assert controller.try_admit(LOW) == (True, None)
+        record = [r for r in caplog.records if r.getMessage().startswith('Admission in-flight limit')][-1]
+        assert record.web_threads == 1
+
+    def test_limit_capped_by_pool_size(self, worker_app, caplog):
+        caplog.set_level(logging.WARNING, logger='issue_tracker')
+        worker_app.config['WEB_THREADS'] = 8
+        controller = AdmissionController()
+        controller.init_app(worker_app)
+
+        assert controller._admit in worker_app.before_request_funcs[None]
+        assert controller.max_in_flight == 4
+        assert [controller.try_admit(LOW)[0] for _ in range(4)] == [True, True, True, False]
+        assert not [r for r in caplog.records if r.getMessage().startswith('Admission in-flight limit')]
+
+    def test_pool_congestion_sheds_low_priority_only(self, controller, congested_pool):
+        assert controller.try_admit(LOW) == (False, 'pool_wait')
+        assert controller.try_admit(WRITE) == (True, None)
+
+        congested_pool.exit(0.0)
+        congested_pool.last_sample -= 60
+        assert controller.try_admit(LOW) == (True, None)
+
+
+@pytest.mark.unit
+class TestAdmissionMiddleware:
+    """Requests shed by the shared controller"""
+
+    def test_low_priority_shed_with_retry_after(self, client, auth_headers, saturated):
+        rejected = REGISTRY.get_sample_value(
+            'admission_rejected_total', {'priority': 'low', 'reason': 'in_flight'}
+        ) or 0
+
+        response = client.get('/api/v1/projects', headers=auth_headers)
+
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+        assert response.get_json()['error']['code'] == 'OVERLOADED'
+        assert REGISTRY.get_sample_value(
+            'admission_rejected_total', {'priority': 'low', 'reason': 'in_flight'}
+        ) == rejected + 1
+        assert saturated.in_flight == saturated.max_in_flight
+
+    def test_health_and_auth_admitted(self, client, saturated):
+        assert client.get('/api/v1/health/live').status_code == 200
+        response = client.post('/api/v1/auth/login', json={'username': 'nobody', 'password': 'wrong'})
+        assert response.status_code != 503
+        assert saturated.in_flight == saturated.max_in_flight
+
+    def test_admitted_request_released(self, client, auth_headers):
+        before = admission_control.in_flight
+        assert client.get('/api/v1/projects', headers=auth_headers).status_code == 200
+        assert admission_control.in_flight == before
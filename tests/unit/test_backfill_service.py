@@ -0,0 +1,136 @@
+"""Unit tests for the bulk classification backfill."""
+
+import json
+
+import pytest
+from src.models import Issue
+from src.services import BackfillService, IssueService
+from src.utils.resilience import CircuitBreaker
+
+
+class _FakeSuggestService:
+    """Classifies every issue as high priority, counting prompts."""
+
+    def __init__(self, fail_ids=(), down=False):
+        self.prompts = []
+        self.fail_ids = set(fail_ids)
+        self.down = down
+        self.breaker = CircuitBreaker()
+
+    def suggest_batch(self, issues):
+        self.prompts.append([issue['id'] for issue in issues])
+        if self.down:
+            return None, 'provider unavailable'
+        return {
+            issue['id']: {'priority': 'high', 'status': 'open', 'confidence': 'high', 'reason': ''}
+            for issue in issues if issue['id'] not in self.fail_ids
+        }, None
+
+
+@pytest.fixture
+def many_issues(db, sample_project, sample_user):
+    service = IssueService()
+    return [
+        service.create_issue(sample_project.id, f'Issue {i}', sample_user.id)[0].id
+        for i in range(7)
+    ]
+
+
+@pytest.mark.unit
+class TestBackfillService:
+    """BackfillService.run"""
+
+    def test_backfill_classifies_in_batches(self, db, many_issues):
+        fake = _FakeSuggestService()
+        stats = BackfillService(suggest_service=fake).run(chunk_size=4, batch_size=2, concurrency=2)
+
+        assert stats['processed'] == 7
+        assert stats['classified'] == 7
+        assert stats['prompts'] == 4
+        assert all(len(prompt) <= 2 for prompt in fake.prompts)
+
+        db.session.expire_all()
+        issues = db.session.query(Issue).all()
+        assert {issue.suggested_priority for issue in issues} == {'high'}
+        assert {issue.priority for issue in issues} == {'medium'}
+
+    def test_backfill_applies_project_threshold(self, db, sample_project, many_issues):
+        sample_project.auto_triage_min_confidence = 'high'
+        db.session.commit()
+
+        BackfillService(suggest_service=_FakeSuggestService()).run(chunk_size=10)
+
+        db.session.expire_all()
+        assert {issue.priority for issue in db.session.query(Issue).all()} == {'high'}
+
+    def test_backfill_resumes_from_checkpoint(self, db, many_issues, tmp_path):
+        checkpoint = tmp_path / 'checkpoint.json'
+        first = BackfillService(suggest_service=_FakeSuggestService()).run(
+            chunk_size=3, checkpoint_path=str(checkpoint), limit=3
+        )
+        assert first['processed'] == 3
+        assert json.loads(checkpoint.read_text())['last_id'] == many_issues[2]
+
+        fake = _FakeSuggestService()
+        second = BackfillService(suggest_service=fake).run(chunk_size=3, checkpoint_path=str(checkpoint))
+        assert second['processed'] == 4
+        assert min(issue_id for prompt in fake.prompts for issue_id in prompt) == many_issues[3]
+
+    def test_failed_issues_are_counted(self, db, many_issues):
+        fake = _FakeSuggestService(fail_ids={many_issues[0]})
+        stats = BackfillService(suggest_service=fake).run(chunk_size=10)
+        assert stats['failed'] == 1
+        assert stats['classified'] == 6
+        assert stats['issues_per_second'] > 0
+        assert stats['pending_retry'] == 1
+
+    def test_failed_issues_retried_on_resume(self, db, many_issues, tmp_path):
+        checkpoint = tmp_path / 'checkpoint.json'
+        failing = _FakeSuggestService(fail_ids={many_issues[1], many_issues[4]})
+        first = BackfillService(suggest_service=failing).run(chunk_size=3, checkpoint_path=str(checkpoint))
+        assert first['failed'] == 2
+        state = json.loads(checkpoint.read_text())
+        assert state == {'last_id': many_issues[-1], 'failed_ids': [many_issues[1], many_issues[4]]}
+
+        fake = _FakeSuggestService()
+        second = BackfillService(suggest_service=fake).run(chunk_size=3, checkpoint_path=str(checkpoint))
+        assert second['processed'] == 2
+        assert second['classified'] == 2
+        assert sorted(issue_id for prompt in fake.prompts for issue_id in prompt) == [many_issues[1], many_issues[4]]
+        assert json.loads(checkpoint.read_text())['failed_ids'] == []
+
+        db.session.expire_all()
+        assert db.session.query(Issue).filter(Issue.suggested_priority.is_(None)).count() == 0
+
+    def test_provider_outage_stops_without_advancing(self, db, many_issues, tmp_path):
+        checkpoint = tmp_path / 'checkpoint.json'
+        down = _FakeSuggestService(down=True)
+        stats = BackfillService(suggest_service=down).run(
+            chunk_size=2, checkpoint_path=str(checkpoint), max_failed_chunks=2
+        )
+
+        assert stats['stopped_early'] is True
+        assert len(down.prompts) == 2
+        assert json.loads(checkpoint.read_text()) == {'last_id': 0, 'failed_ids': []}
+
+        stats = BackfillService(suggest_service=_FakeSuggestService()).run(
+            chunk_size=2, checkpoint_path=str(checkpoint)
+        )
+        assert stats['stopped_early'] is False
+        assert stats['classified'] == 7
+
+    def test_open_breaker_stops_after_first_failed_chunk(self, db, many_issues, tmp_path):
+        checkpoint = tmp_path / 'checkpoint.json'
+        first = BackfillService(suggest_service=_FakeSuggestService()).run(
+            chunk_size=2, checkpoint_path=str(checkpoint), limit=2
+        )
+        assert first['classified'] == 2
+
+        down = _FakeSuggestService(down=True)
+        down.breaker.failure_threshold = 1
+        down.breaker.record_failure()
+        stats = BackfillService(suggest_service=down).run(chunk_size=2, checkpoint_path=str(checkpoint))
+
+        assert stats['stopped_early'] is True
+        assert len(down.prompts) == 1
+        assert json.loads(checkpoint.read_text())['last_id'] == many_issues[1]
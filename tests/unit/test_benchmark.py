@@ -0,0 +1,132 @@
+"""Unit tests for the stub LLM server and the offline benchmark harness."""
+
+import json
+
+import pytest
+from src.evals import load_golden_cases, load_regression_thresholds, percentile, run_benchmark
+from src.evals.benchmark import check_thresholds
+from src.evals.stub_server import StubLLMServer, classify_prompt, label_map
+from src.services.suggest_service import CLASSIFY_BATCH_TEMPLATE, CLASSIFY_TEMPLATE
+
+
+@pytest.fixture(autouse=True)
+def fast_suggest_env(monkeypatch):
+    """Keep retries short and disable the heuristic fallback."""
+    monkeypatch.setenv('SUGGEST_TIMEOUT', '2')
+    monkeypatch.setenv('SUGGEST_MAX_RETRIES', '2')
+    monkeypatch.delenv('SUGGEST_FALLBACK', raising=False)
+    monkeypatch.delenv('SUGGEST_HEDGE_DELAY', raising=False)
+
+
+@pytest.mark.unit
+class TestStubServer:
+    """src.evals.stub_server"""
+
+    def test_classify_single_prompt(self):
+        labels = {'SQL injection in search': {'priority': 'critical', 'status': 'open'}}
+        prompt = CLASSIFY_TEMPLATE.format(title='SQL injection in search', description='Found by audit')
+        answer = json.loads(classify_prompt(prompt, labels=labels))
+        assert answer['priority'] == 'critical'
+        assert answer['confidence'] == 'medium'
+
+        unknown = CLASSIFY_TEMPLATE.format(title='Something else', description='n/a')
+        assert json.loads(classify_prompt(unknown, labels=labels))['priority'] == 'medium'
+
+    def test_classify_batch_prompt(self):
+        labels = {'SQL injection in search': {'priority': 'critical', 'status': 'open'}}
+        issues = (
+            "Issue id: 7\nIssue title: SQL injection in search\nIssue description: audit\n\n"
+            "Issue id: 9\nIssue title: Typo in footer\nIssue description: minor"
+        )
+        answer = json.loads(classify_prompt(CLASSIFY_BATCH_TEMPLATE.format(issues=issues), labels=labels))
+        assert [item['id'] for item in answer] == [7, 9]
+        assert [item['priority'] for item in answer] == ['critical', 'medium']
+
+    def test_error_rate_gives_wrong_priorities(self):
+        cases = load_golden_cases()
+        labels = label_map(cases)
+        prompts = [
+            CLASSIFY_TEMPLATE.format(title=case['input']['title'], description='x') for case in cases
+        ]
+        wrong = sum(
+            json.loads(classify_prompt(prompt, labels=labels, error_rate=1.0))['priority'] != case['expected']['priority']
+            for prompt, case in zip(prompts, cases)
+        )
+        assert wrong == len(cases)
+
+    def test_request_rng_is_deterministic(self):
+        first = StubLLMServer(seed=3)
+        second = StubLLMServer(seed=3)
+        try:
+            draws = [first.request_rng('p').random() for _ in range(3)]
+            assert draws == [second.request_rng('p').random() for _ in range(3)]
+            assert len(set(draws)) == 3
+        finally:
+            first.stop()
+            second.stop()
+
+
+@pytest.mark.unit
+class TestBenchmark:
+    """src.evals.benchmark"""
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([], 50) == 0.0
+
+    def test_check_thresholds_against_baseline(self):
+        thresholds = {'priority': 0.10, 'status': 0.05}
+        result = check_thresholds({'priority': 0.85, 'status': 1.0}, thresholds, baseline={'priority': 0.9})
+        assert result['passed'] is True
+        assert check_thresholds({'priority': 0.85, 'status': 1.0}, thresholds)['passed'] is False
+
+    def test_stub_benchmark_reports_latency_and_accuracy(self):
+        cases = load_golden_cases()
+        report = run_benchmark(
+            cases,
+            load_regression_thresholds(),
+            concurrency=4,
+            repeat=2,
+            stub_options={'latency_ms': 5, 'jitter_ms': 5},
+        )
+        assert report['requests'] == 2 * len(cases)
+        assert report['errors'] == 0
+        assert set(report['latency_ms']) == {'p50', 'p95', 'p99', 'max'}
+        assert report['latency_ms']['p50'] <= report['latency_ms']['p99']
+        assert report['accuracy']['priority'] == 1.0
+        assert report['passed'] is True
+
+    def test_gate_fails_when_accuracy_drops(self):
+        report = run_benchmark(
+            load_golden_cases(),
+            load_regression_thresholds(),
+            repeat=2,
+            stub_options={'error_rate': 0.5, 'seed': 1},
+        )
+        assert report['errors'] == 0
+        assert report['accuracy']['priority'] < 0.9
+        assert report['regression']['priority'] > 0.10
+        assert report['passed'] is False
+
+    def test_cli_exits_nonzero_on_fail(self, app):
+        result = app.test_cli_runner().invoke(args=[
+            'bench-suggest', '--repeat', '1', '--latency-ms', '0', '--jitter-ms', '0', '--error-rate', '0.5',
+        ])
+        assert result.exit_code == 1
+        assert result.output.strip().endswith('FAIL')
+
+    def test_injected_failures_are_retried(self):
+        report = run_benchmark(
+            load_golden_cases(),
+            load_regression_thresholds(),
+            stub_options={'failure_rate': 0.3, 'seed': 1},
+        )
+        assert report['stub']['injected_failures'] > 0
+        assert report['stub']['calls'] > report['requests']
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            run_benchmark([], {}, backend='nope')
@@ -0,0 +1,109 @@
+"""Unit tests for per-request time budgets."""
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from src.utils.deadlines import RequestDeadlines, deadline_scope, remaining_time, request_deadlines
+
+# Runs for seconds on SQLite unless interrupted
+SLOW_QUERY = text(
+    'WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 100000000) '
+    'SELECT count(*) FROM n'
+)
+
+
+class _RecordingCursor:
+    def __init__(self, statements):
+        self.statements = statements
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+    def close(self):
+        pass
+
+
+class _PostgresConnection:
+    """Just enough of a Connection for the begin hook."""
+
+    def __init__(self):
+        self.statements = []
+        self.dialect = type('Dialect', (), {'name': 'postgresql'})()
+        dbapi_connection = type('DBAPIConnection', (), {'cursor': lambda _: _RecordingCursor(self.statements)})()
+        self.connection = type('PoolProxy', (), {'dbapi_connection': dbapi_connection})()
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'deadlines.db'}")
+    RequestDeadlines.instrument(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestDeadlineEnforcement:
+    """Statement timeouts on SQLite and PostgreSQL"""
+
+    def test_sqlite_statement_interrupted(self, sqlite_engine):
+        with deadline_scope(0.05):
+            with pytest.raises(OperationalError, match='interrupted'):
+                with sqlite_engine.connect() as conn:
+                    conn.execute(SLOW_QUERY)
+        assert sqlite_engine.pool.checkedout() == 0
+
+        with sqlite_engine.connect() as conn:
+            assert conn.execute(text('SELECT 1')).scalar() == 1
+
+    def test_postgres_transaction_gets_statement_timeout(self):
+        from src.utils.deadlines import _on_begin
+
+        conn = _PostgresConnection()
+        _on_begin(conn)
+        assert conn.statements == []
+
+        with deadline_scope(2.5):
+            _on_begin(conn)
+        assert len(conn.statements) == 1
+        assert conn.statements[0].startswith('SET LOCAL statement_timeout = ')
+        assert 2000 < int(conn.statements[0].rsplit(' ', 1)[1]) <= 2500
+
+    def test_scope_restored(self):
+        assert remaining_time() is None
+        with deadline_scope(1):
+            assert 0 < remaining_time() <= 1
+        assert remaining_time() is None
+
+    def test_budget_for_class(self, app):
+        assert request_deadlines.budget_for('search') == app.config['TIME_BUDGETS']['search']
+        assert request_deadlines.budget_for('unknown') == request_deadlines.budget_for(None)
+
+
+@pytest.mark.unit
+class TestRequestDeadlines:
+    """504 responses for requests that run out of time"""
+
+    def test_slow_query_returns_504(self, client, auth_headers, db, monkeypatch):
+        from src.services import ProjectService
+
+        def slow_projects(self, user_id):
+            db.session.execute(SLOW_QUERY)
+            return []
+
+        monkeypatch.setattr(ProjectService, 'get_user_projects', slow_projects)
+        monkeypatch.setitem(request_deadlines.budgets, 'default', 0.05)
+        exceeded = REGISTRY.get_sample_value('request_deadline_exceeded_total', {'budget': 'default'}) or 0
+
+        response = client.get('/api/v1/projects', headers=auth_headers)
+
+        assert response.status_code == 504
+        assert response.get_json()['error']['code'] == 'DEADLINE_EXCEEDED'
+        assert response.headers['X-Content-Type-Options'] == 'nosniff'
+        assert REGISTRY.get_sample_value('request_deadline_exceeded_total', {'budget': 'default'}) == exceeded + 1
+        assert db.session.execute(text('SELECT 1')).scalar() == 1
+
+    def test_within_budget_unchanged(self, client, auth_headers):
+        response = client.get('/api/v1/projects', headers=auth_headers)
+        assert response.status_code == 200
+        assert remaining_time() is None
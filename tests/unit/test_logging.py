@@ -0,0 +1,73 @@
+"""Unit tests for the queued, sampled logging pipeline."""
+
+import logging
+import threading
+
+import pytest
+from src.utils.logger import (
+    BackgroundQueueHandler,
+    SamplingFilter,
+    _listeners,
+    parse_sample_rates,
+    setup_logger,
+    stop_logger,
+)
+
+
+def _record(name, level=logging.INFO):
+    return logging.makeLogRecord({'name': name, 'levelno': level, 'msg': 'x'})
+
+
+@pytest.mark.unit
+class TestPipeline:
+    """src.utils.logger"""
+
+    def test_written_by_background_thread(self, capsys):
+        writers = []
+
+        class RecordingFilter(logging.Filter):
+            def filter(self, record):
+                writers.append(threading.current_thread())
+                return True
+
+        test_logger = setup_logger('issue_tracker_pipeline_test', 'INFO', 'text')
+        assert isinstance(test_logger.handlers[0], BackgroundQueueHandler)
+        _listeners['issue_tracker_pipeline_test'].handlers[0].addFilter(RecordingFilter())
+
+        test_logger.info("Issue updated", extra={'issue_id': 7})
+        stop_logger('issue_tracker_pipeline_test')
+
+        assert 'Issue updated issue_id=7' in capsys.readouterr().out
+        assert writers and writers[0] is not threading.current_thread()
+
+    def test_full_queue_drops(self):
+        import queue
+        handler = BackgroundQueueHandler(queue.Queue(1))
+        handler.handle(_record('a'))
+        handler.handle(_record('a'))
+        assert handler.dropped == 1
+
+    def test_sampling_by_logger_hierarchy(self):
+        sampler = SamplingFilter(parse_sample_rates('issue_tracker.access=0, other=1'))
+        assert not sampler.filter(_record('issue_tracker.access'))
+        assert not sampler.filter(_record('issue_tracker.access.health'))
+        assert sampler.filter(_record('issue_tracker.access', logging.WARNING))
+        assert sampler.filter(_record('issue_tracker'))
+        assert sampler.filter(_record('other'))
+
+
+@pytest.mark.unit
+class TestRequestId:
+    """Request ids on responses and log records"""
+
+    def test_incoming_id_reused_and_logged(self, client, caplog):
+        caplog.set_level(logging.INFO, logger='issue_tracker')
+        response = client.get('/api/v1/ping', headers={'X-Request-ID': 'abc-123'})
+        assert response.headers['X-Request-ID'] == 'abc-123'
+        access = [r for r in caplog.records if r.name == 'issue_tracker.access'][-1]
+        assert access.request_id == 'abc-123'
+
+    def test_generated_when_missing_or_malformed(self, client):
+        response = client.get('/api/v1/ping', headers={'X-Request-ID': 'bad id'})
+        request_id = response.headers['X-Request-ID']
+        assert len(request_id) == 32 and request_id != client.get('/api/v1/ping').headers['X-Request-ID']
@@ -0,0 +1,104 @@
+"""Unit tests for login throttling."""
+
+import pytest
+from src.services import AuthService
+from src.utils.login_guard import LoginGuard, LoginThrottledError, login_guard
+from src.utils.password_hashing import password_hasher
+
+
+@pytest.fixture
+def clock():
+    now = [0.0]
+    return now
+
+
+@pytest.fixture
+def guard(clock):
+    return LoginGuard(max_per_user=3, max_per_ip=5, window=60, backoff_base=2, backoff_max=30,
+                      max_entries=4, clock=lambda: clock[0])
+
+
+@pytest.fixture
+def fresh_login_guard():
+    """Clear the shared guard around a test."""
+    login_guard.reset()
+    yield login_guard
+    login_guard.reset()
+
+
+@pytest.mark.unit
+class TestLoginGuard:
+    """src.utils.login_guard"""
+
+    def test_locks_username_after_limit(self, guard):
+        for _ in range(3):
+            guard.check('alice')
+            guard.record_failure('alice')
+        with pytest.raises(LoginThrottledError) as exc:
+            guard.check('ALICE')
+        assert exc.value.retry_after == 2
+
+    def test_backoff_doubles_and_caps(self, guard, clock):
+        for _ in range(3):
+            guard.record_failure('alice')
+        clock[0] = 3.0
+        guard.record_failure('alice')
+        with pytest.raises(LoginThrottledError) as exc:
+            guard.check('alice')
+        assert exc.value.retry_after == 4
+
+        for _ in range(10):
+            guard.record_failure('alice')
+        with pytest.raises(LoginThrottledError) as exc:
+            guard.check('alice')
+        assert exc.value.retry_after == 30
+
+    def test_ip_limit_spans_usernames(self, guard):
+        for i in range(5):
+            guard.record_failure(f'user{i}', '10.0.0.1')
+        with pytest.raises(LoginThrottledError):
+            guard.check('someone-else', '10.0.0.1')
+        guard.check('someone-else', '10.0.0.2')
+
+    def test_window_slides(self, guard, clock):
+        guard.record_failure('alice')
+        guard.record_failure('alice')
+        clock[0] = 150.0
+        guard.record_failure('alice')
+        guard.check('alice')
+
+    def test_success_clears_username(self, guard):
+        guard.record_failure('alice')
+        guard.record_failure('alice')
+        guard.record_success('alice')
+        guard.record_failure('alice')
+        guard.check('alice')
+
+    def test_entries_are_bounded(self, guard):
+        for i in range(20):
+            guard.record_failure(f'user{i}')
+        assert len(guard) == 4
+
+
+@pytest.mark.unit
+class TestLoginThrottling:
+    """AuthService.login and the login route with the shared guard"""
+
+    def test_unknown_user_runs_dummy_verify(self, db, fresh_login_guard, monkeypatch):
+        calls = []
+        original = password_hasher.verify_dummy
+        monkeypatch.setattr(password_hasher, 'verify_dummy', lambda *a: calls.append(a) or original(*a))
+
+        result, error = AuthService().login('ghost', 'Whatever123!')
+
+        assert error == 'Invalid credentials'
+        assert len(calls) == 1
+
+    def test_route_returns_429_after_repeated_failures(self, client, sample_user, fresh_login_guard):
+        for _ in range(5):
+            response = client.post('/api/v1/auth/login', json={'username': 'testuser', 'password': 'Wrong123!'})
+            assert response.status_code == 401
+
+        response = client.post('/api/v1/auth/login', json={'username': 'testuser', 'password': 'TestPass123!'})
+        assert response.status_code == 429
+        assert int(response.headers['Retry-After']) >= 1
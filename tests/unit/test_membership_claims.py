@@ -0,0 +1,91 @@
+"""Unit tests for project role claims in access tokens."""
+
+import pytest
+from flask_jwt_extended import decode_token
+from sqlalchemy import event
+from src.services import ProjectService
+from src.services import membership_claims
+
+
+@pytest.fixture
+def project_claims(app, monkeypatch):
+    """Enable project claims for the test."""
+    monkeypatch.setitem(app.config, 'JWT_PROJECT_CLAIMS', True)
+    return app.config
+
+
+@pytest.fixture
+def sql_statements(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _login(client, username, password):
+    data = client.post('/api/v1/auth/login', json={'username': username, 'password': password}).get_json()
+    return data['data']['access_token']
+
+
+@pytest.mark.unit
+class TestMembershipClaims:
+    """src.services.membership_claims"""
+
+    def test_login_embeds_project_roles(self, client, sample_project, project_claims):
+        claims = decode_token(_login(client, 'testuser', 'TestPass123!'))
+        assert claims['prj'] == {str(sample_project.id): 'o'}
+        assert isinstance(claims['pe'], int)
+
+    def test_disabled_by_default(self, client, sample_project):
+        claims = decode_token(_login(client, 'testuser', 'TestPass123!'))
+        assert 'prj' not in claims and 'pe' not in claims
+
+    def test_read_needs_no_membership_query(self, client, sample_project, project_claims, sql_statements):
+        headers = {'Authorization': f"Bearer {_login(client, 'testuser', 'TestPass123!')}"}
+        sql_statements.clear()
+        response = client.get(f'/api/v1/projects/{sample_project.id}', headers=headers)
+        assert response.status_code == 200
+        assert not any('project_members' in statement for statement in sql_statements)
+
+    def test_warm_read_needs_no_epoch_query(self, client, sample_project, project_claims, sql_statements):
+        headers = {'Authorization': f"Bearer {_login(client, 'testuser', 'TestPass123!')}"}
+        assert client.get(f'/api/v1/projects/{sample_project.id}', headers=headers).status_code == 200
+        sql_statements.clear()
+        response = client.get(f'/api/v1/projects/{sample_project.id}', headers=headers)
+        assert response.status_code == 200
+        assert not any('membership_epoch' in statement for statement in sql_statements)
+
+    def test_membership_change_invalidates_claims(self, client, sample_project, sample_user,
+                                                  second_user, project_claims):
+        headers = {'Authorization': f"Bearer {_login(client, 'seconduser', 'SecondPass123!')}"}
+        assert client.get(f'/api/v1/projects/{sample_project.id}', headers=headers).status_code == 403
+
+        ProjectService().add_member(sample_project.id, sample_user.id, second_user.id)
+
+        assert client.get(f'/api/v1/projects/{sample_project.id}', headers=headers).status_code == 200
+
+    def test_removal_invalidates_cached_epoch(self, client, sample_project, sample_user,
+                                              second_user, project_claims):
+        ProjectService().add_member(sample_project.id, sample_user.id, second_user.id)
+        headers = {'Authorization': f"Bearer {_login(client, 'seconduser', 'SecondPass123!')}"}
+        assert client.get(f'/api/v1/projects/{sample_project.id}', headers=headers).status_code == 200
+
+        ProjectService().remove_member(sample_project.id, sample_user.id, second_user.id)
+
+        assert client.get(f'/api/v1/projects/{sample_project.id}', headers=headers).status_code == 403
+
+    def test_digest_for_many_projects(self, client, sample_project, project_claims, monkeypatch):
+        monkeypatch.setitem(project_claims, 'JWT_PROJECT_CLAIMS_MAX', 0)
+        token = _login(client, 'testuser', 'TestPass123!')
+        claims = decode_token(token)
+        assert 'prj' not in claims and len(claims['prjd']) == 32
+
+        membership_claims._digest_maps.clear()
+        response = client.get(f'/api/v1/projects/{sample_project.id}',
+                              headers={'Authorization': f'Bearer {token}'})
+        assert response.status_code == 200
+        assert claims['prjd'] in membership_claims._digest_maps
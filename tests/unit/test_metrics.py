@@ -0,0 +1,45 @@
+"""Unit tests for the Prometheus metrics endpoint."""
+
+import pytest
+from prometheus_client import REGISTRY
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """src.utils.metrics and GET /metrics"""
+
+    def test_request_latency_recorded_per_route(self, client):
+        labels = {'method': 'GET', 'route': '/api/v1/ping', 'blueprint': 'health', 'status': '200'}
+        before = _sample('http_request_duration_seconds_count', **labels)
+        client.get('/api/v1/ping')
+        assert _sample('http_request_duration_seconds_count', **labels) == before + 1
+
+    def test_exposition_format(self, client):
+        client.get('/api/v1/ping')
+        response = client.get('/metrics')
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain')
+        body = response.get_data(as_text=True)
+        for name in ('http_request_duration_seconds_bucket', 'http_requests_in_progress',
+                     'db_pool_checked_out', 'llm_calls_total', 'cache_lookups_total'):
+            assert name in body
+
+    def test_in_progress_returns_to_zero(self, client):
+        client.get('/api/v1/ping')
+        assert _sample('http_requests_in_progress') == 0
+
+    def test_cache_lookups_counted(self, client, auth_headers):
+        before = _sample('cache_lookups_total', cache='verified_token', result='hit')
+        client.get('/api/v1/auth/me', headers=auth_headers)
+        client.get('/api/v1/auth/me', headers=auth_headers)
+        assert _sample('cache_lookups_total', cache='verified_token', result='hit') >= before + 1
+
+    def test_token_required_when_configured(self, app, client, monkeypatch):
+        monkeypatch.setitem(app.config, 'METRICS_TOKEN', 'scrape-secret')
+        assert client.get('/metrics').status_code == 401
+        response = client.get('/metrics', headers={'Authorization': 'Bearer scrape-secret'})
+        assert response.status_code == 200
@@ -0,0 +1,76 @@
+"""Unit tests for the bounded password hashing pool."""
+
+import pytest
+from src.services import AuthService
+from src.utils.password_hashing import (
+    HashingBusyError,
+    PasswordHasher,
+    hash_cost,
+    needs_rehash,
+    password_hasher,
+)
+
+
+@pytest.fixture
+def saturated_hasher():
+    """Make the shared hasher reject every call."""
+    previous = (password_hasher.workers, password_hasher.max_pending, password_hasher.timeout)
+    password_hasher.configure(workers=0, max_pending=0, timeout=previous[2])
+    yield password_hasher
+    password_hasher.configure(*previous)
+
+
+@pytest.mark.unit
+class TestPasswordHasher:
+    """src.utils.password_hashing"""
+
+    def test_hash_cost(self):
+        hasher = PasswordHasher(workers=0)
+        assert hash_cost(hasher.hash('secret', 5)) == 5
+        assert hash_cost('not-a-hash') is None
+
+    def test_needs_rehash(self):
+        hashed = PasswordHasher(workers=0).hash('secret', 4)
+        assert needs_rehash(hashed, 4) is False
+        assert needs_rehash(hashed, 5) is True
+
+    def test_process_pool_roundtrip(self):
+        hasher = PasswordHasher(workers=1, max_pending=4, timeout=30)
+        try:
+            hashed = hasher.hash('secret', 4)
+            assert hasher.verify('secret', hashed) is True
+            assert hasher.verify('wrong', hashed) is False
+        finally:
+            hasher.shutdown()
+
+    def test_full_queue_fails_fast(self):
+        hasher = PasswordHasher(workers=0, max_pending=0)
+        with pytest.raises(HashingBusyError):
+            hasher.hash('secret', 4)
+        assert hasher.rejected == 1
+
+
+@pytest.mark.unit
+class TestAuthServiceHashing:
+    """AuthService cost configuration and rehash on login"""
+
+    def test_hash_uses_configured_cost(self, app, db):
+        assert hash_cost(AuthService().hash_password('TestPass123!')) == app.config['BCRYPT_LOG_ROUNDS']
+
+    def test_login_upgrades_outdated_hash(self, db, sample_user):
+        from src.repositories import UserRepository
+        repo = UserRepository()
+        repo.update(sample_user.id, password_hash=PasswordHasher(workers=0).hash('TestPass123!', 5))
+
+        result, error = AuthService().login('testuser', 'TestPass123!')
+
+        assert error is None
+        assert hash_cost(repo.get_by_id(sample_user.id).password_hash) == 4
+
+    def test_login_returns_503_when_busy(self, client, sample_user, saturated_hasher):
+        response = client.post('/api/v1/auth/login', json={
+            'username': 'testuser',
+            'password': 'TestPass123!'
+        })
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
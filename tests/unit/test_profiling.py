@@ -0,0 +1,110 @@
+"""Unit tests for on-demand admin request profiling."""
+
+import threading
+import time
+
+import pytest
+from src.app import create_app
+from src.config import TestingConfig
+from src.models.base import db as _db
+from src.utils.profiling import PROFILE_HEADER, StackSampler, profile_signature, request_profiler
+
+SECRET = 'profiling-secret'
+
+
+@pytest.fixture
+def profiled_client(monkeypatch, tmp_path):
+    """Client of an app with profiling enabled, storing profiles under tmp_path."""
+    for attr in ('secret', 'directory', 'interval', 'max_seconds', 'max_files'):
+        monkeypatch.setattr(request_profiler, attr, getattr(request_profiler, attr))
+    monkeypatch.setattr(TestingConfig, 'PROFILING_SECRET', SECRET, raising=False)
+    monkeypatch.setattr(TestingConfig, 'PROFILING_DIR', str(tmp_path), raising=False)
+    monkeypatch.setattr(TestingConfig, 'PROFILING_INTERVAL_MS', 1, raising=False)
+    app = create_app('testing')
+    with app.app_context():
+        _db.create_all()
+        yield app.test_client()
+        _db.session.remove()
+        _db.drop_all()
+
+
+def _headers(client, username, role):
+    client.post('/api/v1/auth/register', json={
+        'username': username, 'email': f'{username}@example.com', 'password': 'TestPass123!', 'role': role
+    })
+    data = client.post('/api/v1/auth/login', json={
+        'username': username, 'password': 'TestPass123!'
+    }).get_json()['data']
+    return {'Authorization': f"Bearer {data['access_token']}"}
+
+
+def _signed(headers, method, path):
+    return {**headers, PROFILE_HEADER: profile_signature(SECRET, method, path)}
+
+
+@pytest.mark.unit
+class TestStackSampler:
+    """src.utils.profiling.StackSampler"""
+
+    def test_collapsed_stacks(self):
+        sampler = StackSampler(threading.get_ident(), 0.001, 5)
+        sampler.start()
+        deadline = time.monotonic() + 0.05
+        while time.monotonic() < deadline:
+            pass
+        sampler.stop()
+
+        assert sampler.samples > 0
+        stack, count = sampler.collapsed().splitlines()[0].rsplit(' ', 1)
+        assert 'test_collapsed_stacks (test_profiling.py:' in stack
+        assert int(count) > 0
+
+
+@pytest.mark.unit
+class TestRequestProfiling:
+    """Signed, admin-only profiling of single requests"""
+
+    def test_admin_profile_stored_and_retrievable(self, profiled_client):
+        admin = _headers(profiled_client, 'admin1', 'admin')
+        response = profiled_client.get('/api/v1/projects', headers=_signed(admin, 'GET', '/api/v1/projects'))
+        assert response.status_code == 200
+        profile_id = response.headers['X-Profile-Id']
+
+        stored = profiled_client.get(f'/api/v1/profiles/{profile_id}', headers=admin)
+        assert stored.status_code == 200
+        assert stored.mimetype == 'text/plain'
+
+        assert 'X-Profile-Id' not in profiled_client.get('/api/v1/projects', headers=admin).headers
+
+    def test_profile_keyed_by_request_id(self, profiled_client):
+        admin = _headers(profiled_client, 'admin1', 'admin')
+        headers = {**_signed(admin, 'GET', '/api/v1/projects'), 'X-Request-ID': 'lb-7f3a.1:42'}
+        response = profiled_client.get('/api/v1/projects', headers=headers)
+        assert response.headers['X-Request-ID'] == 'lb-7f3a.1:42'
+        assert response.headers['X-Profile-Id'] == 'lb-7f3a_1_42'
+
+        stored = profiled_client.get('/api/v1/profiles/lb-7f3a.1:42', headers=admin)
+        assert stored.status_code == 200
+
+    def test_bad_signature_ignored(self, profiled_client):
+        admin = _headers(profiled_client, 'admin1', 'admin')
+        response = profiled_client.get(
+            '/api/v1/projects', headers=_signed(admin, 'GET', '/api/v1/issues')
+        )
+        assert response.status_code == 200
+        assert 'X-Profile-Id' not in response.headers
+
+    def test_non_admin_ignored(self, profiled_client):
+        developer = _headers(profiled_client, 'dev1', 'developer')
+        response = profiled_client.get(
+            '/api/v1/projects', headers=_signed(developer, 'GET', '/api/v1/projects')
+        )
+        assert response.status_code == 200
+        assert 'X-Profile-Id' not in response.headers
+
+    def test_retrieval_requires_admin(self, profiled_client):
+        developer = _headers(profiled_client, 'dev1', 'developer')
+        assert profiled_client.get(f"/api/v1/profiles/{'0' * 32}", headers=developer).status_code == 403
+        admin = _headers(profiled_client, 'admin1', 'admin')
+        assert profiled_client.get(f"/api/v1/profiles/{'0' * 32}", headers=admin).status_code == 404
+        assert profiled_client.get('/api/v1/profiles/..%2Fetc', headers=admin).status_code == 404
@@ -0,0 +1,106 @@
+"""Unit tests for prompt compaction and the golden-set eval helpers."""
+
+import pytest
+from src.evals import load_golden_cases, load_regression_thresholds, score_predictions
+from src.utils.prompt_compaction import (
+    compact_description,
+    dedupe_log_lines,
+    enforce_token_budget,
+    estimate_tokens,
+    truncate_stack_traces,
+)
+
+
+@pytest.mark.unit
+class TestPromptCompaction:
+    """src.utils.prompt_compaction"""
+
+    def test_dedupe_collapses_lines_differing_by_timestamp(self):
+        lines = [
+            '2025-01-01 10:00:01 ERROR connection refused to 10.0.0.1',
+            '2025-01-01 10:00:02 ERROR connection refused to 10.0.0.1',
+            '2025-01-01 10:00:03 ERROR connection refused to 10.0.0.1',
+            'Then the worker restarted.',
+        ]
+        result = dedupe_log_lines(lines)
+        assert len(result) == 2
+        assert result[0].endswith('[repeated 3x]')
+
+    def test_dedupe_keeps_lines_differing_by_line_number_port_or_id(self):
+        lines = [
+            '10:00:01 ERROR upstream 10.0.0.1:5432 refused',
+            '10:00:02 ERROR upstream 10.0.0.1:6432 refused',
+            '  File "/app/db.py", line 41, in connect',
+            '  File "/app/db.py", line 87, in connect',
+            'WARN order 1001 rejected after 120ms (attempt 1)',
+            'WARN order 1002 rejected after 95ms (attempt 2)',
+            'WARN order 1002 rejected after 310ms (attempt 3)',
+        ]
+        result = dedupe_log_lines(lines)
+        assert result[:5] == lines[:5]
+        assert result[5].endswith('[repeated 2x]')
+        assert len(result) == 6
+
+    def test_python_traceback_keeps_innermost_frames(self):
+        lines = ['Traceback (most recent call last):']
+        for i in range(10):
+            lines += [f'  File "/app/mod{i}.py", line {i}, in fn{i}', f'    call{i}()']
+        lines.append('ValueError: boom')
+        result = truncate_stack_traces(lines, max_frames=2)
+        text = '\n'.join(result)
+        assert 'mod9.py' in text and 'mod8.py' in text
+        assert 'mod0.py' not in text
+        assert '8 frames omitted' in text
+        assert result[-1] == 'ValueError: boom'
+
+    def test_java_trace_keeps_top_frames(self):
+        lines = ['java.lang.NullPointerException'] + [f'\tat com.app.C{i}.run(C{i}.java:{i})' for i in range(8)]
+        result = truncate_stack_traces(lines, max_frames=3)
+        assert len(result) == 5
+        assert 'C0' in result[1]
+        assert result[-1] == '\t... 5 more'
+
+    @pytest.mark.parametrize('budget', [1, 5, 8, 9, 10, 50, 400])
+    def test_token_budget_enforced(self, budget):
+        text = 'word ' * 1000
+        result = enforce_token_budget(text, budget)
+        assert estimate_tokens(result) <= budget
+
+    def test_omitted_count_covers_dropped_text(self):
+        text = 'abcd' * 1000
+        result = enforce_token_budget(text, 50)
+        head, rest = result.split('\n[... ', 1)
+        omitted, tail = rest.split(' tokens omitted ...]\n', 1)
+        assert int(omitted) == estimate_tokens(text[len(head):len(text) - len(tail)])
+        assert len(head) + len(tail) > 0
+
+    def test_short_text_unchanged(self):
+        result = compact_description('Login button is misaligned.', token_budget=100)
+        assert result.text == 'Login button is misaligned.'
+        assert result.tokens_saved == 0
+
+    def test_compaction_reports_tokens_saved(self):
+        log = '\n'.join(f'2025-01-01 10:00:{i:02d} WARN retrying request {i}' for i in range(60))
+        result = compact_description(f'Requests fail.\n{log}', token_budget=400)
+        assert result.tokens_after < result.tokens_before
+        assert result.tokens_saved == result.tokens_before - result.tokens_after
+
+
+@pytest.mark.unit
+class TestGoldenEval:
+    """src.evals.golden"""
+
+    def test_load_golden_cases(self):
+        cases = load_golden_cases()
+        assert len(cases) == 12
+        assert {'id', 'input', 'expected'} <= set(cases[0])
+
+    def test_load_regression_thresholds(self):
+        thresholds = load_regression_thresholds()
+        assert thresholds == {'priority': 0.10, 'status': 0.05, 'json_validity': 0.05}
+
+    def test_score_predictions(self):
+        cases = load_golden_cases()[:2]
+        predictions = [dict(case['expected']) for case in cases]
+        predictions[1]['priority'] = 'low'
+        assert score_predictions(cases, predictions) == {'priority': 0.5, 'status': 1.0}
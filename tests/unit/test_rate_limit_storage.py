@@ -0,0 +1,65 @@
+"""Unit tests for the shared SQLite rate limit storage."""
+
+import multiprocessing
+
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+from src.utils.rate_limit_storage import SQLiteStorage, storage_path
+
+
+def _hit_many(uri, count, results):
+    limiter = FixedWindowRateLimiter(storage_from_string(uri))
+    item = parse('100/minute')
+    results.put(sum(limiter.hit(item, 'shared') for _ in range(count)))
+
+
+@pytest.fixture
+def uri(tmp_path):
+    return f"sqlite:///{tmp_path / 'ratelimit.db'}"
+
+
+@pytest.mark.unit
+class TestSQLiteStorage:
+    """src.utils.rate_limit_storage"""
+
+    def test_scheme_registered(self, uri, tmp_path):
+        storage = storage_from_string(uri)
+        assert isinstance(storage, SQLiteStorage)
+        assert storage.path == str(tmp_path / 'ratelimit.db')
+        assert storage_path('sqlite:///relative.db') == 'relative.db'
+
+    def test_incr_and_expiry(self, uri, monkeypatch):
+        storage = storage_from_string(uri)
+        now = [1000.0]
+        monkeypatch.setattr('src.utils.rate_limit_storage.time.time', lambda: now[0])
+        assert storage.incr('k', 10) == 1
+        assert storage.incr('k', 10, amount=2) == 3
+        assert storage.get_expiry('k') == 1010.0
+        now[0] = 1010.0
+        assert storage.get('k') == 0
+        assert storage.incr('k', 10) == 1
+
+    def test_limit_shared_between_instances(self, uri):
+        item = parse('3/minute')
+        worker_a = FixedWindowRateLimiter(storage_from_string(uri))
+        worker_b = FixedWindowRateLimiter(storage_from_string(uri))
+        hits = [worker_a.hit(item, 'ip'), worker_b.hit(item, 'ip'),
+                worker_a.hit(item, 'ip'), worker_b.hit(item, 'ip')]
+        assert hits == [True, True, True, False]
+
+    def test_sliding_window(self, uri):
+        limiter = SlidingWindowCounterRateLimiter(storage_from_string(uri))
+        item = parse('2/minute')
+        assert [limiter.hit(item, 'ip') for _ in range(3)] == [True, True, False]
+
+    def test_exact_across_processes(self, uri):
+        context = multiprocessing.get_context('fork')
+        results = context.Queue()
+        workers = [context.Process(target=_hit_many, args=(uri, 60, results)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+        assert sum(results.get(timeout=5) for _ in workers) == 100
@@ -0,0 +1,81 @@
+"""Unit tests for identity-keyed, cost-weighted rate limits."""
+
+import pytest
+from src.app import create_app
+from src.config import TestingConfig
+from src.models.base import db as _db
+
+
+@pytest.fixture
+def limited_client(monkeypatch):
+    """Client of an app with rate limiting enabled and small budgets."""
+    monkeypatch.setattr(TestingConfig, 'RATELIMIT_ENABLED', True)
+    monkeypatch.setattr(TestingConfig, 'RATELIMIT_STORAGE_URL', 'memory://')
+    monkeypatch.setattr(TestingConfig, 'RATELIMIT_DEFAULT', '10 per minute')
+    monkeypatch.setattr(TestingConfig, 'RATELIMIT_CLASSES', {'search': '6 per minute'})
+    app = create_app('testing')
+    with app.app_context():
+        _db.create_all()
+        yield app.test_client()
+        _db.session.remove()
+        _db.drop_all()
+
+
+def _headers(client, username):
+    client.post('/api/v1/auth/register', json={
+        'username': username, 'email': f'{username}@example.com', 'password': 'TestPass123!'
+    })
+    data = client.post('/api/v1/auth/login', json={
+        'username': username, 'password': 'TestPass123!'
+    }).get_json()['data']
+    return {'Authorization': f"Bearer {data['access_token']}"}
+
+
+@pytest.mark.unit
+class TestRateLimiting:
+    """src.middleware.rate_limiting"""
+
+    def test_users_behind_one_address_have_separate_budgets(self, limited_client):
+        alice = _headers(limited_client, 'alice')
+        bob = _headers(limited_client, 'bob')
+        for _ in range(10):
+            assert limited_client.get('/api/v1/projects', headers=alice).status_code == 200
+        assert limited_client.get('/api/v1/projects', headers=alice).status_code == 429
+        assert limited_client.get('/api/v1/projects', headers=bob).status_code == 200
+
+    def test_anonymous_requests_keyed_by_address(self, limited_client):
+        for _ in range(10):
+            limited_client.get('/api/v1/ping')
+        assert limited_client.get('/api/v1/ping').status_code == 429
+
+    def test_search_costs_more_and_uses_class_budget(self, limited_client):
+        headers = _headers(limited_client, 'alice')
+        response = limited_client.get('/api/v1/projects?search=x', headers=headers)
+        assert response.status_code == 200
+        assert response.headers['X-RateLimit-Cost'] == '3'
+        assert response.headers['X-RateLimit-Class'] == 'search'
+        assert response.headers['X-RateLimit-Class-Remaining'] == '3'
+
+        assert limited_client.get('/api/v1/projects?search=x', headers=headers).status_code == 200
+        assert limited_client.get('/api/v1/projects?search=x', headers=headers).status_code == 429
+        plain = limited_client.get('/api/v1/projects', headers=headers)
+        assert plain.status_code == 200
+        assert plain.headers['X-RateLimit-Cost'] == '1'
+        assert 'X-RateLimit-Class' not in plain.headers
+
+    def test_token_verified_once_per_request(self, limited_client, monkeypatch):
+        from src.utils.token_cache import token_cache
+        headers = _headers(limited_client, 'alice')
+        manager = limited_client.application.extensions['flask-jwt-extended']
+        blocklist_checks = []
+        check = manager._token_in_blocklist_callback
+        monkeypatch.setattr(manager, '_token_in_blocklist_callback',
+                            lambda header, data: blocklist_checks.append(data['jti']) or check(header, data))
+        token_cache.clear()
+
+        response = limited_client.get('/api/v1/projects', headers=headers)
+
+        assert response.status_code == 200
+        assert token_cache.hits + token_cache.misses == 1
+        assert len(blocklist_checks) == 1
+        token_cache.clear()
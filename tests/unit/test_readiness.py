@@ -0,0 +1,105 @@
+"""Unit tests for liveness/readiness probes and the cached readiness report."""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+from src.utils.readiness import ReadinessMonitor
+
+
+@pytest.fixture
+def monitor(app, db):
+    """Monitor with a long TTL, using the test database."""
+    monitor = ReadinessMonitor()
+    monitor.app = app
+    monitor.ttl = 60
+    monitor.instrument_pool(db.engine)
+    return monitor
+
+
+@pytest.mark.unit
+class TestProbes:
+    """/api/v1/health/live and /api/v1/health/ready"""
+
+    def test_live(self, client):
+        response = client.get('/api/v1/health/live')
+        assert response.status_code == 200
+        assert response.get_json()['data'] == {'status': 'alive'}
+
+    def test_ready_report(self, client):
+        response = client.get('/api/v1/health/ready')
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['ready'] is True
+        assert data['database'] == 'ok'
+        assert data['llm'] == 'closed'
+        assert data['migrations'] == {'current': None, 'head': '004_membership_epoch'}
+
+
+@pytest.mark.unit
+class TestReadinessMonitor:
+    """src.utils.readiness.ReadinessMonitor"""
+
+    def test_cached_then_refreshed_in_background(self, monitor, monkeypatch):
+        calls = []
+        monkeypatch.setattr(monitor, '_check_database', lambda: calls.append(1) or ('ok', None))
+
+        first = monitor.report()
+        assert monitor.report()['checked_at'] == first['checked_at']
+        assert len(calls) == 1
+
+        monitor._checked_at -= 120
+        assert monitor.report()['checked_at'] == first['checked_at']
+        deadline = time.monotonic() + 5
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(calls) == 2
+
+    def test_migrations_behind_not_ready(self, monitor, monkeypatch):
+        monkeypatch.setattr(monitor, '_check_database', lambda: ('ok', '003_token_revocation'))
+        assert monitor.report()['ready'] is False
+
+    def test_sustained_pool_saturation_not_ready(self, monitor, monkeypatch):
+        monkeypatch.setattr(monitor, '_check_database', lambda: ('ok', None))
+        engine = create_engine('sqlite://', poolclass=QueuePool, pool_size=1, max_overflow=0)
+        monitor.instrument_pool(engine)
+        monitor.saturation_seconds = 0
+        monitor.release_seconds = 0
+
+        assert monitor.report()['ready'] is True
+        connection = engine.connect()
+        try:
+            report = monitor.report()
+            assert report['ready'] is False
+            assert report['pool']['checkedout'] == 1
+            assert report['pool']['capacity'] == 1
+        finally:
+            connection.close()
+        assert monitor.report()['ready'] is True
+
+    def test_saturation_under_churn_not_ready(self, monitor, monkeypatch):
+        monkeypatch.setattr(monitor, '_check_database', lambda: ('ok', None))
+        engine = create_engine('sqlite://', poolclass=QueuePool, pool_size=2, max_overflow=0)
+        monitor.instrument_pool(engine)
+        monitor.saturation_seconds = 0.05
+        monitor.release_seconds = 0.05
+
+        assert monitor.report()['ready'] is True
+        held = engine.connect()
+        connection = engine.connect()
+        try:
+            deadline = time.monotonic() + 0.1
+            while time.monotonic() < deadline:
+                # Each request hands its connection straight to the next one
+                connection.close()
+                connection = engine.connect()
+            report = monitor.report()
+            assert report['ready'] is False
+            assert report['pool']['saturated_for'] >= 0.05
+        finally:
+            connection.close()
+            held.close()
+
+        time.sleep(0.05)
+        assert monitor.report()['ready'] is True
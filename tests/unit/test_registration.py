@@ -0,0 +1,93 @@
+"""Unit tests for single-statement registration and bulk provisioning."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from src.repositories.user_repository import duplicate_field
+from src.services import AuthService
+from src.utils.password_hashing import PasswordHasher, hash_cost
+
+
+@pytest.fixture
+def sql_statements(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _entry(name, **overrides):
+    return {'username': name, 'email': f'{name}@example.com', 'password': 'TestPass123!', **overrides}
+
+
+@pytest.mark.unit
+class TestRegistration:
+    """AuthService.register"""
+
+    def test_single_insert_statement(self, app, db, sql_statements):
+        user, error = AuthService().register('newuser', 'new@example.com', 'TestPass123!')
+        assert error is None
+        assert user.to_dict()['username'] == 'newuser'
+        assert len(sql_statements) == 1
+        assert sql_statements[0].startswith('INSERT INTO users') and 'RETURNING' in sql_statements[0]
+
+    def test_duplicates_map_to_messages(self, app, db, sample_user):
+        service = AuthService()
+        assert service.register('testuser', 'other@example.com', 'TestPass123!') == (None, "Username already exists")
+        assert service.register('other', 'test@example.com', 'TestPass123!') == (None, "Email already exists")
+        assert service.register('other', 'other@example.com', 'TestPass123!')[1] is None
+
+    def test_duplicate_field_for_postgres_messages(self):
+        error = IntegrityError('INSERT', {}, Exception(
+            'duplicate key value violates unique constraint "users_email_key"\n'
+            'DETAIL:  Key (email)=(username@example.com) already exists.'
+        ))
+        assert duplicate_field(error) == 'email'
+
+
+@pytest.mark.unit
+class TestProvisioning:
+    """Bulk provisioning through the service, API and CLI"""
+
+    def test_batch_reports_duplicates(self, app, db, sample_user):
+        results, error = AuthService().provision_users([
+            _entry('alice'), _entry('testuser'), _entry('bob', role='viewer'), _entry('alice2', email='alice@example.com'),
+        ])
+        assert error is None
+        assert [result['error'] for result in results] == [
+            None, "Username already exists", None, "Email already exists"
+        ]
+        assert results[2]['id'] is not None
+
+    def test_endpoint_requires_admin(self, client, auth_headers):
+        response = client.post('/api/v1/auth/provision', headers=auth_headers, json={'users': [_entry('alice')]})
+        assert response.status_code == 403
+
+    def test_endpoint(self, client, admin_headers):
+        response = client.post('/api/v1/auth/provision', headers=admin_headers,
+                               json={'users': [_entry('alice'), _entry('bob'), _entry('alice')]})
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert (data['created'], data['failed']) == (2, 1)
+
+    def test_cli(self, app, runner, tmp_path):
+        csv_file = tmp_path / 'team.csv'
+        csv_file.write_text(
+            'username,email,password,role\n'
+            'alice,alice@example.com,TestPass123!,viewer\n'
+            'bob,bob@example.com,weak,\n'
+        )
+        result = runner.invoke(args=['provision-users', str(csv_file)])
+        assert 'line 3: invalid' in result.output
+        assert 'Provisioned 1 of 1 valid users' in result.output
+
+    def test_hash_many_in_parallel(self):
+        hasher = PasswordHasher(workers=1)
+        hashes = hasher.hash_many(['one', 'two', 'three'], 4, workers=2)
+        assert [hash_cost(password_hash) for password_hash in hashes] == [4, 4, 4]
+        assert hasher.verify('two', hashes[1]) is True
+        hasher.shutdown()
@@ -0,0 +1,134 @@
+"""Unit tests for token revocation (Bloom filter, store, logout)."""
+
+import pytest
+from flask_jwt_extended import create_access_token, decode_token
+from sqlalchemy import event
+from src.services import AuthService, TokenRevocationStore
+from src.utils.bloom import BloomFilter
+
+
+@pytest.fixture
+def count_queries(db):
+    """Count SQL statements executed on the engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _token_payload(user):
+    identity = {'user_id': user.id, 'username': user.username, 'role': user.role}
+    return decode_token(create_access_token(identity=identity))
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    """src.utils.bloom"""
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f'jti-{i}' for i in range(1000)]
+        bloom.update(items)
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        bloom.update(f'jti-{i}' for i in range(1000))
+        false_positives = sum(f'other-{i}' in bloom for i in range(10000))
+        assert false_positives < 300
+        assert not bloom.saturated
+
+
+@pytest.mark.unit
+class TestTokenRevocationStore:
+    """src.services.revocation_service"""
+
+    def test_revoked_jti_detected(self, app, db, sample_user):
+        store = TokenRevocationStore(sync_interval=0)
+        payload = _token_payload(sample_user)
+        assert store.is_revoked(payload) is False
+        store.revoke(payload)
+        assert store.is_revoked(payload) is True
+
+    def test_not_revoked_check_needs_no_query(self, app, db, sample_user, count_queries):
+        store = TokenRevocationStore(sync_interval=3600)
+        store.sync()
+        payload = _token_payload(sample_user)
+        count_queries.clear()
+        assert store.is_revoked(payload) is False
+        assert count_queries == []
+
+    def test_other_worker_sees_revocation_after_sync(self, app, db, sample_user):
+        worker_a = TokenRevocationStore(sync_interval=3600)
+        worker_b = TokenRevocationStore(sync_interval=3600)
+        worker_b.sync()
+        payload = _token_payload(sample_user)
+        worker_a.revoke(payload)
+        assert worker_b.is_revoked(payload) is False
+        worker_b.sync()
+        assert worker_b.is_revoked(payload) is True
+
+    def test_revoke_all_uses_watermark(self, app, db, sample_user):
+        store = TokenRevocationStore(sync_interval=0)
+        payload = _token_payload(sample_user)
+        store.revoke_all(sample_user.id)
+        assert store.is_revoked(payload) is True
+        assert store.is_revoked({**payload, 'iat': payload['iat'] + 5}) is False
+
+    def test_whole_second_iat_in_watermark_second_is_revoked(self, app, db, sample_user):
+        store = TokenRevocationStore(sync_interval=0)
+        payload = _token_payload(sample_user)
+        watermark = store.revoke_all(sample_user.id).timestamp()
+        assert store.is_revoked({**payload, 'iat': int(watermark)}) is True
+
+    def test_login_right_after_password_change(self, client, sample_user):
+        success, error = AuthService().update_password(sample_user.id, 'TestPass123!', 'NewPass456!')
+        assert success is True, error
+
+        tokens = client.post('/api/v1/auth/login', json={
+            'username': 'testuser', 'password': 'NewPass456!'
+        }).get_json()['data']
+        assert isinstance(decode_token(tokens['access_token'])['iat'], float)
+        headers = {'Authorization': f"Bearer {tokens['access_token']}"}
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 200
+
+        response = client.post('/api/v1/auth/refresh',
+                               headers={'Authorization': f"Bearer {tokens['refresh_token']}"})
+        assert response.status_code == 200
+
+
+@pytest.mark.unit
+class TestLogout:
+    """Logout endpoints and AuthService revocation"""
+
+    def test_logout_revokes_access_token(self, client, auth_headers):
+        assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 200
+        assert client.post('/api/v1/auth/logout', headers=auth_headers).status_code == 200
+        assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 401
+
+    def test_logout_revokes_refresh_token(self, client, sample_user):
+        tokens = client.post('/api/v1/auth/login', json={
+            'username': 'testuser', 'password': 'TestPass123!'
+        }).get_json()['data']
+        headers = {'Authorization': f"Bearer {tokens['access_token']}"}
+
+        response = client.post('/api/v1/auth/logout', headers=headers,
+                               json={'refresh_token': tokens['refresh_token']})
+        assert response.status_code == 200
+
+        response = client.post('/api/v1/auth/refresh',
+                               headers={'Authorization': f"Bearer {tokens['refresh_token']}"})
+        assert response.status_code == 401
+
+    def test_logout_all(self, client, auth_headers):
+        assert client.post('/api/v1/auth/logout-all', headers=auth_headers).status_code == 200
+        assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 401
+
+    def test_deactivate_user_revokes_tokens(self, client, auth_headers, sample_user):
+        success, error = AuthService().deactivate_user(sample_user.id)
+        assert success is True
+        assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 401
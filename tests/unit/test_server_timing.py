@@ -0,0 +1,62 @@
+"""Unit tests for Server-Timing phase reporting."""
+
+import logging
+
+import pytest
+from src.schemas import IssueResponseSchema
+from src.utils.server_timing import phase_timings, record_phase, timed_phase
+
+
+def _timings(response):
+    entries = {}
+    for header in response.headers.getlist('Server-Timing'):
+        for entry in header.split(','):
+            name, _, rest = entry.strip().partition(';dur=')
+            entries[name] = float(rest.split(';')[0])
+    return entries
+
+
+@pytest.mark.unit
+class TestPhases:
+    """src.utils.server_timing"""
+
+    def test_nested_phase_counted_once(self, app):
+        with app.test_request_context('/'):
+            with timed_phase('serialize'):
+                with timed_phase('serialize'):
+                    pass
+            record_phase('llm', 0.5)
+            record_phase('llm', 0.25)
+            timings = phase_timings()
+        assert {'serialize', 'llm'} <= set(timings)
+        assert timings['llm'] == 0.75
+
+    def test_outside_request_is_noop(self):
+        record_phase('llm', 1.0)
+        with timed_phase('json'):
+            pass
+        assert phase_timings() == {}
+
+    def test_nested_schema_dump(self, app, sample_issue):
+        with app.test_request_context('/'):
+            with timed_phase('outer'):
+                IssueResponseSchema(many=True).dump([sample_issue])
+            timings = phase_timings()
+        assert 0 < timings['serialize'] <= timings['outer']
+
+
+@pytest.mark.unit
+class TestServerTimingHeader:
+    """Phases in responses and the access log"""
+
+    def test_issue_list_breakdown(self, client, auth_headers, sample_project, sample_issue):
+        response = client.get(f'/api/v1/projects/{sample_project.id}/issues', headers=auth_headers)
+        assert response.status_code == 200
+        assert {'auth', 'db', 'serialize', 'json'} <= set(_timings(response))
+
+    def test_access_log_fields(self, client, auth_headers, caplog):
+        caplog.set_level(logging.INFO, logger='issue_tracker')
+        client.get('/api/v1/auth/me', headers=auth_headers)
+        record = [r for r in caplog.records if r.getMessage() == 'request'][-1]
+        assert record.auth_ms >= 0
+        assert record.json_ms >= 0
@@ -0,0 +1,80 @@
+"""Unit tests for the slow-query log and its EXPLAIN sampling."""
+
+import logging
+
+import pytest
+from sqlalchemy import text
+from src.utils.sql_instrumentation import redact_parameters, sql_instrumentation
+
+
+@pytest.fixture
+def slow_queries(monkeypatch, caplog):
+    """Treat every statement as slow and collect slow-query log records."""
+    monkeypatch.setattr(sql_instrumentation, 'slow_query_ms', 1e-9)
+    monkeypatch.setattr(sql_instrumentation, 'explain_sample_rate', 0.0)
+    monkeypatch.setattr(sql_instrumentation, '_explained', {})
+    caplog.set_level(logging.WARNING, logger='issue_tracker')
+    return caplog
+
+
+def _records(caplog, event):
+    return [record for record in caplog.records if getattr(record, 'event', None) == event]
+
+
+@pytest.mark.unit
+class TestRedactParameters:
+    """src.utils.sql_instrumentation.redact_parameters"""
+
+    def test_redacts_by_name(self):
+        redacted = redact_parameters(
+            ('alice', 'alice@example.com', 42), ['username_1', 'email_1', 'id_1'], ('email',)
+        )
+        assert redacted == {'username_1': 'alice', 'email_1': '[REDACTED]', 'id_1': 42}
+
+    def test_redacts_hashes_and_truncates_unnamed(self):
+        redacted = redact_parameters(['$2b$12$abcdefghijklmnopqrstuv', 'x' * 100, None])
+        assert redacted[0] == '[REDACTED]'
+        assert redacted[1] == 'x' * 64 + '...'
+        assert redacted[2] is None
+
+
+@pytest.mark.unit
+class TestSlowQueryLog:
+    """Slow statement records"""
+
+    def test_logs_shape_parameters_and_endpoint(self, app, db, slow_queries):
+        with app.test_request_context('/api/v1/issues', method='GET'):
+            db.session.execute(
+                text('SELECT id FROM users WHERE email = :email AND id > 10'), {'email': 'a@example.com'}
+            )
+        record = _records(slow_queries, 'slow_query')[-1]
+        assert record.getMessage() == 'Slow query'
+        assert record.statement == 'SELECT id FROM users WHERE email = ? AND id > N'
+        assert record.parameters == {'email': '[REDACTED]'}
+        assert record.path == '/api/v1/issues'
+        assert record.duration_ms >= 0
+
+    def test_below_threshold_not_logged(self, app, db, slow_queries, monkeypatch):
+        monkeypatch.setattr(sql_instrumentation, 'slow_query_ms', 60_000)
+        db.session.execute(text('SELECT 1'))
+        assert _records(slow_queries, 'slow_query') == []
+
+    def test_sampled_explain_logs_plan(self, app, db, slow_queries, monkeypatch):
+        monkeypatch.setattr(sql_instrumentation, 'explain_sample_rate', 1.0)
+        db.session.execute(text('SELECT id FROM users WHERE username = :name'), {'name': 'alice'})
+        sql_instrumentation.drain(timeout=5)
+        db.session.execute(text('SELECT id FROM users WHERE username = :name'), {'name': 'bob'})
+        sql_instrumentation.drain(timeout=5)
+
+        plans = _records(slow_queries, 'slow_query_plan')
+        assert len(plans) == 1
+        assert plans[0].dialect == 'sqlite'
+        assert any('users' in step['detail'] for step in plans[0].plan)
+        assert not hasattr(plans[0], 'parameters')
+
+    def test_explain_skips_writes(self, app, db, slow_queries, monkeypatch):
+        monkeypatch.setattr(sql_instrumentation, 'explain_sample_rate', 1.0)
+        db.session.execute(text("UPDATE users SET is_active = 1 WHERE id = -1"))
+        sql_instrumentation.drain(timeout=5)
+        assert _records(slow_queries, 'slow_query')
+        assert _records(slow_queries, 'slow_query_plan') == []
@@ -0,0 +1,61 @@
+"""Unit tests for per-request SQL instrumentation and query budgets."""
+
+import pytest
+from flask import Response
+from sqlalchemy import text
+from src.utils.sql_instrumentation import QueryStats, current_stats, sql_instrumentation, statement_shape
+
+
+@pytest.mark.unit
+class TestStatementShape:
+    """src.utils.sql_instrumentation.statement_shape"""
+
+    def test_collapses_in_lists_and_literals(self):
+        a = statement_shape('SELECT * FROM users WHERE id IN (?, ?, ?) LIMIT 10')
+        b = statement_shape('SELECT *  FROM users\nWHERE id IN (?) LIMIT 20')
+        assert a == b
+
+    def test_repeated_selects_only(self):
+        stats = QueryStats()
+        for _ in range(5):
+            stats.record('SELECT * FROM users WHERE id = ?', 0.001)
+            stats.record('INSERT INTO users VALUES (?)', 0.001)
+        assert stats.repeated(5) == {'SELECT * FROM users WHERE id = ?': 5}
+        assert stats.to_dict() == {'db_queries': 10, 'db_time_ms': 10.0}
+
+
+@pytest.mark.unit
+class TestRequestInstrumentation:
+    """Response headers and N+1 detection"""
+
+    def test_headers(self, client, auth_headers):
+        response = client.get('/api/v1/auth/me', headers=auth_headers)
+        assert int(response.headers['X-DB-Queries']) >= 1
+        assert any(value.startswith('db;dur=') for value in response.headers.getlist('Server-Timing'))
+
+    def test_n_plus_one_flagged(self, app, db):
+        with app.test_request_context('/api/v1/issues'):
+            sql_instrumentation._start()
+            for user_id in range(6):
+                db.session.execute(text(f'SELECT id FROM users WHERE id = {user_id}'))
+            assert current_stats().count == 6
+            response = sql_instrumentation._finish(Response())
+        assert response.headers['X-DB-N-Plus-One'] == '1'
+
+
+@pytest.mark.unit
+class TestQueryBudgets:
+    """Query budgets of read endpoints"""
+
+    def test_me(self, client, auth_headers, query_budget):
+        with query_budget(3):
+            assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 200
+
+    def test_project_detail(self, client, auth_headers, sample_project, query_budget):
+        with query_budget(3):
+            assert client.get(f'/api/v1/projects/{sample_project.id}', headers=auth_headers).status_code == 200
+
+    def test_issue_list(self, client, auth_headers, sample_project, sample_issue, query_budget):
+        with query_budget(5):
+            response = client.get(f'/api/v1/projects/{sample_project.id}/issues', headers=auth_headers)
+        assert response.status_code == 200
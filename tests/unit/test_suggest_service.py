@@ -0,0 +1,317 @@
+"""Unit tests for SuggestService resilience (deadline, retries, breaker, fallback)."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from src.services.suggest_service import SuggestService, heuristic_suggest, llm_client
+from src.utils.deadlines import deadline_scope
+from src.utils.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    RetryPolicy,
+    call_with_resilience,
+)
+
+
+class _StubLLMHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible chat completions endpoint."""
+
+    def do_POST(self):
+        server = self.server
+        server.calls += 1
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        behaviour = server.script.pop(0) if server.script else 'ok'
+        if behaviour == 'slow':
+            time.sleep(server.delay)
+        if behaviour == 'error':
+            self.send_response(500)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(b'{"error": {"message": "boom"}}')
+            return
+
+        content = server.content or json.dumps({
+            'priority': 'high', 'status': 'open', 'confidence': 'high', 'reason': 'stub'
+        })
+        body = json.dumps({
+            'id': 'stub', 'object': 'chat.completion', 'created': 0, 'model': 'stub',
+            'choices': [{
+                'index': 0, 'finish_reason': 'stop',
+                'message': {'role': 'assistant', 'content': content},
+            }],
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    """Run a local stub LLM server and point SuggestService at it."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubLLMHandler)
+    server.calls = 0
+    server.script = []
+    server.delay = 0.0
+    server.content = None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setenv('OPENAI_BASE_URL', f'http://127.0.0.1:{server.server_port}/v1')
+    monkeypatch.setenv('SUGGEST_TIMEOUT', '2')
+    monkeypatch.setenv('SUGGEST_MAX_RETRIES', '2')
+    monkeypatch.delenv('SUGGEST_FALLBACK', raising=False)
+    monkeypatch.delenv('SUGGEST_HEDGE_DELAY', raising=False)
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """CircuitBreaker state transitions"""
+
+    def test_opens_after_threshold(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+        assert breaker.state == 'closed'
+        breaker.record_failure()
+        assert breaker.state == 'open'
+        assert breaker.allow_request() is False
+
+    def test_half_open_allows_single_trial(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 11.0
+        assert breaker.state == 'half_open'
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+        breaker.record_success()
+        assert breaker.state == 'closed'
+
+    def test_failed_trial_reopens(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 11.0
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.state == 'open'
+
+
+@pytest.mark.unit
+class TestCallWithResilience:
+    """call_with_resilience"""
+
+    def test_retries_until_success(self):
+        attempts = []
+
+        def flaky(timeout):
+            attempts.append(timeout)
+            if len(attempts) < 3:
+                raise ConnectionError('transient')
+            return 'ok'
+
+        retry = RetryPolicy(max_attempts=3, base_delay=0.001, retry_on=(ConnectionError,))
+        assert call_with_resilience(flaky, deadline=1.0, retry=retry) == 'ok'
+        assert len(attempts) == 3
+
+    def test_non_retryable_error_is_raised(self):
+        def bad(timeout):
+            raise ValueError('bad request')
+
+        retry = RetryPolicy(max_attempts=3, retry_on=(ConnectionError,))
+        with pytest.raises(ValueError):
+            call_with_resilience(bad, deadline=1.0, retry=retry)
+
+    def test_open_breaker_fails_fast(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            call_with_resilience(lambda timeout: 'ok', deadline=1.0, breaker=breaker)
+
+    def test_hedged_request_beats_slow_first_attempt(self):
+        calls = []
+
+        def sometimes_slow(timeout):
+            calls.append(timeout)
+            if len(calls) == 1:
+                time.sleep(0.5)
+                return 'slow'
+            return 'fast'
+
+        started = time.monotonic()
+        result = call_with_resilience(sometimes_slow, deadline=2.0, hedge_delay=0.05)
+        assert result == 'fast'
+        assert time.monotonic() - started < 0.4
+
+    def test_deadline_exceeded(self):
+        def slow(timeout):
+            raise DeadlineExceededError('slow')
+
+        with pytest.raises(DeadlineExceededError):
+            call_with_resilience(slow, deadline=0.05, retry=RetryPolicy(max_attempts=2, base_delay=0.001))
+
+    def test_exhausted_deadline_keeps_half_open_trial(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 1000.0
+        calls = []
+
+        with pytest.raises(DeadlineExceededError):
+            call_with_resilience(calls.append, deadline=0.0, breaker=breaker)
+
+        assert calls == []
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request() is True
+
+
+@pytest.mark.unit
+class TestSuggestServiceResilience:
+    """SuggestService against a local stub LLM server"""
+
+    def test_suggest_success(self, stub_llm):
+        service = SuggestService(breaker=CircuitBreaker())
+        suggestion, error = service.suggest('App crashes', 'All users affected')
+        assert error is None
+        assert suggestion['priority'] == 'high'
+        assert stub_llm.calls == 1
+
+    def test_client_reused_across_calls(self, stub_llm, monkeypatch):
+        import src.services.suggest_service as suggest_service
+
+        monkeypatch.setattr(suggest_service, '_clients', {})
+        service = SuggestService(breaker=CircuitBreaker())
+        service.suggest('App crashes')
+        service.suggest('Login fails')
+        assert stub_llm.calls == 2
+        assert len(suggest_service._clients) == 1
+
+        client = llm_client('http://example.invalid/v1', 'key', 2.0)
+        assert llm_client('http://example.invalid/v1', 'key', 2.0) is client
+        assert llm_client('http://example.invalid/v1', 'other-key', 2.0) is not client
+
+    def test_suggest_retries_transient_errors(self, stub_llm):
+        stub_llm.script = ['error', 'error']
+        service = SuggestService(breaker=CircuitBreaker())
+        suggestion, error = service.suggest('App crashes')
+        assert error is None
+        assert suggestion['priority'] == 'high'
+        assert stub_llm.calls == 3
+
+    def test_suggest_deadline(self, stub_llm, monkeypatch):
+        monkeypatch.setenv('SUGGEST_TIMEOUT', '0.2')
+        monkeypatch.setenv('SUGGEST_MAX_RETRIES', '0')
+        stub_llm.script = ['slow']
+        stub_llm.delay = 1.0
+        service = SuggestService(breaker=CircuitBreaker())
+        started = time.monotonic()
+        suggestion, error = service.suggest('App crashes')
+        assert suggestion == {}
+        assert 'timed out' in error.lower() or 'unavailable' in error.lower()
+        assert time.monotonic() - started < 0.9
+
+    def test_sdk_timeout_reported_as_timeout(self, stub_llm, monkeypatch):
+        monkeypatch.setenv('SUGGEST_TIMEOUT', '1')
+        monkeypatch.setenv('SUGGEST_MAX_RETRIES', '0')
+        monkeypatch.setenv('SUGGEST_HEDGE_DELAY', '0')
+        stub_llm.script = ['slow']
+        stub_llm.delay = 2.0
+        service = SuggestService(breaker=CircuitBreaker())
+        suggestion, error = service.suggest('App crashes')
+        assert suggestion == {}
+        assert error == 'Classification timed out'
+
+    def test_request_budget_caps_deadline(self, stub_llm):
+        stub_llm.script = ['slow']
+        stub_llm.delay = 1.0
+        service = SuggestService(breaker=CircuitBreaker())
+        started = time.monotonic()
+        with deadline_scope(0.2):
+            suggestion, error = service.suggest('App crashes')
+        assert suggestion == {}
+        assert 'timed out' in error.lower() or 'unavailable' in error.lower()
+        assert stub_llm.calls == 1
+        assert time.monotonic() - started < 0.9
+
+    def test_open_breaker_skips_provider(self, stub_llm):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        service = SuggestService(breaker=breaker)
+        suggestion, error = service.suggest('App crashes')
+        assert suggestion == {}
+        assert 'unavailable' in error.lower()
+        assert stub_llm.calls == 0
+
+    def test_open_breaker_heuristic_fallback(self, stub_llm, monkeypatch):
+        monkeypatch.setenv('SUGGEST_FALLBACK', 'heuristic')
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        service = SuggestService(breaker=breaker)
+        suggestion, error = service.suggest('Stored XSS lets attackers exploit the comment form')
+        assert error is None
+        assert suggestion['priority'] == 'critical'
+        assert suggestion['source'] == 'heuristic'
+        assert stub_llm.calls == 0
+
+    def test_suggest_batch_maps_results_by_id(self, stub_llm):
+        stub_llm.content = json.dumps([
+            {'id': 1, 'priority': 'critical', 'status': 'open', 'confidence': 'high', 'reason': 'a'},
+            {'id': 2, 'priority': 'bogus'},
+            {'id': 99, 'priority': 'low'},
+        ])
+        service = SuggestService(breaker=CircuitBreaker())
+        suggestions, error = service.suggest_batch([
+            {'id': 1, 'title': 'Outage'},
+            {'id': 2, 'title': 'Typo', 'description': 'Minor'},
+        ])
+        assert error is None
+        assert stub_llm.calls == 1
+        assert set(suggestions) == {1, 2}
+        assert suggestions[1]['priority'] == 'critical'
+        assert suggestions[2]['priority'] == 'medium'
+
+
+@pytest.mark.unit
+class TestHeuristicSuggest:
+    """heuristic_suggest on phrasings outside the golden dataset"""
+
+    @pytest.mark.parametrize('title, description, priority', [
+        ('Attackers can exploit the upload form', None, 'critical'),
+        ('Customer records lost', 'Nightly job caused data corruption in the orders table', 'critical'),
+        ('Worker raises an exception when the queue is empty', 'Traceback attached', 'high'),
+        ('Memory leak in the websocket handler', None, 'high'),
+        ('Fix spelling on the pricing page', None, 'low'),
+        ('Update the README install steps', 'The docs mention an old flag', 'low'),
+        ('Enhancement: allow sorting boards by due date', None, 'low'),
+    ])
+    def test_generic_signals(self, title, description, priority):
+        suggestion = heuristic_suggest(title, description)
+        assert suggestion['priority'] == priority
+        assert suggestion['source'] == 'heuristic'
+
+    def test_matches_whole_words(self):
+        assert heuristic_suggest('Terrorist theme for the docs site')['priority'] == 'low'
+        assert heuristic_suggest('Reword the dashboard tooltip')['priority'] == 'medium'
+
+
+@pytest.mark.unit
+def test_heuristic_defaults_to_medium():
+    suggestion = heuristic_suggest('Tweak the report layout')
+    assert suggestion['priority'] == 'medium'
+    assert suggestion['confidence'] == 'low'
@@ -0,0 +1,92 @@
+"""Unit tests for the verified-token cache."""
+
+import pytest
+from src.utils.token_cache import VerifiedTokenCache, token_cache
+
+
+@pytest.fixture
+def fresh_token_cache():
+    """Clear the shared cache around a test."""
+    token_cache.clear()
+    yield token_cache
+    token_cache.clear()
+
+
+@pytest.mark.unit
+class TestVerifiedTokenCache:
+    """src.utils.token_cache"""
+
+    def test_entry_expires_at_exp(self):
+        now = [100.0]
+        cache = VerifiedTokenCache(clock=lambda: now[0])
+        cache.put('tok', {'alg': 'HS256'}, {'exp': 160, 'sub': '1'})
+        assert cache.get('tok')[1]['sub'] == '1'
+        now[0] = 160.0
+        assert cache.get('tok') is None
+        assert cache.stats()['size'] == 0
+
+    def test_lru_eviction(self):
+        cache = VerifiedTokenCache(max_size=2, clock=lambda: 0.0)
+        for name in ('a', 'b'):
+            cache.put(name, {}, {'exp': 10})
+        cache.get('a')
+        cache.put('c', {}, {'exp': 10})
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.evictions == 1
+
+    def test_tokens_without_exp_are_not_cached(self):
+        cache = VerifiedTokenCache()
+        cache.put('tok', {}, {'sub': '1'})
+        assert cache.get('tok') is None
+
+    def test_stats(self):
+        cache = VerifiedTokenCache()
+        cache.record(hit=False, seconds=0.004)
+        cache.record(hit=True, seconds=0.001)
+        cache.record(hit=True, seconds=0.001)
+        stats = cache.stats()
+        assert stats['hit_rate'] == round(2 / 3, 4)
+        assert stats['saved_ms_per_hit'] == pytest.approx(3.0)
+        assert stats['saved_ms_total'] == pytest.approx(6.0)
+
+
+@pytest.mark.unit
+class TestTokenCacheMiddleware:
+    """jwt_required_custom with the shared cache"""
+
+    def test_second_request_hits_cache(self, client, auth_headers, fresh_token_cache):
+        assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 200
+        assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 200
+        assert fresh_token_cache.hits == 1
+        assert fresh_token_cache.misses == 1
+
+    def test_jwt_accessors_on_hit(self, app, auth_headers, fresh_token_cache):
+        from flask_jwt_extended import get_jwt, get_jwt_header, get_jwt_identity
+        from src.middleware.auth_middleware import verify_access_token
+
+        views = []
+        for _ in range(2):
+            with app.test_request_context('/api/v1/auth/me', headers=auth_headers):
+                verify_access_token()
+                views.append((get_jwt(), get_jwt_header(), get_jwt_identity()))
+
+        assert fresh_token_cache.hits == 1
+        assert views[1] == views[0]
+        claims, header, identity = views[1]
+        assert claims['type'] == 'access' and claims['jti']
+        assert header['alg'] == 'HS256'
+        assert identity['username'] == 'testuser'
+
+    def test_revoked_token_rejected_on_hit(self, app, client, auth_headers, fresh_token_cache, monkeypatch):
+        assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 200
+
+        manager = app.extensions['flask-jwt-extended']
+        monkeypatch.setattr(manager, '_token_in_blocklist_callback', lambda header, data: True)
+
+        assert client.get('/api/v1/auth/me', headers=auth_headers).status_code == 401
+        assert fresh_token_cache.stats()['size'] == 0
+
+    def test_health_exposes_stats(self, client):
+        data = client.get('/api/v1/health').get_json()['data']
+        assert {'hits', 'misses', 'hit_rate', 'saved_ms_total'} <= set(data['auth_cache'])
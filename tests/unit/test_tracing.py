@@ -0,0 +1,86 @@
+"""Unit tests for OpenTelemetry tracing of requests, services, repositories and SQL."""
+
+import pytest
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from src.app import create_app
+from src.config import TestingConfig
+from src.models.base import db as _db
+from src.services import ProjectService
+from src.utils.tracing import tracing
+
+TRACE_ID = '4bf92f3577b34da6a3ce929d0e0e4736'
+
+
+@pytest.fixture
+def traced(monkeypatch):
+    """App with tracing enabled and spans collected in memory."""
+    for attr in ('enabled', 'provider', 'tracer'):
+        monkeypatch.setattr(tracing, attr, getattr(tracing, attr))
+    monkeypatch.setattr(TestingConfig, 'TRACING_ENABLED', True, raising=False)
+    monkeypatch.setattr(TestingConfig, 'TRACING_EXPORTER', 'none', raising=False)
+    app = create_app('testing')
+    exporter = InMemorySpanExporter()
+    tracing.provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with app.app_context():
+        _db.create_all()
+        try:
+            yield app.test_client(), exporter
+        finally:
+            tracing.uninstrument_classes()
+            _db.session.remove()
+            _db.drop_all()
+
+
+def _login(client):
+    client.post('/api/v1/auth/register', json={
+        'username': 'alice', 'email': 'alice@example.com', 'password': 'TestPass123!'
+    })
+    data = client.post('/api/v1/auth/login', json={
+        'username': 'alice', 'password': 'TestPass123!'
+    }).get_json()['data']
+    return {'Authorization': f"Bearer {data['access_token']}"}
+
+
+@pytest.mark.unit
+class TestTracing:
+    """src.utils.tracing"""
+
+    def test_call_tree_and_propagation(self, traced):
+        client, exporter = traced
+        headers = _login(client)
+        exporter.clear()
+
+        response = client.get('/api/v1/projects', headers={
+            **headers, 'traceparent': f'00-{TRACE_ID}-00f067aa0ba902b7-01'
+        })
+        assert response.status_code == 200
+        assert response.headers['X-Trace-Id'] == TRACE_ID
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        server = spans['GET /api/v1/projects']
+        service = spans['ProjectService.get_user_projects']
+        repository = spans['ProjectRepository.get_user_projects']
+        select = spans['SELECT']
+        assert server.context.trace_id == int(TRACE_ID, 16)
+        assert server.attributes['http.response.status_code'] == 200
+        assert service.parent.span_id == server.context.span_id
+        assert repository.parent.span_id == service.context.span_id
+        assert any(s.name == 'SELECT' and s.parent.span_id == repository.context.span_id
+                   for s in exporter.get_finished_spans())
+        assert select.attributes['db.system'] == 'sqlite'
+
+    def test_unsampled_parent_records_nothing(self, traced):
+        client, exporter = traced
+        headers = _login(client)
+        exporter.clear()
+        response = client.get('/api/v1/projects', headers={
+            **headers, 'traceparent': f'00-{TRACE_ID}-00f067aa0ba902b7-00'
+        })
+        assert response.status_code == 200
+        assert exporter.get_finished_spans() == ()
+
+    def test_uninstrument_restores_methods(self, traced):
+        assert getattr(ProjectService.get_user_projects, '__traced__', False)
+        tracing.uninstrument_classes()
+        assert not getattr(ProjectService.get_user_projects, '__traced__', False)
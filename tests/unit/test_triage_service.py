@@ -0,0 +1,120 @@
+"""Unit tests for background triage of new issues."""
+
+import pytest
+from src.services import IssueService, ProjectService, TriageService
+from src.services import triage_service
+from src.services.suggest_service import SuggestService
+from src.services.triage_service import meets_confidence
+
+
+@pytest.fixture
+def fake_suggest(monkeypatch):
+    """Replace the LLM call with a fixed suggestion."""
+    suggestion = {'priority': 'critical', 'status': 'open', 'confidence': 'high', 'reason': 'stub'}
+
+    def suggest(self, title, description=None):
+        return dict(suggestion), None
+
+    monkeypatch.setattr(SuggestService, 'suggest', suggest)
+    return suggestion
+
+
+@pytest.fixture
+def captured_futures(monkeypatch):
+    """Record futures returned by TriageService.enqueue."""
+    futures = []
+    original = TriageService.enqueue
+
+    def enqueue(self, issue_id, expected_priority=None):
+        future = original(self, issue_id, expected_priority)
+        futures.append(future)
+        return future
+
+    monkeypatch.setattr(TriageService, 'enqueue', enqueue)
+    return futures
+
+
+def _create_project(user, **kwargs):
+    project, _ = ProjectService().create_project(name='Triage', owner_id=user.id, **kwargs)
+    return project
+
+
+@pytest.mark.unit
+class TestMeetsConfidence:
+    """triage_service.meets_confidence"""
+
+    def test_threshold(self):
+        assert meets_confidence('high', 'medium') is True
+        assert meets_confidence('medium', 'medium') is True
+        assert meets_confidence('low', 'medium') is False
+
+    def test_no_threshold_never_applies(self):
+        assert meets_confidence('high', None) is False
+
+
+@pytest.mark.unit
+class TestTriageService:
+    """TriageService"""
+
+    def test_triage_stores_suggestion_without_applying(self, db, sample_issue, fake_suggest):
+        issue, error = TriageService().triage_issue(sample_issue.id)
+        assert error is None
+        assert issue.suggested_priority == 'critical'
+        assert issue.suggestion_confidence == 'high'
+        assert issue.priority == 'medium'
+
+    def test_triage_applies_above_threshold(self, db, sample_user, fake_suggest):
+        project = _create_project(sample_user, auto_triage_min_confidence='medium')
+        created, _ = IssueService().create_issue(project.id, 'Outage', sample_user.id)
+        issue, error = TriageService().triage_issue(created.id, expected_priority='medium')
+        assert error is None
+        assert issue.priority == 'critical'
+
+    def test_priority_edited_while_queued_is_kept(self, db, sample_user, fake_suggest):
+        project = _create_project(sample_user, auto_triage_min_confidence='medium')
+        created, _ = IssueService().create_issue(project.id, 'Outage', sample_user.id)
+        IssueService().update_issue(created.id, sample_user.id, priority='low')
+
+        issue, error = TriageService().triage_issue(created.id, expected_priority='medium')
+
+        assert error is None
+        assert issue.priority == 'low'
+        assert issue.suggested_priority == 'critical'
+
+    def test_reporter_priority_not_replaced(self, db, sample_user, fake_suggest, captured_futures):
+        project = _create_project(sample_user, auto_triage=True, auto_triage_min_confidence='low')
+        explicit, _ = IssueService().create_issue(project.id, 'Typo', sample_user.id, priority='low')
+        default, _ = IssueService().create_issue(project.id, 'Outage', sample_user.id)
+        for future in captured_futures:
+            assert future.result(timeout=5)[1] is None
+
+        db.session.expire_all()
+        assert db.session.get(type(explicit), explicit.id).priority == 'low'
+        assert db.session.get(type(default), default.id).priority == 'critical'
+
+    def test_triage_error_leaves_issue_untouched(self, db, sample_issue, monkeypatch):
+        monkeypatch.setattr(SuggestService, 'suggest', lambda self, title, description=None: ({}, 'down'))
+        issue, error = TriageService().triage_issue(sample_issue.id)
+        assert issue is None
+        assert error == 'down'
+
+    def test_create_issue_enqueues_when_enabled(self, db, sample_user, fake_suggest, captured_futures):
+        project = _create_project(sample_user, auto_triage=True)
+        issue, error = IssueService().create_issue(project.id, 'Outage', sample_user.id)
+        assert error is None
+        assert issue.suggested_priority is None
+        assert len(captured_futures) == 1
+
+        triaged, triage_error = captured_futures[0].result(timeout=5)
+        assert triage_error is None
+        db.session.expire_all()
+        assert db.session.get(type(issue), issue.id).suggested_priority == 'critical'
+
+    def test_create_issue_skips_when_disabled(self, db, sample_project, sample_user, captured_futures):
+        IssueService().create_issue(sample_project.id, 'Quiet', sample_user.id)
+        assert captured_futures == []
+
+    def test_executor_recreated_after_fork(self, monkeypatch):
+        executor = triage_service._get_executor()
+        monkeypatch.setattr(triage_service, '_executor_pid', -1)
+        assert triage_service._get_executor() is not executor
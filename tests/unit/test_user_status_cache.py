@@ -0,0 +1,80 @@
+"""Unit tests for the user status cache and the refresh path."""
+
+import pytest
+from sqlalchemy import event
+from src.repositories import UserRepository
+from src.repositories.user_repository import UserStatus, UserStatusCache, user_status_cache
+from src.services import AuthService
+
+
+@pytest.fixture
+def sql_statements(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _identity(user):
+    return {'user_id': user.id, 'username': user.username, 'role': user.role}
+
+
+@pytest.mark.unit
+class TestUserStatusCache:
+    """src.repositories.user_repository.UserStatusCache"""
+
+    def test_status_is_narrow_and_cached(self, app, db, sample_user, sql_statements):
+        user_status_cache.clear()
+        sql_statements.clear()
+        status = UserRepository().get_status(sample_user.id)
+        assert status.is_active is True and status.role == 'developer'
+        assert len(sql_statements) == 1
+        assert 'password_hash' not in sql_statements[0]
+
+        assert UserRepository().get_status(sample_user.id) == status
+        assert len(sql_statements) == 1
+
+    def test_update_invalidates(self, app, db, sample_user):
+        repo = UserRepository()
+        assert repo.get_status(sample_user.id).is_active is True
+        repo.update(sample_user.id, is_active=False)
+        assert repo.get_status(sample_user.id).is_active is False
+
+    def test_lru_and_ttl(self):
+        cache = UserStatusCache(ttl=30, max_size=1)
+        cache.put(UserStatus(1, True, 'developer', None))
+        cache.put(UserStatus(2, True, 'developer', None))
+        assert cache.get(1) is None
+        assert cache.get(2) is not None
+
+        disabled = UserStatusCache(ttl=0)
+        disabled.put(UserStatus(1, True, 'developer', None))
+        assert disabled.get(1) is None
+
+
+@pytest.mark.unit
+class TestRefreshStatus:
+    """AuthService.refresh with the status cache"""
+
+    def test_refresh_rejects_deactivated_user(self, app, db, sample_user):
+        service = AuthService()
+        identity = _identity(sample_user)
+        with app.test_request_context():
+            assert service.refresh(identity)[1] is None
+            service.deactivate_user(sample_user.id)
+            result, error = service.refresh(identity)
+        assert result is None
+        assert error == "Account is disabled"
+
+    def test_refresh_skips_full_user_load(self, app, db, sample_user, sql_statements):
+        identity = _identity(sample_user)
+        with app.test_request_context():
+            AuthService().refresh(identity)
+            sql_statements.clear()
+            result, error = AuthService().refresh(identity)
+        assert error is None and 'access_token' in result
+        assert sql_statements == []